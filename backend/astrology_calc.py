@@ -4,31 +4,169 @@ Astrology calculation CLI script.
 
 Accepts birth data (name, date, time, latitude, longitude, timezone) via command-line
 arguments and generates an astrological birth chart using Kerykeion in offline mode.
+
+Also importable as a library: natal(), transits(), timeline(), progressions() and
+solar_arcs() return the same JSON dicts the CLI prints, without printing.
 """
 
 import argparse
+import calendar
+import csv
 import sys
 import os
 import json
+import math
+import mmap
+import re
+import time
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
-from collections import defaultdict
-
-from kerykeion import AstrologicalSubjectFactory, NatalAspects, KerykeionException
-from kerykeion.charts.chart_drawer import ChartDrawer
-from kerykeion.aspects.aspects_factory import AspectsFactory
-from kerykeion.house_comparison.house_comparison_factory import HouseComparisonFactory
-from kerykeion.schemas.kr_models import ActiveAspect
-from kerykeion.ephemeris_data_factory import EphemerisDataFactory
-from kerykeion.transits_time_range_factory import TransitsTimeRangeFactory
+from functools import lru_cache
+from contextlib import ExitStack, contextmanager
+from bisect import bisect_left, bisect_right
+from array import array
+from importlib.util import find_spec
+
+# Kerykeion (its package __init__ loads the whole pydantic/chart stack, ~0.5 s),
+# slugify, concurrent.futures, hashlib and importlib.metadata are imported inside the
+# functions that use them, so modes that never build a subject (--list,
+# --solar-arcs, --timeline) start without them (see --startup-benchmark)
 import swisseph as swe
-import kerykeion
-from slugify import slugify
+import pytz
+
 
+# Timeline target marker for natal house cusps (house ingresses, see --houses)
+HOUSE_INGRESS = 'house_ingress'
 
 # Profile storage directory
 CHARTS_DIR = Path("~/.natal-charts").expanduser()
 
+# Persisted natal model (sibling of chart.json, not loaded into chat context)
+# Bump NATAL_MODEL_VERSION whenever build_natal_model() changes shape
+NATAL_MODEL_FILENAME = "natal_model.json"
+NATAL_MODEL_VERSION = 1
+
+# chart.svg rendering: SVG_KEY_FILENAME (sibling of chart.svg) records the
+# svg_render_key() it was drawn for, so unchanged charts skip the render;
+# --svg=defer queues renders in SVG_QUEUE_DIR/{slug}.json for --render-pending.
+# Bump SVG_RENDER_VERSION whenever render_chart_svg() output changes
+SVG_MODES = ('sync', 'defer', 'off')
+SVG_KEY_FILENAME = "chart.svg.key"
+SVG_QUEUE_DIR = CHARTS_DIR / ".svg-queue"
+SVG_RENDER_VERSION = 1
+
+# Read-through cache of predictive results: CHARTS_DIR/.cache/{slug}/{mode}-{key}.json,
+# keyed by snapshot_cache_key(); each lookup appends "{mode} hit|miss" to the
+# stats log read by --cache-stats. Once the log passes SNAPSHOT_CACHE_STATS_MAX_BYTES
+# it is compacted to per-mode counters and prune_snapshot_cache() evicts stale
+# entries, then the oldest beyond SNAPSHOT_CACHE_MAX_BYTES. Bump
+# SNAPSHOT_CACHE_VERSION to drop every entry
+SNAPSHOT_CACHE_DIR = CHARTS_DIR / ".cache"
+SNAPSHOT_CACHE_STATS = SNAPSHOT_CACHE_DIR / "stats.log"
+SNAPSHOT_CACHE_STATS_MAX_BYTES = 64 * 1024
+SNAPSHOT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+SNAPSHOT_CACHE_DATED_RE = re.compile(r'-(\d{4}-\d{2}-\d{2})-[0-9a-f]{32}\.json$')
+SNAPSHOT_CACHE_VERSION = 1
+
+# SQLite index of profile summaries for --list and profile search (a cache of
+# chart.json; bump PROFILE_INDEX_VERSION whenever its schema changes). Kept in
+# its own directory so SQLite's journal files stay out of CHARTS_DIR's listing
+PROFILE_INDEX_PATH = CHARTS_DIR / ".index" / "profiles.sqlite"
+PROFILE_INDEX_VERSION = 2
+PROFILE_INDEX_COLUMNS = (
+    'slug', 'name', 'name_key', 'birth_date', 'birth_time', 'city', 'nation',
+    'latitude', 'longitude', 'timezone', 'sun_sign', 'moon_sign', 'asc_sign',
+    'has_chart', 'has_svg', 'chart_mtime_ns', 'chart_size',
+)
+
+# Optional SQLite store for profiles and snapshots (--store sqlite, or
+# NATAL_CHARTS_STORE=sqlite); the default 'files' backend keeps the
+# CHARTS_DIR/{slug}/*.json layout, which --store-import / --store-export convert
+STORE_BACKENDS = ('files', 'sqlite')
+STORE_PATH = CHARTS_DIR / ".store" / "charts.sqlite"
+STORE_VERSION = 2
+
+# Store snapshot archive: runs keyed by slug and timestamp, gzip payloads by content hash
+STORE_SNAPSHOT_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS snapshot_runs (
+        slug TEXT NOT NULL,
+        saved_at TEXT NOT NULL,
+        mode TEXT NOT NULL,
+        date TEXT NOT NULL,
+        hash TEXT NOT NULL,
+        calculated_at TEXT,
+        size INTEGER NOT NULL,
+        PRIMARY KEY (slug, saved_at, mode)
+    );
+    CREATE INDEX IF NOT EXISTS snapshot_runs_mode_date ON snapshot_runs (mode, date);
+    CREATE INDEX IF NOT EXISTS snapshot_runs_hash ON snapshot_runs (hash);
+    CREATE TABLE IF NOT EXISTS snapshot_blobs (hash TEXT PRIMARY KEY, data BLOB NOT NULL);
+"""
+
+# Local geocoding for --city/--nation: every GeoNames lookup is remembered
+# (source 'geonames', keyed by the query as typed) and --load-gazetteer imports a
+# bulk place file (source 'gazetteer'); place_names maps normalized names
+# (place_key()) to places for exact, prefix and fuzzy lookups
+GEOCODE_MODES = ('auto', 'offline', 'online')
+GEOCODE_DB_PATH = CHARTS_DIR / ".geocode" / "places.sqlite"
+GEOCODE_DB_VERSION = 1
+GEOCODE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS places (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        nation TEXT NOT NULL,
+        latitude REAL NOT NULL,
+        longitude REAL NOT NULL,
+        timezone TEXT NOT NULL,
+        population INTEGER,
+        source TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS places_source ON places (source);
+    CREATE TABLE IF NOT EXISTS place_names (
+        name_key TEXT NOT NULL,
+        nation TEXT NOT NULL,
+        place_id INTEGER NOT NULL,
+        PRIMARY KEY (nation, name_key, place_id)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS place_names_key ON place_names (name_key);
+"""
+# Gazetteer CSV columns (a header row is required; population is optional).
+# GeoNames dumps (cities15000.txt etc., optionally zipped) load as-is
+GAZETTEER_FIELDS = ['name', 'nation', 'lat', 'lng', 'tz']
+GEONAMES_DUMP_COLUMNS = 19
+# Minimum difflib similarity for fuzzy --find-place matches
+PLACE_FUZZY_CUTOFF = 0.75
+
+# Geocoding database connection per process id
+_GEOCODE_CONNECTIONS = {}
+
+# Selected backend and the store connection per process id
+_STORE_STATE = {'backend': os.environ.get('NATAL_CHARTS_STORE', 'files'), 'connections': {}}
+
+# Snapshot archive (--save): CHARTS_DIR/{slug}/snapshots/ holds gzip payloads named
+# by content hash (objects/{hash}.json.gz) and an append-only run log (runs.jsonl),
+# so identical reruns share one payload and every run keeps its saved_at timestamp.
+# Retention: runs from the last keep_days are kept, older ones thinned to the newest
+# keep_per_date per mode and date, and keep_runs (0 = unlimited) caps the total;
+# overridden by --keep-days/--keep-per-date/--keep-runs or the environment
+SNAPSHOT_ARCHIVE_DIRNAME = "snapshots"
+SNAPSHOT_RETENTION_DEFAULTS = {'keep_days': 30, 'keep_per_date': 1, 'keep_runs': 0}
+SNAPSHOT_RETENTION_ENV = {
+    'keep_days': 'NATAL_CHARTS_KEEP_DAYS',
+    'keep_per_date': 'NATAL_CHARTS_KEEP_PER_DATE',
+    'keep_runs': 'NATAL_CHARTS_KEEP_RUNS',
+}
+
+# Pre-archive snapshot file names: {mode}-{YYYY-MM-DD}.json (modes may contain
+# hyphens); --compact-snapshots folds them into the archive
+SNAPSHOT_FILENAME_RE = re.compile(r'^(.+)-(\d{4}-\d{2}-\d{2}|unknown)\.json$')
+
+# Loaded profiles by slug: (chart.json (mtime_ns, size), subject or None, profile dict)
+_PROFILE_CACHE = {}
+
+# Cold runs per mode for --startup-benchmark (median reported)
+STARTUP_BENCHMARK_RUNS = 5
+
 
 # Essential dignities lookup table for traditional planets (Sun through Saturn)
 # Uses 3-letter sign abbreviations matching Kerykeion output format
@@ -44,7 +182,7 @@ DIGNITIES = {
 
 # Major fixed stars for conjunction detection
 # 13 historically significant stars (magnitude 1-2, used in classical astrology)
-# Names must be lowercase for Swiss Ephemeris fixstar2_ut
+# Lookup names are the lowercased sefstars.txt traditional names
 MAJOR_STARS = [
     ('aldebaran', 'Aldebaran'),    # Eye of the Bull, ~9 Gem
     ('rigel', 'Rigel'),            # Foot of Orion, ~16 Gem
@@ -61,6 +199,25 @@ MAJOR_STARS = [
     ('algol', 'Algol'),            # Demon Star, ~26 Tau
 ]
 
+# Fixed-star conjunction orb (degrees)
+FIXED_STAR_ORB = 1.0
+
+# Swiss Ephemeris star catalog bundled in Kerykeion's sweph directory (--stars all)
+STAR_CATALOG_FILENAME = "sefstars.txt"
+
+# Persisted star table: catalog entries plus ecliptic longitudes at century anchors
+STAR_TABLE_VERSION = 1
+STAR_TABLE_SPAN_YEARS = 100
+
+# Worst-case error (degrees, at the ecliptic) of interpolating a star's apparent
+# longitude between anchors (nutation and aberration are not linear); a star's
+# tolerance is this divided by cos(ecliptic latitude)
+STAR_TABLE_TOLERANCE = 0.03
+
+# Stars whose tolerance exceeds this (within ~2 deg of the ecliptic poles) skip the
+# longitude index and are always calculated exactly
+STAR_TABLE_MAX_TOLERANCE = 1.0
+
 # Element mapping for zodiac signs
 # Keys match Kerykeion's sign format (3-letter abbreviations)
 ELEMENT_MAP = {
@@ -80,11 +237,11 @@ MODALITY_MAP = {
 
 # Default orbs for transit-to-natal aspects (tighter than natal-only orbs)
 TRANSIT_DEFAULT_ORBS = [
-    ActiveAspect(name='conjunction', orb=3),
-    ActiveAspect(name='opposition', orb=3),
-    ActiveAspect(name='trine', orb=2),
-    ActiveAspect(name='square', orb=2),
-    ActiveAspect(name='sextile', orb=1),
+    {'name': 'conjunction', 'orb': 3},
+    {'name': 'opposition', 'orb': 3},
+    {'name': 'trine', 'orb': 2},
+    {'name': 'square', 'orb': 2},
+    {'name': 'sextile', 'orb': 1},
 ]
 
 # Major planets used in transit calculations
@@ -93,19 +250,59 @@ MAJOR_PLANETS = [
     'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto'
 ]
 
+# Swiss Ephemeris body IDs for MAJOR_PLANETS (direct swe.calc_ut calculations)
+SWE_PLANET_IDS = {
+    'Sun': swe.SUN, 'Moon': swe.MOON, 'Mercury': swe.MERCURY, 'Venus': swe.VENUS,
+    'Mars': swe.MARS, 'Jupiter': swe.JUPITER, 'Saturn': swe.SATURN,
+    'Uranus': swe.URANUS, 'Neptune': swe.NEPTUNE, 'Pluto': swe.PLUTO,
+}
+
+# Calculation flags matching Kerykeion's default (apparent geocentric, tropical)
+SWE_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+# Row spacing (days) of ephemeris tables. With longitude and speed at both ends
+# of a row, a cubic Hermite interpolant reproduces even the Moon to well under
+# an arcsecond, so exact hits are solved from the table without more swe calls.
+EPHEMERIS_TABLE_STEP_DAYS = 1.0
+
+# Values stored per planet per row in an ephemeris table: longitude, speed
+EPHEMERIS_TABLE_FIELDS = 2
+
+# Shared on-disk daily ephemeris (MAJOR_PLANETS, 0h UT rows) covering the
+# valid_query_date range, memory-mapped by every process that needs it.
+# Bump EPHEMERIS_CACHE_VERSION whenever the file layout changes.
+EPHEMERIS_CACHE_DIR = CHARTS_DIR / ".ephemeris"
+EPHEMERIS_CACHE_VERSION = 1
+EPHEMERIS_CACHE_MAGIC = b"NATALEPH"
+EPHEMERIS_CACHE_HEADER_SIZE = 512
+EPHEMERIS_CACHE_FIRST_YEAR = 1900
+EPHEMERIS_CACHE_LAST_YEAR = 2100
+
+# Solver tolerance for exact hit times (days): ~1 second
+EXACT_HIT_TOLERANCE_DAYS = 1e-5
+
+# Timeline window (days): long ranges are solved and streamed one window at a time
+TIMELINE_CHUNK_DAYS = 366
+
 # Default orbs for progressed-to-natal aspects (1-degree orb for all aspects)
 # Standard for secondary progressions per Kepler College recommendation
 PROG_DEFAULT_ORBS = [
-    ActiveAspect(name='conjunction', orb=1),
-    ActiveAspect(name='opposition', orb=1),
-    ActiveAspect(name='trine', orb=1),
-    ActiveAspect(name='square', orb=1),
-    ActiveAspect(name='sextile', orb=1),
+    {'name': 'conjunction', 'orb': 1},
+    {'name': 'opposition', 'orb': 1},
+    {'name': 'trine', 'orb': 1},
+    {'name': 'square', 'orb': 1},
+    {'name': 'sextile', 'orb': 1},
 ]
 
+# --prog-range step lengths in days of life (one step = one Julian year or twelfth of one)
+PROG_SERIES_STEP_DAYS = {
+    'year': 365.25,
+    'month': 365.25 / 12,
+}
+
 # Default orbs for solar arc directed-to-natal aspects (1-degree for all aspects)
 # Professional standard: 1 degree = approx. 1-year timing window (Noel Tyl)
-# Plain dict (not ActiveAspect list) — aspects are computed manually, no AspectsFactory
+# Plain {aspect: orb} dict — converted to {'name', 'orb'} entries in build_sarc_aspects()
 SARC_DEFAULT_ORBS = {
     'conjunction': 1.0,
     'opposition': 1.0,
@@ -127,6 +324,67 @@ SARC_ASPECT_ANGLES = {
     'sextile': 60,
 }
 
+# Exact angle of every aspect type the aspect engine accepts (Kerykeion aspect names)
+ASPECT_ANGLES = {
+    'conjunction': 0,
+    'semi-sextile': 30,
+    'semi-square': 45,
+    'sextile': 60,
+    'quintile': 72,
+    'square': 90,
+    'trine': 120,
+    'sesquiquadrate': 135,
+    'biquintile': 144,
+    'quincunx': 150,
+    'opposition': 180,
+}
+
+# Chart axes: an aspect between two axes has no meaningful movement (always Static)
+AXIS_POINTS = {'ASC', 'MC', 'DSC', 'IC', 'Ascendant', 'Medium_Coeli', 'Descendant', 'Imum_Coeli'}
+
+# Point pairs that are always opposite by construction; never aspected within one chart
+OPPOSITE_POINT_PAIRS = {
+    frozenset(('ASC', 'DSC')), frozenset(('MC', 'IC')),
+    frozenset(('Ascendant', 'Descendant')), frozenset(('Medium_Coeli', 'Imum_Coeli')),
+    frozenset(('True_North_Lunar_Node', 'True_South_Lunar_Node')),
+    frozenset(('Mean_North_Lunar_Node', 'Mean_South_Lunar_Node')),
+}
+
+# Natal (single chart) aspect orbs, as in Kerykeion's defaults
+NATAL_DEFAULT_ORBS = [
+    {'name': 'conjunction', 'orb': 10},
+    {'name': 'opposition', 'orb': 10},
+    {'name': 'trine', 'orb': 8},
+    {'name': 'sextile', 'orb': 6},
+    {'name': 'square', 'orb': 5},
+]
+
+# Points calculated for natal profiles (planets, asteroids, lunar node, angles)
+NATAL_ACTIVE_POINTS = [
+    'Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn',
+    'Uranus', 'Neptune', 'Pluto', 'Chiron', 'Mean_Lilith', 'True_Lilith',
+    'Ceres', 'Pallas', 'Juno', 'Vesta', 'Mean_North_Lunar_Node',
+    'Ascendant', 'Medium_Coeli', 'Descendant', 'Imum_Coeli',
+]
+
+# House cusp attribute names on AstrologicalSubjectModel, in house order (1-12)
+HOUSE_ATTRS = [
+    'first_house', 'second_house', 'third_house', 'fourth_house',
+    'fifth_house', 'sixth_house', 'seventh_house', 'eighth_house',
+    'ninth_house', 'tenth_house', 'eleventh_house', 'twelfth_house',
+]
+
+# Asteroids and lunar points reported in natal charts: (display name, subject attribute)
+ASTEROID_ATTRS = [
+    ('Chiron', 'chiron'),
+    ('Mean Lilith', 'mean_lilith'),
+    ('True Lilith', 'true_lilith'),
+    ('Ceres', 'ceres'),
+    ('Pallas', 'pallas'),
+    ('Juno', 'juno'),
+    ('Vesta', 'vesta'),
+]
+
 # Sign offsets for reconstructing house cusp abs_positions from chart.json
 # House entries have sign + degree but NO abs_position key
 # Planets and angles DO have abs_position directly
@@ -137,6 +395,261 @@ SIGN_OFFSETS = {
 }
 
 
+# Full sign names, in SIGN_OFFSETS order
+SIGN_NAMES = [
+    'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
+    'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces',
+]
+
+
+def _record_timing(timings, section, started):
+    """
+    Record elapsed seconds for a section and return a fresh start timestamp.
+
+    Args:
+        timings: dict to record into (section name -> seconds)
+        section: Section name
+        started: time.perf_counter() value when the section began
+
+    Returns:
+        float: time.perf_counter() value to use as the next section's start
+    """
+    now = time.perf_counter()
+    timings[section] = timings.get(section, 0.0) + (now - started)
+    return now
+
+
+@lru_cache(maxsize=None)
+def sweph_dir():
+    """
+    Return Kerykeion's bundled sweph directory without importing kerykeion.
+
+    Returns:
+        Path: .../site-packages/kerykeion/sweph
+    """
+    return Path(find_spec('kerykeion').origin).parent / 'sweph'
+
+
+@lru_cache(maxsize=None)
+def ensure_ephemeris_path():
+    """
+    Point Swiss Ephemeris at Kerykeion's bundled sweph directory (once per process).
+
+    Kerykeion sets this path whenever it builds a subject; code that calls
+    swe.calc_ut / swe.fixstar2_ut directly must call this first, or Swiss
+    Ephemeris silently falls back to the lower-precision Moshier model.
+    """
+    swe.set_ephe_path(str(sweph_dir()))
+
+
+def wrap_degrees(angle):
+    """
+    Wrap an angle in degrees into the signed range [-180, 180).
+
+    Args:
+        angle: Angle in degrees
+
+    Returns:
+        float: Equivalent angle in [-180, 180)
+    """
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+def jd_to_utc_datetime(jd_ut):
+    """
+    Convert a UT Julian Day to a naive UTC datetime, rounded to the second.
+
+    Args:
+        jd_ut: Julian Day number (UT)
+
+    Returns:
+        datetime
+    """
+    y, m, d, h = swe.revjul(jd_ut)
+    dt = datetime(int(y), int(m), int(d)) + timedelta(seconds=round(h * 3600))
+    return dt
+
+
+def aspect_movement(lon1, lon2, angle, speed1, speed2=0.0):
+    """
+    Classify an aspect as Applying, Separating or Static.
+
+    Same lookahead rule as Kerykeion: project both points 0.001 day ahead and
+    compare the orbs.
+
+    Args:
+        lon1: Longitude of the first point (0-360)
+        lon2: Longitude of the second point (0-360)
+        angle: Exact aspect angle (0-180)
+        speed1: Speed of the first point in degrees/day
+        speed2: Speed of the second point in degrees/day (0 for a fixed chart)
+
+    Returns:
+        str: 'Applying', 'Separating' or 'Static'
+    """
+    if abs(speed1 - speed2) < 1e-9:
+        return 'Static'
+    current_orb = abs(abs(swe.difdeg2n(lon1, lon2)) - angle)
+    future_orb = abs(abs(swe.difdeg2n((lon1 + speed1 * 0.001) % 360.0, (lon2 + speed2 * 0.001) % 360.0)) - angle)
+    if abs(future_orb - current_orb) < 1e-6:
+        return 'Static'
+    return 'Applying' if future_orb < current_orb else 'Separating'
+
+
+def find_aspects(first, second=None, orbs=None, second_fixed=False, skip_same_name=False):
+    """
+    Find every aspect between two sets of points (or within one set).
+
+    The one aspect engine behind natal, transit, progressed and directed charts.
+    The second set is sorted by longitude once; each first point then bisects
+    the orb window around each aspect target, so adding asteroids, nodes, angles
+    or house cusps only adds a few bisects. Each pair takes the first aspect (by
+    angle) whose orb band contains its separation, and movement follows
+    aspect_movement(); both rules match Kerykeion's AspectsFactory.
+
+    Args:
+        first: dict of {name: (longitude, speed)} in output order
+        second: dict of {name: (longitude, speed)}, or None for aspects within
+                first (each unordered pair once, skipping OPPOSITE_POINT_PAIRS)
+        orbs: List of {'name', 'orb'} dicts (ActiveAspect), defaults to
+              TRANSIT_DEFAULT_ORBS
+        second_fixed: Treat the second set as motionless (e.g. a natal chart)
+        skip_same_name: Skip pairs of points with the same name (e.g. directed Sun
+                        to natal Sun)
+
+    Returns:
+        List[dict]: Matches in (first, second) point order, each with:
+            - p1 (str), p2 (str): Point names
+            - aspect (str): Aspect name
+            - angle (float): Exact aspect angle
+            - orb (float): Deviation from exact (unrounded)
+            - movement (str): 'Applying', 'Separating' or 'Static'
+    """
+    if orbs is None:
+        orbs = TRANSIT_DEFAULT_ORBS
+    bands = sorted((ASPECT_ANGLES[ao['name']], ao['name'], ao['orb']) for ao in orbs)
+    same_chart = second is None
+    first_points = list(first.items())
+    second_points = first_points if same_chart else list(second.items())
+
+    by_lon = sorted((lon, j) for j, (_name, (lon, _speed)) in enumerate(second_points))
+    sorted_lons = [lon for lon, _j in by_lon]
+
+    def window(lo, hi):
+        # Indices of second points with longitude in [lo, hi] on the circle
+        if lo < 0:
+            spans = [(lo + 360, 360), (0, hi)]
+        elif hi >= 360:
+            spans = [(lo, 360), (0, hi - 360)]
+        else:
+            spans = [(lo, hi)]
+        return [by_lon[k][1] for span_lo, span_hi in spans
+                for k in range(bisect_left(sorted_lons, span_lo), bisect_right(sorted_lons, span_hi))]
+
+    matches = []
+    for i, (name1, (lon1, speed1)) in enumerate(first_points):
+        candidates = set()
+        for angle, _asp_name, max_orb in bands:
+            for center in {(lon1 + angle) % 360, (lon1 - angle) % 360}:
+                candidates.update(window(center - max_orb - 1e-9, center + max_orb + 1e-9))
+
+        for j in sorted(candidates):
+            if same_chart and j <= i:
+                continue
+            name2, (lon2, speed2) = second_points[j]
+            if skip_same_name and name1 == name2:
+                continue
+            if same_chart and frozenset((name1, name2)) in OPPOSITE_POINT_PAIRS:
+                continue
+            distance = abs(swe.difdeg2n(lon1, lon2))
+            for angle, asp_name, max_orb in bands:
+                if angle - max_orb <= distance <= angle + max_orb:
+                    if name1 in AXIS_POINTS and name2 in AXIS_POINTS:
+                        movement = 'Static'
+                    else:
+                        movement = aspect_movement(lon1, lon2, angle, speed1, 0.0 if second_fixed else speed2)
+                    matches.append({
+                        'p1': name1,
+                        'p2': name2,
+                        'aspect': asp_name,
+                        'angle': angle,
+                        'orb': abs(distance - angle),
+                        'movement': movement,
+                    })
+                    break
+    return matches
+
+
+def subject_points(subject, names):
+    """
+    Collect (longitude, speed) pairs from an AstrologicalSubject for find_aspects().
+
+    Args:
+        subject: AstrologicalSubjectModel
+        names: Point names in output order (e.g. MAJOR_PLANETS)
+
+    Returns:
+        dict: {name: (abs_longitude, speed in degrees/day)}
+    """
+    points = {}
+    for name in names:
+        body = getattr(subject, name.lower())
+        points[name] = (body.abs_pos, getattr(body, 'speed', None) or 0.0)
+    return points
+
+
+def natal_house_cusps(natal_data):
+    """
+    Rebuild the 12 natal house cusp longitudes from chart.json.
+
+    House entries carry sign + degree only; SIGN_OFFSETS turns them back into
+    absolute longitudes.
+
+    Args:
+        natal_data: dict — full parsed chart.json
+
+    Returns:
+        List[float]: Cusp longitudes of houses 1-12
+    """
+    houses = sorted(natal_data['houses'], key=lambda house: house['number'])
+    return [SIGN_OFFSETS[house['sign']] + house['degree'] for house in houses]
+
+
+def house_cusp_index(cusps):
+    """
+    Precompute a cusp array for place_in_houses().
+
+    The cusps are rotated to start at the one with the smallest longitude, so
+    the list is ascending and a circular search is one bisect plus a wrap.
+
+    Args:
+        cusps: Cusp longitudes of houses 1-12 (e.g. from natal_house_cusps())
+
+    Returns:
+        tuple: (ascending cusp longitudes in [0, 360), index of the first one's house)
+    """
+    first = min(range(12), key=lambda i: cusps[i] % 360)
+    return [cusps[(first + j) % 12] % 360 for j in range(12)], first
+
+
+def place_in_houses(cusp_index, longitudes):
+    """
+    Place longitudes in houses by circular bisection over the cusps.
+
+    A point on a cusp belongs to the house that cusp opens (same rule as
+    Kerykeion's house comparison).
+
+    Args:
+        cusp_index: tuple from house_cusp_index()
+        longitudes: Iterable of ecliptic longitudes in degrees
+
+    Returns:
+        List[int]: House number (1-12) of each longitude
+    """
+    ordered, first = cusp_index
+    return [(first + bisect_right(ordered, lon % 360) - 1) % 12 + 1 for lon in longitudes]
+
+
 def valid_date(s):
     """
     Validate date string in YYYY-MM-DD format.
@@ -207,6 +720,44 @@ def valid_query_date(s):
         raise argparse.ArgumentTypeError(f"Invalid date format '{s}'. Use YYYY-MM-DD. Error: {e}")
 
 
+def valid_prog_bound(s):
+    """
+    Validate one --prog-range bound: a whole age in years or a YYYY-MM-DD date.
+
+    Args:
+        s: Age or date string to validate
+
+    Returns:
+        tuple: ('age', int) or ('date', datetime)
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is neither a non-negative age nor a valid date
+    """
+    if s.isdigit():
+        return ('age', int(s))
+    return ('date', valid_query_date(s))
+
+
+def valid_sign(s):
+    """
+    Validate a zodiac sign given as a full name or 3-letter abbreviation.
+
+    Args:
+        s: Sign string (case-insensitive, e.g. 'Aries' or 'ari')
+
+    Returns:
+        str: Kerykeion's 3-letter sign abbreviation (e.g. 'Ari')
+
+    Raises:
+        argparse.ArgumentTypeError: If the sign is not recognized
+    """
+    key = s.strip().casefold()
+    for sign, name in zip(SIGN_OFFSETS, SIGN_NAMES):
+        if key in (sign.casefold(), name.casefold()):
+            return sign
+    raise argparse.ArgumentTypeError(f"Invalid sign '{s}'. Use a name or abbreviation, e.g. 'Aries' or 'Ari'")
+
+
 def valid_latitude(s):
     """
     Validate latitude value is within -90 to 90 degrees range.
@@ -251,1472 +802,3837 @@ def valid_longitude(s):
         raise argparse.ArgumentTypeError(f"Invalid longitude '{s}': {e}")
 
 
-def load_natal_profile(slug):
+@lru_cache(maxsize=None)
+def library_versions():
+    """
+    Return the calculation library versions a persisted natal model depends on.
+
+    Cached per process: importlib.metadata lookups cost milliseconds.
+
+    Returns:
+        dict: {'kerykeion': str, 'swisseph': str}
     """
-    Load a saved natal chart profile and reconstruct an AstrologicalSubject.
+    from importlib.metadata import version as package_version, PackageNotFoundError
+
+    try:
+        kerykeion_version = package_version('kerykeion')
+    except PackageNotFoundError:
+        kerykeion_version = 'unknown'
+    return {'kerykeion': kerykeion_version, 'swisseph': swe.version}
+
 
-    Reads chart.json from ~/.natal-charts/{slug}/, extracts birth data, and
-    reconstructs an AstrologicalSubjectModel using offline mode (no GeoNames).
+def birth_fingerprint(meta):
+    """
+    Build the birth-data key a persisted natal model is valid for.
 
     Args:
-        slug: Profile slug (e.g., 'albert-einstein')
+        meta: chart.json meta dict
 
     Returns:
-        tuple: (AstrologicalSubjectModel, profile_dict) where profile_dict is the
-               full parsed chart.json data
+        dict: birth_date, birth_time, latitude, longitude, timezone
+    """
+    location = meta.get('location', {})
+    return {
+        'birth_date': meta.get('birth_date'),
+        'birth_time': meta.get('birth_time'),
+        'latitude': location.get('latitude'),
+        'longitude': location.get('longitude'),
+        'timezone': location.get('timezone'),
+    }
 
-    Raises:
-        FileNotFoundError: If the profile directory or chart.json does not exist
-        SystemExit(1): If chart.json cannot be parsed or required fields are missing
+
+def build_natal_model(subject, meta):
     """
-    profile_dir = CHARTS_DIR / slug
-    chart_json_path = profile_dir / "chart.json"
+    Build the persisted natal model for a profile.
 
-    if not chart_json_path.exists():
-        raise FileNotFoundError(
-            f"Profile '{slug}' not found. Run --list to see available profiles."
-        )
+    Stores everything the predictive modes need from the natal chart so they can
+    deserialize it instead of rebuilding an AstrologicalSubject: longitudes, speeds
+    and declinations of the major planets and angles, the 12 Placidus cusps, ARMC,
+    the UT Julian day, and the full Kerykeion subject dump.
 
-    try:
-        with open(chart_json_path, 'r', encoding='utf-8') as f:
-            profile_data = json.load(f)
-    except (json.JSONDecodeError, OSError) as e:
-        print(f"Error reading profile '{slug}': {e}", file=sys.stderr)
-        sys.exit(1)
+    Args:
+        subject: AstrologicalSubjectModel for the natal chart
+        meta: chart.json meta dict (birth data used as the staleness key)
 
-    try:
-        meta = profile_data['meta']
-        birth_date_str = meta['birth_date']          # e.g. "1879-03-14"
-        birth_time_str = meta['birth_time']          # e.g. "11:30"
-        location = meta['location']
-        lat = float(location['latitude'])
-        lng = float(location['longitude'])
-        tz_str = location['timezone']
-        name = meta['name']
+    Returns:
+        dict: JSON-serializable natal model
+    """
+    jd_ut = subject.julian_day
+    _cusps, ascmc = swe.houses_ex(jd_ut, subject.lat, subject.lng, b'P')
 
-        birth_date = datetime.strptime(birth_date_str, "%Y-%m-%d")
-        birth_time = datetime.strptime(birth_time_str, "%H:%M")
-    except (KeyError, ValueError) as e:
-        print(f"Error parsing profile '{slug}': missing or invalid field — {e}", file=sys.stderr)
-        sys.exit(1)
+    point_attrs = [(name, name.lower()) for name in MAJOR_PLANETS] + [
+        ('ASC', 'ascendant'), ('MC', 'medium_coeli'),
+        ('DSC', 'descendant'), ('IC', 'imum_coeli'),
+    ]
+    points = {}
+    for name, attr in point_attrs:
+        body = getattr(subject, attr)
+        points[name] = {
+            'abs_position': body.abs_pos,
+            'speed': body.speed,
+            'declination': body.declination,
+        }
 
-    subject = AstrologicalSubjectFactory.from_birth_data(
-        name=name,
-        year=birth_date.year,
-        month=birth_date.month,
-        day=birth_date.day,
-        hour=birth_time.hour,
-        minute=birth_time.minute,
-        lat=lat,
-        lng=lng,
-        tz_str=tz_str,
-        online=False,
-        houses_system_identifier='P',
-    )
+    return {
+        'model_version': NATAL_MODEL_VERSION,
+        'library_versions': library_versions(),
+        'birth': birth_fingerprint(meta),
+        'julian_day_ut': jd_ut,
+        'armc': ascmc[2],
+        'house_cusps': [getattr(subject, attr).abs_pos for attr in HOUSE_ATTRS],
+        'points': points,
+        'subject': subject.model_dump(mode='json'),
+    }
 
-    return subject, profile_data
 
+def write_json_atomic(path, data, indent=None):
+    """
+    Write JSON through a per-process temporary file renamed into place.
+
+    Concurrent writers of the same file each rename a complete file, so readers
+    never see a truncated or interleaved one; the last rename wins.
 
-def save_snapshot(profile_dir, mode, date_str, data):
+    Args:
+        path: Destination Path
+        data: JSON-serializable value
+        indent: json.dump indent (None for compact)
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp{os.getpid()}")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def write_natal_model(profile_dir, subject, meta):
     """
-    Write predictive snapshot JSON to the profile directory.
+    Write natal_model.json atomically into the profile directory (or the store).
 
     Args:
         profile_dir: Path — ~/.natal-charts/{slug}/
-        mode:        str  — 'transit', 'progressions', or 'solar-arc'
-        date_str:    str  — YYYY-MM-DD for filename (from meta field)
-        data:        dict — already-assembled JSON dict from build_*_json()
+        subject: AstrologicalSubjectModel for the natal chart
+        meta: chart.json meta dict
 
     Returns:
-        Path: The written file path (for confirmation message)
+        dict: The natal model that was written
     """
-    filename = f"{mode}-{date_str}.json"
-    out_path = profile_dir / filename
-    with open(out_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    return out_path
+    model = build_natal_model(subject, meta)
+    if using_store():
+        conn = open_store()
+        with conn:
+            conn.execute("UPDATE profiles SET natal_model = ? WHERE slug = ?",
+                         (json.dumps(model, ensure_ascii=False), profile_dir.name))
+        return model
+    write_json_atomic(profile_dir / NATAL_MODEL_FILENAME, model)
+    return model
+
+
+def read_natal_model(profile_dir, meta):
+    """
+    Read a profile's persisted natal model if it is current.
 
+    A model is stale when it was written by a different model version or
+    library version, or for different birth data than chart.json now holds.
 
-def build_transit_json(transit_subject, natal_subject, natal_data, query_date_str, slug):
+    Args:
+        profile_dir: Path — ~/.natal-charts/{slug}/
+        meta: chart.json meta dict
+
+    Returns:
+        dict or None: The natal model, or None if missing, unreadable or stale
     """
-    Build a transit snapshot JSON dict from transit and natal AstrologicalSubject instances.
+    try:
+        if using_store():
+            row = open_store().execute("SELECT natal_model FROM profiles WHERE slug = ?",
+                                       (profile_dir.name,)).fetchone()
+            if row is None or row['natal_model'] is None:
+                return None
+            model = json.loads(row['natal_model'])
+        else:
+            with open(profile_dir / NATAL_MODEL_FILENAME, 'r', encoding='utf-8') as f:
+                model = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if (model.get('model_version') != NATAL_MODEL_VERSION
+            or model.get('library_versions') != library_versions()
+            or model.get('birth') != birth_fingerprint(meta)):
+        return None
+    return model
 
-    Calculates transit planet positions, natal house placements for transiting planets,
-    transit-to-natal aspects using TRANSIT_DEFAULT_ORBS, and aspect movement (applying/separating).
+
+def valid_worker_count(s):
+    """
+    Validate a worker-process count for parallel modes.
 
     Args:
-        transit_subject: AstrologicalSubjectModel for the transit moment (UTC)
-        natal_subject: AstrologicalSubjectModel for the natal chart
-        natal_data: dict — full parsed chart.json from the natal profile
-        query_date_str: str — YYYY-MM-DD date used for the transit (for meta)
-        slug: str — natal profile slug (for meta)
+        s: Count string to validate
 
     Returns:
-        dict: Transit snapshot with meta, transit_planets, and transit_aspects sections
+        int worker count (>= 1)
+
+    Raises:
+        argparse.ArgumentTypeError: If the count is not a positive integer
     """
-    natal_meta = natal_data.get('meta', {})
-    natal_name = natal_meta.get('name', slug)
+    try:
+        count = int(s)
+        if count < 1:
+            raise ValueError(f"Worker count must be at least 1, got {count}")
+        return count
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"Invalid worker count '{s}': {e}")
 
-    # Build orbs_used dict for meta (aspect name -> orb)
-    orbs_used = {ao['name']: ao['orb'] for ao in TRANSIT_DEFAULT_ORBS}
 
-    meta = {
-        "natal_name": natal_name,
-        "natal_slug": slug,
-        "query_date": query_date_str,
-        "query_time_utc": "12:00" if transit_subject.hour == 12 and transit_subject.minute == 0 else
-                          f"{transit_subject.hour:02d}:{transit_subject.minute:02d}",
-        "chart_type": "transit_snapshot",
-        "calculated_at": datetime.now(timezone.utc).isoformat(),
-        "orbs_used": orbs_used,
-    }
+def valid_http_address(s):
+    """
+    Validate an --http listen address.
 
-    # Build transit planet position list (10 major planets)
-    planet_attrs = [
-        ('Sun', transit_subject.sun),
-        ('Moon', transit_subject.moon),
-        ('Mercury', transit_subject.mercury),
-        ('Venus', transit_subject.venus),
-        ('Mars', transit_subject.mars),
-        ('Jupiter', transit_subject.jupiter),
-        ('Saturn', transit_subject.saturn),
-        ('Uranus', transit_subject.uranus),
-        ('Neptune', transit_subject.neptune),
-        ('Pluto', transit_subject.pluto),
-    ]
+    Args:
+        s: PORT or HOST:PORT string to validate
 
-    # Compute natal house placement for each transit planet using HouseComparisonFactory
-    # first_subject = transit, second_subject = natal
-    # first_points_in_second_houses = transit planets in natal houses
-    house_comparison = HouseComparisonFactory(
-        transit_subject, natal_subject, active_points=MAJOR_PLANETS
-    ).get_house_comparison()
-
-    # Build a lookup: point_name -> projected_house_number
-    house_lookup = {
-        item.point_name: item.projected_house_number
-        for item in house_comparison.first_points_in_second_houses
-    }
+    Returns:
+        tuple: (host, port), host defaulting to HTTP_DEFAULT_HOST
 
-    transit_planets = []
-    for name, planet in planet_attrs:
-        natal_house = house_lookup.get(name)
-        transit_planets.append({
-            "name": name,
-            "sign": planet.sign,
-            "degree": round(planet.abs_pos % 30, 2),
-            "abs_position": round(planet.abs_pos, 4),
-            "retrograde": bool(planet.retrograde),
-            "natal_house": natal_house,
-        })
+    Raises:
+        argparse.ArgumentTypeError: If the port is not an integer in 0-65535
+    """
+    host, _sep, port = s.rpartition(':')
+    try:
+        port = int(port)
+        if not 0 <= port <= 65535:
+            raise ValueError(f"Port must be between 0 and 65535, got {port}")
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"Invalid address '{s}': {e}")
+    return (host.strip('[]') or HTTP_DEFAULT_HOST, port)
 
-    # Calculate transit-to-natal aspects using AspectsFactory.dual_chart_aspects
-    # first_subject = transit (moving), second_subject = natal (fixed)
-    dual_aspects_model = AspectsFactory.dual_chart_aspects(
-        transit_subject,
-        natal_subject,
-        active_points=MAJOR_PLANETS,
-        active_aspects=TRANSIT_DEFAULT_ORBS,
-        second_subject_is_fixed=True,
-    )
 
-    transit_aspects = []
-    for asp in dual_aspects_model.aspects:
-        # Only include aspects where p1 is a transit planet and p2 is a natal planet
-        if asp.p1_name in MAJOR_PLANETS and asp.p2_name in MAJOR_PLANETS:
-            transit_aspects.append({
-                "transit_planet": asp.p1_name,
-                "natal_planet": asp.p2_name,
-                "aspect": asp.aspect,
-                "orb": round(asp.orbit, 2),
-                "applying": asp.aspect_movement == 'Applying',
-                "movement": asp.aspect_movement,
-            })
+def valid_retention_count(s):
+    """
+    Validate a snapshot retention setting (--keep-days, --keep-per-date, --keep-runs).
 
-    return {
-        "meta": meta,
-        "transit_planets": transit_planets,
-        "transit_aspects": transit_aspects,
-    }
+    Args:
+        s: Count string to validate
+
+    Returns:
+        int count (>= 0)
+
+    Raises:
+        argparse.ArgumentTypeError: If the count is not a non-negative integer
+    """
+    try:
+        count = int(s)
+        if count < 0:
+            raise ValueError(f"Count must not be negative, got {count}")
+        return count
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"Invalid retention count '{s}': {e}")
 
 
-def calculate_transits(args):
+def load_natal_profile(slug, build_subject=True):
     """
-    Orchestrate transit snapshot calculation for an existing natal profile.
+    Load a saved natal chart profile and its AstrologicalSubject.
 
-    Loads the natal profile identified by args.transits, creates a transit subject
-    for the requested date (args.query_date, or current UTC if not specified),
-    and prints the transit JSON to stdout.
+    Reads chart.json from ~/.natal-charts/{slug}/ and deserializes the subject from
+    the persisted natal model. The subject is only recomputed (offline mode, no
+    GeoNames) when natal_model.json is missing or stale; the refreshed model is
+    then written back so the next load is a plain read.
 
     Args:
-        args: Parsed argparse Namespace with .transits (slug) and .query_date (datetime or None)
+        slug: Profile slug (e.g., 'albert-einstein')
+        build_subject: If False, skip the subject entirely (e.g. solar arcs, which
+                       only need chart.json positions) and return None in its place
 
     Returns:
-        0 on success, 1 on error
+        tuple: (AstrologicalSubjectModel or None, profile_dict) where profile_dict
+               is the full parsed chart.json data
+
+    Raises:
+        FileNotFoundError: If the profile directory or chart.json does not exist
+        ValueError: If chart.json cannot be parsed or required fields are missing
     """
-    try:
-        # Load natal chart profile
-        natal_subject, natal_data = load_natal_profile(args.transits)
-
-        # Determine query datetime (UTC)
-        if args.query_date is not None:
-            # Use specified date at UTC noon
-            query_dt = args.query_date.replace(hour=12, minute=0, second=0, microsecond=0)
-            query_date_str = args.query_date.strftime("%Y-%m-%d")
-        else:
-            # Use current UTC moment
-            query_dt = datetime.now(timezone.utc)
-            query_date_str = query_dt.strftime("%Y-%m-%d")
-
-        # Create transit subject at 0,0 UTC (geocentric, no location bias)
-        transit_subject = AstrologicalSubjectFactory.from_birth_data(
-            name='Current Transits',
-            year=query_dt.year,
-            month=query_dt.month,
-            day=query_dt.day,
-            hour=query_dt.hour,
-            minute=query_dt.minute,
-            lat=0.0,
-            lng=0.0,
-            tz_str='UTC',
-            online=False,
-            houses_system_identifier='P',
+    profile_dir = CHARTS_DIR / slug
+    stamp = profile_stamp(slug)
+    if stamp is None:
+        raise FileNotFoundError(
+            f"Profile '{slug}' not found. Run --list to see available profiles."
         )
 
-        # Assemble transit JSON dict
-        transit_dict = build_transit_json(
-            transit_subject, natal_subject, natal_data, query_date_str, args.transits
-        )
+    # Reuse the previous load while chart.json is unchanged (warm --serve workers)
+    cached = _PROFILE_CACHE.get(slug)
+    if cached is not None and cached[0] == stamp:
+        if not build_subject:
+            return None, cached[2]
+        if cached[1] is not None:
+            return cached[1], cached[2]
 
-        # Output to stdout
-        print(json.dumps(transit_dict, indent=2))
+    try:
+        profile_data = read_profile_chart(slug)
+    except (json.JSONDecodeError, OSError) as e:
+        raise ValueError(f"Could not read profile '{slug}': {e}")
 
-        if args.save:
-            date_str = transit_dict['meta'].get('query_date', 'unknown')
-            try:
-                out_path = save_snapshot(CHARTS_DIR / args.transits, 'transit', date_str, transit_dict)
-                print(f"Snapshot saved: {out_path}", file=sys.stderr)
-            except Exception as e:
-                print(f"Warning: Could not save snapshot: {e}", file=sys.stderr)
+    try:
+        meta = profile_data['meta']
+        birth_date_str = meta['birth_date']          # e.g. "1879-03-14"
+        birth_time_str = meta['birth_time']          # e.g. "11:30"
+        location = meta['location']
+        lat = float(location['latitude'])
+        lng = float(location['longitude'])
+        tz_str = location['timezone']
+        name = meta['name']
 
-        return 0
+        birth_date = datetime.strptime(birth_date_str, "%Y-%m-%d")
+        birth_time = datetime.strptime(birth_time_str, "%H:%M")
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"Could not parse profile '{slug}': missing or invalid field — {e}")
 
-    except FileNotFoundError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return 1
-    except Exception as e:
-        print(f"Error calculating transits: {e}", file=sys.stderr)
-        return 1
+    if not build_subject:
+        _PROFILE_CACHE[slug] = (stamp, None, profile_data)
+        return None, profile_data
 
+    from kerykeion import AstrologicalSubjectFactory
+    from kerykeion.schemas.kr_models import AstrologicalSubjectModel
 
-def parse_preset_range(preset, reference_date=None):
+    model = read_natal_model(profile_dir, meta)
+    if model is not None:
+        try:
+            subject = AstrologicalSubjectModel.model_validate(model['subject'])
+            _PROFILE_CACHE[slug] = (stamp, subject, profile_data)
+            return subject, profile_data
+        except (KeyError, ValueError):
+            pass  # Corrupt model — fall through to recomputation
+
+    subject = AstrologicalSubjectFactory.from_birth_data(
+        name=name,
+        year=birth_date.year,
+        month=birth_date.month,
+        day=birth_date.day,
+        hour=birth_time.hour,
+        minute=birth_time.minute,
+        lat=lat,
+        lng=lng,
+        tz_str=tz_str,
+        online=False,
+        houses_system_identifier='P',
+    )
+
+    try:
+        write_natal_model(profile_dir, subject, meta)
+    except OSError as e:
+        print(f"Warning: Could not refresh natal model for '{slug}': {e}", file=sys.stderr)
+
+    _PROFILE_CACHE[slug] = (stamp, subject, profile_data)
+    return subject, profile_data
+
+
+def save_snapshot(profile_dir, mode, date_str, data):
     """
-    Convert preset range string to (start_dt, end_dt) UTC noon datetimes.
+    Archive a predictive snapshot run and enforce the retention policy.
 
     Args:
-        preset: One of 'week', '30d', '3m', 'year'
-        reference_date: datetime to use as 'today' (default: today UTC)
+        profile_dir: Path — ~/.natal-charts/{slug}/
+        mode:        str  — 'transit', 'progressions', or 'solar-arc'
+        date_str:    str  — YYYY-MM-DD from the meta field
+        data:        dict — already-assembled JSON dict from build_*_json()
 
     Returns:
-        Tuple[datetime, datetime]: (start, end) at UTC noon
+        str: Where the run was archived and its timestamp (for the confirmation
+             message; --snapshot SLUG TIMESTAMP reads it back)
     """
-    if reference_date is None:
-        reference_date = datetime.now(timezone.utc).replace(tzinfo=None)
+    slug = profile_dir.name
+    run = archive_snapshot(slug, mode, date_str, data)
+    try:
+        apply_retention(slug)
+    except ValueError as e:
+        print(f"Warning: Snapshot retention not applied: {e}", file=sys.stderr)
+    location = STORE_PATH if using_store() else snapshot_archive_dir(slug)
+    return f"{location} ({mode} {date_str} @ {run['saved_at']})"
 
-    today = reference_date.replace(hour=12, minute=0, second=0, microsecond=0)
 
-    DELTAS = {
-        'week':  timedelta(days=6),
-        '30d':   timedelta(days=29),
-        '3m':    timedelta(days=89),
-        'year':  timedelta(days=364),
-    }
-    if preset not in DELTAS:
-        raise ValueError(f"Invalid preset: {preset}. Use: week, 30d, 3m, year")
+def snapshot_archive_dir(slug):
+    """
+    Return a profile's snapshot archive directory (files backend).
 
-    return today, today + DELTAS[preset]
+    Args:
+        slug: Profile slug
+
+    Returns:
+        Path: CHARTS_DIR/{slug}/snapshots/
+    """
+    return CHARTS_DIR / slug / SNAPSHOT_ARCHIVE_DIRNAME
 
 
-def build_timeline_events(results):
+def pack_snapshot(data):
     """
-    Extract exact transit aspect hit events from TransitsTimeRangeModel.
+    Split a snapshot into its archived payload and per-run fields.
 
-    An 'exact hit' is detected when an aspect's aspect_movement transitions from
-    'Applying' (on day N) to 'Separating' or 'Static' (on day N+1).
-    The hit date is reported as day N (the last day in the Applying state).
-    The orb on day N is the closest recorded approach.
+    meta.calculated_at is the only field that differs between reruns of the
+    same query, so it is kept with the run and nulled in the payload: identical
+    results then hash to one payload.
 
     Args:
-        results: TransitsTimeRangeModel from TransitsTimeRangeFactory.get_transit_moments()
+        data: Snapshot dict from a build_*_json() function
 
     Returns:
-        List[dict]: Sorted list of event dicts, each with:
-            - date (str): YYYY-MM-DD of the exact hit
-            - transit_planet (str): Name of the transiting planet
-            - aspect (str): Aspect type (conjunction, opposition, etc.)
-            - natal_planet (str): Name of the natal planet
-            - orb_at_hit (float): Closest orb recorded (the applying orb on hit date)
+        tuple: (content hash, gzip payload bytes, calculated_at or None,
+                uncompressed payload size in bytes)
     """
-    aspect_tracking = defaultdict(list)
-    for tm in results.transits:
-        date_str = tm.date[:10]  # YYYY-MM-DD from ISO datetime
-        for asp in tm.aspects:
-            if asp.p1_name in MAJOR_PLANETS and asp.p2_name in MAJOR_PLANETS:
-                key = (asp.p1_name, asp.aspect, asp.p2_name)
-                aspect_tracking[key].append((date_str, round(asp.orbit, 3), asp.aspect_movement))
+    import gzip
+    import hashlib
 
-    events = []
-    for (transit_planet, aspect_type, natal_planet), track in aspect_tracking.items():
-        for i in range(1, len(track)):
-            prev_date, prev_orb, prev_mv = track[i - 1]
-            _curr_date, _curr_orb, curr_mv = track[i]
-            if prev_mv == 'Applying' and curr_mv in ('Separating', 'Static'):
-                events.append({
-                    'date': prev_date,
-                    'transit_planet': transit_planet,
-                    'aspect': aspect_type,
-                    'natal_planet': natal_planet,
-                    'orb_at_hit': prev_orb,
-                })
-
-    events.sort(key=lambda e: e['date'])
-    return events
+    meta = data.get('meta')
+    calculated_at = meta.get('calculated_at') if isinstance(meta, dict) else None
+    if calculated_at is not None:
+        data = {**data, 'meta': {**meta, 'calculated_at': None}}
+    raw = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    return digest, gzip.compress(raw, mtime=0), calculated_at, len(raw)
 
 
-def build_timeline_json(results, natal_data, slug, start_dt, end_dt):
+def unpack_snapshot(blob, calculated_at):
     """
-    Assemble complete timeline JSON dict from factory results and natal data.
+    Rebuild a snapshot dict from its archived payload.
 
     Args:
-        results: TransitsTimeRangeModel from TransitsTimeRangeFactory.get_transit_moments()
-        natal_data: dict — full parsed chart.json from the natal profile
-        slug: str — natal profile slug
-        start_dt: datetime — timeline start (UTC noon)
-        end_dt: datetime — timeline end (UTC noon)
+        blob: gzip payload bytes from pack_snapshot()
+        calculated_at: The run's calculated_at (None if the snapshot had none)
 
     Returns:
-        dict: Timeline JSON with 'meta' and 'events' sections
+        dict: The snapshot as originally saved
     """
-    events = build_timeline_events(results)
-
-    natal_meta = natal_data.get('meta', {})
-    natal_name = natal_meta.get('name', slug)
+    import gzip
 
-    range_days = (end_dt - start_dt).days
+    data = json.loads(gzip.decompress(blob))
+    if calculated_at is not None:
+        data['meta']['calculated_at'] = calculated_at
+    return data
 
-    orbs_used = {ao['name']: ao['orb'] for ao in TRANSIT_DEFAULT_ORBS}
 
-    meta = {
-        "natal_name": natal_name,
-        "natal_slug": slug,
-        "start_date": start_dt.strftime("%Y-%m-%d"),
-        "end_date": end_dt.strftime("%Y-%m-%d"),
-        "range_days": range_days,
-        "chart_type": "transit_timeline",
-        "calculated_at": datetime.now(timezone.utc).isoformat(),
-        "orbs_used": orbs_used,
-        "event_count": len(events),
-        "sampling_note": "Daily resolution; fast Moon aspects (< 4h in orb) may not appear.",
-    }
+@contextmanager
+def snapshot_archive_lock(slug):
+    """
+    Hold an exclusive lock on a profile's snapshot archive (files backend).
 
-    return {
-        "meta": meta,
-        "events": events,
-    }
+    Serializes run-log appends against retention rewrites across processes.
+    Without fcntl (Windows) the archive is not locked.
 
+    Args:
+        slug: Profile slug
 
-def calculate_timeline(args):
+    Yields:
+        Path: The archive directory (created if missing)
     """
-    Orchestrate transit timeline calculation for an existing natal profile.
+    archive_dir = snapshot_archive_dir(slug)
+    (archive_dir / "objects").mkdir(parents=True, exist_ok=True)
+    try:
+        import fcntl
+    except ImportError:
+        yield archive_dir
+        return
+    with open(archive_dir / ".lock", 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield archive_dir
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
 
-    Loads the natal profile identified by args.timeline, determines the date range
-    from either preset (--range) or custom (--start/--end) arguments, generates
-    daily ephemeris data, runs transit comparisons, extracts exact hit events, and
-    prints the timeline JSON to stdout.
+
+def read_archive_runs(slug):
+    """
+    Read a profile's run log (files backend).
 
     Args:
-        args: Parsed argparse Namespace with .timeline (slug), .range, .start, .end
+        slug: Profile slug
 
     Returns:
-        0 on success, 1 on error
+        List[dict]: Runs (saved_at, mode, date, hash, calculated_at, size) ordered
+                    by saved_at; unreadable lines are skipped
     """
+    runs = {}
     try:
-        natal_subject, natal_data = load_natal_profile(args.timeline)
-
-        # Determine date range
-        if args.start and args.end:
-            # Custom range (TRAN-07)
-            start_dt = args.start.replace(hour=12, minute=0, second=0, microsecond=0)
-            end_dt = args.end.replace(hour=12, minute=0, second=0, microsecond=0)
-            if start_dt >= end_dt:
-                print("Error: --start must be before --end", file=sys.stderr)
-                return 1
-            range_days = (end_dt - start_dt).days
-            if range_days > 365:
-                print("Error: Custom date range cannot exceed 365 days", file=sys.stderr)
-                return 1
-        elif args.start or args.end:
-            print("Error: both --start and --end required for custom range", file=sys.stderr)
-            return 1
-        else:
-            # Preset range (TRAN-06)
-            start_dt, end_dt = parse_preset_range(args.range)
-
-        # Generate daily ephemeris (lat=0, lng=0, UTC — geocentric, location-independent)
-        eph_factory = EphemerisDataFactory(
-            start_datetime=start_dt,
-            end_datetime=end_dt,
-            step_type='days',
-            step=1,
-            lat=0.0,
-            lng=0.0,
-            tz_str='Etc/UTC',
-        )
-        ephemeris_subjects = eph_factory.get_ephemeris_data_as_astrological_subjects()
-
-        # Run transit comparison against natal chart
-        transit_factory = TransitsTimeRangeFactory(
-            natal_chart=natal_subject,
-            ephemeris_data_points=ephemeris_subjects,
-            active_points=MAJOR_PLANETS,
-            active_aspects=TRANSIT_DEFAULT_ORBS,
-        )
-        results = transit_factory.get_transit_moments()
-
-        # Extract exact hit events and assemble output
-        timeline_dict = build_timeline_json(results, natal_data, args.timeline, start_dt, end_dt)
-        print(json.dumps(timeline_dict, indent=2))
-
-        if args.save:
-            date_str = timeline_dict['meta'].get('start_date', 'unknown')
-            try:
-                out_path = save_snapshot(CHARTS_DIR / args.timeline, 'timeline', date_str, timeline_dict)
-                print(f"Snapshot saved: {out_path}", file=sys.stderr)
-            except Exception as e:
-                print(f"Warning: Could not save snapshot: {e}", file=sys.stderr)
+        with open(snapshot_archive_dir(slug) / "runs.jsonl", 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    run = json.loads(line)
+                    runs[(run['saved_at'], run['mode'])] = run
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue  # Torn or foreign line
+    except OSError:
+        return []
+    return sorted(runs.values(), key=lambda run: run['saved_at'])
+
+
+def write_archive_runs(slug, entries):
+    """
+    Add runs and their payloads to a profile's archive (files backend).
 
-        return 0
+    A payload already stored under its hash is not written again.
 
-    except FileNotFoundError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return 1
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return 1
-    except Exception as e:
-        print(f"Error calculating timeline: {e}", file=sys.stderr)
-        return 1
+    Args:
+        slug: Profile slug
+        entries: Iterable of (run dict, gzip payload bytes)
+    """
+    with snapshot_archive_lock(slug) as archive_dir:
+        lines = []
+        for run, blob in entries:
+            blob_path = archive_dir / "objects" / f"{run['hash']}.json.gz"
+            if not blob_path.exists():
+                tmp_path = blob_path.with_name(f"{blob_path.name}.tmp{os.getpid()}")
+                tmp_path.write_bytes(blob)
+                os.replace(tmp_path, blob_path)
+            lines.append(json.dumps(run, ensure_ascii=False) + "\n")
+        with open(archive_dir / "runs.jsonl", 'a', encoding='utf-8') as f:
+            f.writelines(lines)
+
+
+def archive_snapshot(slug, mode, date_str, data, saved_at=None):
+    """
+    Archive one snapshot run (files backend or the store).
 
+    Args:
+        slug: Profile slug
+        mode: Snapshot mode (e.g. 'transit', 'solar-arc')
+        date_str: YYYY-MM-DD from the snapshot's meta
+        data: Snapshot dict
+        saved_at: ISO timestamp of the run (default: now, UTC)
 
-def compute_progressed_jd(birth_jd, target_jd):
+    Returns:
+        dict: The archived run (saved_at, mode, date, hash, calculated_at, size)
     """
-    Compute the progressed Julian Day using the day-for-a-year formula.
+    digest, blob, calculated_at, size = pack_snapshot(data)
+    run = {
+        'saved_at': saved_at or datetime.now(timezone.utc).isoformat(),
+        'mode': mode,
+        'date': date_str,
+        'hash': digest,
+        'calculated_at': calculated_at,
+        'size': size,
+    }
+    if using_store():
+        store_write_snapshot(slug, run, blob)
+    else:
+        write_archive_runs(slug, [(run, blob)])
+    return run
 
-    Formula: progressed_jd = birth_jd + (target_jd - birth_jd) / 365.25
 
-    The elapsed years between birth and target become elapsed days in the
-    ephemeris (one day of ephemeris time = one year of life). The divisor
-    365.25 is the Julian year — standard in Western tropical astrology.
+def snapshot_runs(slug):
+    """
+    Return every archived run of a profile, oldest first.
 
     Args:
-        birth_jd: Julian Day number of the birth moment (including fractional hour)
-        target_jd: Julian Day number of the target date/moment
+        slug: Profile slug
 
     Returns:
-        float: Progressed Julian Day number
+        List[dict]: Runs (saved_at, mode, date, hash, calculated_at, size)
     """
-    return birth_jd + (target_jd - birth_jd) / 365.25
+    if using_store():
+        return [dict(row) for row in open_store().execute(
+            "SELECT saved_at, mode, date, hash, calculated_at, size FROM snapshot_runs "
+            "WHERE slug = ? ORDER BY saved_at", (slug,))]
+    return read_archive_runs(slug)
 
 
-def build_monthly_moon(birth_jd, target_year, natal_lat, natal_lng, natal_tz_str):
+def read_snapshot(slug, run):
     """
-    Calculate progressed Moon position for each month of target_year.
-
-    Uses the 1st day of each month at UTC noon as the target moment,
-    calculates progressed JD, creates a progressed subject, and extracts
-    Moon sign and degree. Sign changes are detected and flagged.
+    Load the snapshot one archived run saved.
 
     Args:
-        birth_jd: Julian Day number of the birth moment
-        target_year: Integer year for which to calculate the 12-month Moon positions
-        natal_lat: Natal chart latitude (used for progressed subject creation)
-        natal_lng: Natal chart longitude (used for progressed subject creation)
-        natal_tz_str: Natal chart timezone string (used for progressed subject creation)
+        slug: Profile slug
+        run: Run dict from snapshot_runs()
 
     Returns:
-        List[dict]: 12 entries with month (YYYY-MM), sign, degree, and optional sign_change
+        dict: The snapshot
+
+    Raises:
+        FileNotFoundError: If the run's payload is missing
     """
-    monthly = []
-    prev_sign = None
+    if using_store():
+        row = open_store().execute("SELECT data FROM snapshot_blobs WHERE hash = ?",
+                                   (run['hash'],)).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"Snapshot payload {run['hash']} missing from {STORE_PATH}")
+        blob = row['data']
+    else:
+        with open(snapshot_archive_dir(slug) / "objects" / f"{run['hash']}.json.gz", 'rb') as f:
+            blob = f.read()
+    return unpack_snapshot(blob, run['calculated_at'])
 
-    for month in range(1, 13):
-        month_jd = swe.julday(target_year, month, 1, 12.0)
-        prog_jd = compute_progressed_jd(birth_jd, month_jd)
-        py, pm, pd, ph = swe.revjul(prog_jd)
 
-        m_subj = AstrologicalSubjectFactory.from_birth_data(
-            name=f'prog_moon_{month}',
-            year=int(py), month=int(pm), day=int(pd),
-            hour=int(ph), minute=int((ph - int(ph)) * 60),
-            lat=natal_lat, lng=natal_lng, tz_str=natal_tz_str,
-            online=False, houses_system_identifier='P',
-        )
-        sign = m_subj.moon.sign
-        degree = round(m_subj.moon.position % 30, 2)
+def retention_policy():
+    """
+    Return the snapshot retention policy in effect.
 
-        entry = {
-            "month": f"{target_year}-{month:02d}",
-            "sign": sign,
-            "degree": degree,
-        }
-        if prev_sign is not None and sign != prev_sign:
-            entry["sign_change"] = f"{prev_sign} -> {sign}"
+    Defaults come from SNAPSHOT_RETENTION_DEFAULTS; the NATAL_CHARTS_KEEP_*
+    environment variables (set by --keep-days, --keep-per-date, --keep-runs)
+    override them.
 
-        monthly.append(entry)
-        prev_sign = sign
+    Returns:
+        dict: keep_days, keep_per_date, keep_runs (0 = no limit for keep_runs)
 
-    return monthly
+    Raises:
+        ValueError: If an environment override is not a non-negative integer
+    """
+    policy = dict(SNAPSHOT_RETENTION_DEFAULTS)
+    for name, env in SNAPSHOT_RETENTION_ENV.items():
+        value = os.environ.get(env)
+        if value:
+            if not value.isdigit():
+                raise ValueError(f"{env} must be a non-negative integer, got '{value}'")
+            policy[name] = int(value)
+    return policy
 
 
-def build_progressed_json(progressed_subject, natal_subject, natal_data, slug,
-                          target_date_str, target_jd, birth_jd, prog_year=None):
+def retained_runs(runs, policy, now=None):
     """
-    Assemble complete secondary progressions JSON dict.
+    Select the runs a retention policy keeps.
+
+    Every run saved within keep_days is kept. Older runs are thinned to the
+    newest keep_per_date per mode and date. With keep_runs > 0, only the newest
+    keep_runs of those survive.
 
     Args:
-        progressed_subject: AstrologicalSubjectModel for the progressed date
-        natal_subject: AstrologicalSubjectModel for the natal chart
-        natal_data: dict — full parsed chart.json from natal profile
-        slug: str — natal profile slug
-        target_date_str: str — YYYY-MM-DD target date (may be None for age-based)
-        target_jd: float — Julian Day number of target date
-        birth_jd: float — Julian Day number of birth moment
-        prog_year: int or None — year for monthly Moon report (defaults to target year)
+        runs: Runs from snapshot_runs(), oldest first
+        policy: dict from retention_policy()
+        now: Reference datetime (default: now, UTC)
 
     Returns:
-        dict: Complete progressions JSON with meta, progressed_planets, progressed_angles,
-              progressed_aspects, monthly_moon, and distribution_shift sections
+        List[dict]: The kept runs, oldest first
     """
-    natal_meta = natal_data.get('meta', {})
-    natal_name = natal_meta.get('name', slug)
-    location = natal_meta.get('location', {})
-    natal_lat = float(location['latitude'])
-    natal_lng = float(location['longitude'])
-    natal_tz_str = location['timezone']
+    now = now or datetime.now(timezone.utc)
+    cutoff = (now - timedelta(days=policy['keep_days'])).isoformat()
+    kept = []
+    per_date = {}
+    for run in reversed(runs):
+        if run['saved_at'] >= cutoff:
+            kept.append(run)
+            continue
+        key = (run['mode'], run['date'])
+        per_date[key] = per_date.get(key, 0) + 1
+        if per_date[key] <= policy['keep_per_date']:
+            kept.append(run)
+    if policy['keep_runs']:
+        kept = kept[:policy['keep_runs']]
+    kept.reverse()
+    return kept
 
-    # Compute progressed date parts
-    prog_jd = compute_progressed_jd(birth_jd, target_jd)
-    py, pm, pd, ph = swe.revjul(prog_jd)
-    prog_hour = int(ph)
-    prog_minute = int((ph - prog_hour) * 60)
 
-    # Compute target_date_str if not provided (age-based mode)
-    if target_date_str is None:
-        ty, tm, td, th = swe.revjul(target_jd)
-        target_date_str = f"{int(ty):04d}-{int(tm):02d}-{int(td):02d}"
+def apply_retention(slug, policy=None, sweep=False):
+    """
+    Drop the runs a profile's retention policy no longer keeps, and their payloads.
 
-    # Compute age at target
-    age_at_target = int((target_jd - birth_jd) / 365.25)
+    Args:
+        slug: Profile slug
+        policy: dict from retention_policy() (default: the policy in effect)
+        sweep: Also delete payloads no run references even if no run was dropped
+               (leftovers of interrupted writes)
 
-    # Determine prog_year for monthly Moon report
-    if prog_year is None:
-        # Default: year portion of target date
-        ty, tm, td, th = swe.revjul(target_jd)
-        prog_year = int(ty)
+    Returns:
+        tuple: (runs dropped, payloads deleted)
+    """
+    policy = policy or retention_policy()
+
+    if using_store():
+        conn = open_store()
+        with conn:
+            runs = snapshot_runs(slug)
+            kept = {(run['saved_at'], run['mode']) for run in retained_runs(runs, policy)}
+            dropped = [(slug, run['saved_at'], run['mode']) for run in runs
+                       if (run['saved_at'], run['mode']) not in kept]
+            conn.executemany("DELETE FROM snapshot_runs WHERE slug = ? AND saved_at = ? AND mode = ?", dropped)
+            deleted = 0
+            if dropped or sweep:
+                deleted = conn.execute(
+                    "DELETE FROM snapshot_blobs WHERE hash NOT IN (SELECT hash FROM snapshot_runs)"
+                ).rowcount
+        return len(dropped), deleted
+
+    if not snapshot_archive_dir(slug).exists():
+        return 0, 0
+    with snapshot_archive_lock(slug) as archive_dir:
+        runs = read_archive_runs(slug)
+        kept = retained_runs(runs, policy)
+        deleted = 0
+        if len(kept) < len(runs) or sweep:
+            runs_path = archive_dir / "runs.jsonl"
+            tmp_path = runs_path.with_name(f"{runs_path.name}.tmp{os.getpid()}")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.writelines(json.dumps(run, ensure_ascii=False) + "\n" for run in kept)
+            os.replace(tmp_path, runs_path)
+            referenced = {f"{run['hash']}.json.gz" for run in kept}
+            for path in (archive_dir / "objects").iterdir():
+                if path.name not in referenced:
+                    path.unlink()
+                    deleted += 1
+        return len(runs) - len(kept), deleted
+
+
+@lru_cache(maxsize=None)
+def code_fingerprint():
+    """
+    Return the stamp of everything besides the profile that a predictive result depends on.
 
-    # Build orbs_used dict for meta
-    orbs_used = {ao['name']: ao['orb'] for ao in PROG_DEFAULT_ORBS}
+    Covers this script, the calculation libraries and the orb tables. The
+    Kerykeion version is taken from its package __init__.py stat instead of
+    importlib.metadata (tens of milliseconds cold): an upgrade or reinstall
+    rewrites that file.
 
-    # META section
-    meta = {
-        "natal_name": natal_name,
-        "natal_slug": slug,
-        "target_date": target_date_str,
-        "progressed_date": f"{int(py):04d}-{int(pm):02d}-{int(pd):02d}",
-        "progressed_time": f"{prog_hour:02d}:{prog_minute:02d}",
-        "age_at_target": age_at_target,
-        "chart_type": "secondary_progressions",
-        "calculated_at": datetime.now(timezone.utc).isoformat(),
-        "orbs_used": orbs_used,
-        "prog_year": prog_year,
+    Returns:
+        dict: script, kerykeion and swisseph stamps plus the orb tables
+    """
+    script = Path(__file__).stat()
+    spec = find_spec('kerykeion')
+    try:
+        kerykeion = Path(spec.origin).stat()
+        kerykeion_stamp = [kerykeion.st_mtime_ns, kerykeion.st_size]
+    except (AttributeError, TypeError, OSError):
+        kerykeion_stamp = None
+    return {
+        'script': [script.st_mtime_ns, script.st_size],
+        'kerykeion': kerykeion_stamp,
+        'swisseph': swe.version,
+        'orbs': {
+            'transit': TRANSIT_DEFAULT_ORBS,
+            'progressions': PROG_DEFAULT_ORBS,
+            'solar_arc': SARC_DEFAULT_ORBS,
+            'aspect_angles': ASPECT_ANGLES,
+            'solar_arc_angles': SARC_ASPECT_ANGLES,
+        },
     }
 
-    # PROGRESSED PLANETS section (10 planets)
-    planet_attrs = [
-        ('Sun', progressed_subject.sun),
-        ('Moon', progressed_subject.moon),
-        ('Mercury', progressed_subject.mercury),
-        ('Venus', progressed_subject.venus),
-        ('Mars', progressed_subject.mars),
-        ('Jupiter', progressed_subject.jupiter),
-        ('Saturn', progressed_subject.saturn),
-        ('Uranus', progressed_subject.uranus),
-        ('Neptune', progressed_subject.neptune),
-        ('Pluto', progressed_subject.pluto),
-    ]
-
-    progressed_planets = []
-    for name, planet in planet_attrs:
-        progressed_planets.append({
-            "name": name,
-            "sign": planet.sign,
-            "degree": round(planet.position % 30, 2),
-            "abs_position": round(planet.abs_pos, 2),
-            "retrograde": getattr(planet, 'retrograde', False),
-        })
 
-    # PROGRESSED ANGLES section (ASC and MC)
-    progressed_angles = [
-        {
-            "name": "ASC",
-            "sign": progressed_subject.ascendant.sign,
-            "degree": round(progressed_subject.ascendant.position % 30, 2),
-            "abs_position": round(progressed_subject.ascendant.abs_pos, 2),
-        },
-        {
-            "name": "MC",
-            "sign": progressed_subject.medium_coeli.sign,
-            "degree": round(progressed_subject.medium_coeli.position % 30, 2),
-            "abs_position": round(progressed_subject.medium_coeli.abs_pos, 2),
-        },
-    ]
+def snapshot_cache_key(mode, slug, args):
+    """
+    Build the read-through cache key for one predictive query.
 
-    # PROGRESSED ASPECTS section (progressed-to-natal, 1-degree orb)
-    aspects_model = AspectsFactory.dual_chart_aspects(
-        progressed_subject,
-        natal_subject,
-        active_points=MAJOR_PLANETS,
-        active_aspects=PROG_DEFAULT_ORBS,
-        second_subject_is_fixed=True,
-    )
+    The key hashes the profile args itself selects (its mode attribute, e.g.
+    args.progressions), mode, every query parameter a --serve request can
+    set, code_fingerprint() and the profile's chart.json stamp, so rewriting
+    chart.json (or changing the code, libraries or orbs) makes old entries
+    unreachable. Queries relative to today include today's UTC date, which also
+    prefixes the key so prune_snapshot_cache() can spot entries from past days.
 
-    progressed_aspects = []
-    for asp in aspects_model.aspects:
-        if asp.p1_name in MAJOR_PLANETS and asp.p2_name in MAJOR_PLANETS:
-            progressed_aspects.append({
-                "progressed_planet": asp.p1_name,
-                "natal_planet": asp.p2_name,
-                "aspect": asp.aspect,
-                "orb": round(asp.orbit, 2),
-                "applying": asp.aspect_movement == 'Applying',
-                "movement": asp.aspect_movement,
-            })
+    Args:
+        mode: SERVE_MODES key ('transits', 'timeline', 'progressions', 'solar_arcs')
+        slug: Profile slug
+        args: Parsed argparse Namespace for the query
 
-    # MONTHLY MOON section
-    monthly_moon = build_monthly_moon(birth_jd, prog_year, natal_lat, natal_lng, natal_tz_str)
+    Returns:
+        str or None: Hex key ('{YYYY-MM-DD}-{hex}' for queries relative to today),
+                     or None when the result cannot be cached (transits for the
+                     current moment, a profile that does not exist, or args
+                     that select a profile other than slug)
+    """
+    import hashlib
+
+    if getattr(args, 'no_cache', False):
+        return None
+    # SERVE_MODES keys are the argparse dests of the mode flags
+    resolved = getattr(args, mode, None)
+    if isinstance(resolved, list):
+        resolved = resolved[0] if len(resolved) == 1 else None
+    if resolved != slug:
+        return None  # Never file one profile's result under another's key
+    if mode == 'transits' and args.query_date is None:
+        return None  # Current UTC moment, not a date
+    stamp = profile_stamp(slug)
+    if stamp is None:
+        return None
+
+    anchored = getattr(args, 'arc_calendar', False) or any(
+        getattr(args, name, None) is not None
+        for name in ('query_date', 'start', 'target_date', 'age', 'prog_range')
+    )
+    today = None if anchored else datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    key = {
+        'version': SNAPSHOT_CACHE_VERSION,
+        'mode': mode,
+        'slug': resolved,
+        'chart': list(stamp),
+        'params': {name: getattr(args, name, None) for name in (*SERVE_OPTIONS, *SERVE_FLAGS)},
+        'today': today,
+        'code': code_fingerprint(),
+    }
+    text = json.dumps(key, sort_keys=True, default=str)
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+    return digest if today is None else f"{today}-{digest}"
 
-    # DISTRIBUTION SHIFT section
-    def compute_distributions_for_subject(subject):
-        """Compute element and modality counts for 10 planets + ASC."""
-        planet_bodies = [
-            ('Sun', subject.sun), ('Moon', subject.moon),
-            ('Mercury', subject.mercury), ('Venus', subject.venus),
-            ('Mars', subject.mars), ('Jupiter', subject.jupiter),
-            ('Saturn', subject.saturn), ('Uranus', subject.uranus),
-            ('Neptune', subject.neptune), ('Pluto', subject.pluto),
-        ]
-        placements = planet_bodies + [('ASC', subject.ascendant)]
-        elem = {'Fire': 0, 'Earth': 0, 'Air': 0, 'Water': 0}
-        mod = {'Cardinal': 0, 'Fixed': 0, 'Mutable': 0}
-        for name, body in placements:
-            e = ELEMENT_MAP.get(body.sign)
-            m = MODALITY_MAP.get(body.sign)
-            if e:
-                elem[e] += 1
-            if m:
-                mod[m] += 1
-        return elem, mod
 
-    natal_elem, natal_mod = compute_distributions_for_subject(natal_subject)
-    prog_elem, prog_mod = compute_distributions_for_subject(progressed_subject)
+def snapshot_cache_path(mode, slug, key):
+    """
+    Return the cache entry path for a snapshot_cache_key() key.
 
-    distribution_shift = {
-        "elements": {
-            element: {
-                "natal": natal_elem[element],
-                "progressed": prog_elem[element],
-                "delta": prog_elem[element] - natal_elem[element],
-            }
-            for element in ['Fire', 'Earth', 'Air', 'Water']
-        },
-        "modalities": {
-            modality: {
-                "natal": natal_mod[modality],
-                "progressed": prog_mod[modality],
-                "delta": prog_mod[modality] - natal_mod[modality],
-            }
-            for modality in ['Cardinal', 'Fixed', 'Mutable']
-        }
-    }
+    Args:
+        mode: SERVE_MODES key
+        slug: Profile slug
+        key: Key from snapshot_cache_key()
 
-    return {
-        "meta": meta,
-        "progressed_planets": progressed_planets,
-        "progressed_angles": progressed_angles,
-        "progressed_aspects": progressed_aspects,
-        "monthly_moon": monthly_moon,
-        "distribution_shift": distribution_shift,
-    }
+    Returns:
+        Path: CHARTS_DIR/.cache/{slug}/{mode}-{key}.json
+    """
+    return SNAPSHOT_CACHE_DIR / slug / f"{mode}-{key}.json"
 
 
-def calculate_progressions(args):
+def read_cache_counts():
     """
-    Orchestrate secondary progressions calculation for an existing natal profile.
-
-    Loads the natal profile identified by args.progressions, computes the progressed
-    Julian Day using the day-for-a-year formula, creates a progressed subject at the
-    natal location, and prints the complete progressions JSON to stdout.
+    Total the cache stats log into hit/miss counts per mode.
 
-    Args:
-        args: Parsed argparse Namespace with .progressions (slug), .target_date,
-              .age (int or None), and .prog_year (int or None)
+    Lines are "{mode} hit|miss" for one lookup, or "{mode} hit|miss {count}" for
+    a counter written by compact_cache_stats().
 
     Returns:
-        0 on success, 1 on error
+        dict: {mode: {'hit': int, 'miss': int}} (empty if there is no log)
     """
+    counts = {}
     try:
-        # Load natal chart profile
-        natal_subject, natal_data = load_natal_profile(args.progressions)
-
-        natal_meta = natal_data.get('meta', {})
-        location = natal_meta.get('location', {})
-        natal_lat = float(location['latitude'])
-        natal_lng = float(location['longitude'])
-        natal_tz = location['timezone']
-
-        # Extract birth date/time and compute birth JD
-        birth_date_str = natal_meta['birth_date']
-        birth_time_str = natal_meta['birth_time']
-        birth_dt = datetime.strptime(birth_date_str + ' ' + birth_time_str, "%Y-%m-%d %H:%M")
-        birth_jd = swe.julday(birth_dt.year, birth_dt.month, birth_dt.day,
-                              birth_dt.hour + birth_dt.minute / 60.0)
-
-        # Validate: cannot use both --age and --target-date
-        if args.age is not None and args.target_date is not None:
-            print("Error: Cannot use both --age and --target-date", file=sys.stderr)
-            return 1
+        with open(SNAPSHOT_CACHE_STATS, 'r', encoding='ascii', errors='replace') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) not in (2, 3) or parts[1] not in ('hit', 'miss'):
+                    continue
+                if len(parts) == 3 and not parts[2].isdigit():
+                    continue
+                n = int(parts[2]) if len(parts) == 3 else 1
+                counts.setdefault(parts[0], {'hit': 0, 'miss': 0})[parts[1]] += n
+    except OSError:
+        pass
+    return counts
+
+
+def compact_cache_stats():
+    """
+    Rewrite the cache stats log as one counter line per mode and outcome.
 
-        # Determine target JD and target_date_str
-        if args.age is not None:
-            target_jd = birth_jd + args.age * 365.25
-            target_date_str = None  # will be computed in build_progressed_json
-        elif args.target_date is not None:
-            target_jd = swe.julday(args.target_date.year, args.target_date.month,
-                                   args.target_date.day, 12.0)
-            target_date_str = args.target_date.strftime("%Y-%m-%d")
-        else:
-            # Default: today UTC noon
-            today = datetime.now(timezone.utc)
-            target_jd = swe.julday(today.year, today.month, today.day, 12.0)
-            target_date_str = today.strftime("%Y-%m-%d")
+    Lookups appended by another process between the read and the replace are
+    lost; the statistics are best effort.
+    """
+    counts = read_cache_counts()
+    tmp_path = SNAPSHOT_CACHE_STATS.with_name(f"{SNAPSHOT_CACHE_STATS.name}.tmp{os.getpid()}")
+    with open(tmp_path, 'w', encoding='ascii') as f:
+        for mode in sorted(counts):
+            for outcome in ('hit', 'miss'):
+                if counts[mode][outcome]:
+                    f.write(f"{mode} {outcome} {counts[mode][outcome]}\n")
+    os.replace(tmp_path, SNAPSHOT_CACHE_STATS)
 
-        # Compute progressed JD
-        prog_jd = compute_progressed_jd(birth_jd, target_jd)
-        py, pm, pd, ph = swe.revjul(prog_jd)
-        prog_hour = int(ph)
-        prog_minute = int((ph - prog_hour) * 60)
-
-        # Create progressed subject using natal location (CRITICAL: not lat=0.0, lng=0.0)
-        progressed_subject = AstrologicalSubjectFactory.from_birth_data(
-            name='Progressed',
-            year=int(py), month=int(pm), day=int(pd),
-            hour=prog_hour, minute=prog_minute,
-            lat=natal_lat, lng=natal_lng, tz_str=natal_tz,
-            online=False, houses_system_identifier='P',
-        )
 
-        # Determine prog_year for monthly Moon report
-        if args.prog_year is not None:
-            prog_year = args.prog_year
-        elif args.age is not None:
-            prog_year = birth_dt.year + args.age
-        elif args.target_date is not None:
-            prog_year = args.target_date.year
-        else:
-            prog_year = datetime.now(timezone.utc).year
+def record_cache_lookup(mode, hit):
+    """
+    Append one lookup outcome to the cache stats log.
 
-        # Assemble and print progressions JSON
-        prog_dict = build_progressed_json(
-            progressed_subject, natal_subject, natal_data,
-            args.progressions, target_date_str, target_jd, birth_jd,
-            prog_year=prog_year,
-        )
-        print(json.dumps(prog_dict, indent=2))
+    Single short appends are atomic, so concurrent runs never corrupt the log.
+    When the log grows past SNAPSHOT_CACHE_STATS_MAX_BYTES it is compacted and
+    the cache pruned, so neither grows without bound. Statistics are best
+    effort: a failed append is ignored.
 
-        if args.save:
-            date_str = prog_dict['meta'].get('target_date', 'unknown')
-            try:
-                out_path = save_snapshot(CHARTS_DIR / args.progressions, 'progressions', date_str, prog_dict)
-                print(f"Snapshot saved: {out_path}", file=sys.stderr)
-            except Exception as e:
-                print(f"Warning: Could not save snapshot: {e}", file=sys.stderr)
+    Args:
+        mode: SERVE_MODES key
+        hit: True for a cache hit, False for a miss
+    """
+    try:
+        SNAPSHOT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd = os.open(SNAPSHOT_CACHE_STATS, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, f"{mode} {'hit' if hit else 'miss'}\n".encode('ascii'))
+            full = os.fstat(fd).st_size > SNAPSHOT_CACHE_STATS_MAX_BYTES
+        finally:
+            os.close(fd)
+        if full:
+            compact_cache_stats()
+            prune_snapshot_cache()
+    except OSError:
+        pass
+
+
+def cache_get(mode, slug, key):
+    """
+    Read a cached predictive result and record the lookup.
 
-        return 0
+    Args:
+        mode: SERVE_MODES key
+        slug: Profile slug
+        key: Key from snapshot_cache_key()
 
-    except FileNotFoundError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return 1
-    except Exception as e:
-        print(f"Error calculating progressions: {e}", file=sys.stderr)
-        return 1
+    Returns:
+        dict or None: The cached result, or None on a miss (absent or unreadable entry)
+    """
+    try:
+        with open(snapshot_cache_path(mode, slug, key), 'r', encoding='utf-8') as f:
+            result = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        result = None
+    record_cache_lookup(mode, result is not None)
+    return result
 
 
-def compute_solar_arc(birth_jd, target_jd, natal_sun_lon, method='true'):
+def cache_put(mode, slug, key, result):
     """
-    Compute the solar arc for a target date.
+    Store a freshly computed predictive result in the cache.
 
-    Two methods supported:
-    - 'true': actual distance the progressed Sun has traveled (swe.calc_ut)
-    - 'mean': Naibod constant rate (0.98564733 degrees/year)
+    The cache only saves work, so a failed write warns and carries on.
 
     Args:
-        birth_jd: Julian Day number of the birth moment
-        target_jd: Julian Day number of the target date
-        natal_sun_lon: Natal Sun absolute longitude (from chart.json abs_position)
-        method: 'true' (default) or 'mean'
-
-    Returns:
-        float: Solar arc in degrees (0-360)
+        mode: SERVE_MODES key
+        slug: Profile slug
+        key: Key from snapshot_cache_key()
+        result: Result dict from the mode's compute function
     """
-    elapsed_years = (target_jd - birth_jd) / 365.25
-    if method == 'mean':
-        return (elapsed_years * NAIBOD_ARC) % 360
-    # True arc: progressed Sun longitude - natal Sun longitude
-    # Reuse compute_progressed_jd() from Phase 9 for consistent JD arithmetic
-    progressed_jd = compute_progressed_jd(birth_jd, target_jd)
-    prog_sun_data, _ = swe.calc_ut(progressed_jd, swe.SUN)
-    prog_sun_lon = prog_sun_data[0]
-    return (prog_sun_lon - natal_sun_lon) % 360
+    path = snapshot_cache_path(mode, slug, key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_json_atomic(path, result)
+    except OSError as e:
+        print(f"Warning: Could not write snapshot cache entry: {e}", file=sys.stderr)
 
 
-def angular_distance(lon1, lon2):
+def cached_compute(mode, slug, compute, args):
     """
-    Compute the smallest angular distance between two ecliptic longitudes.
+    Answer a predictive query from the snapshot cache, computing it on a miss.
 
     Args:
-        lon1: First longitude in degrees (0-360)
-        lon2: Second longitude in degrees (0-360)
+        mode: SERVE_MODES key
+        slug: Profile slug
+        compute: The mode's compute function (compute_transits() etc.)
+        args: Parsed argparse Namespace for the query
 
     Returns:
-        float: Angular distance in degrees (0-180)
+        tuple: (result dict, True if it came from the cache)
     """
-    diff = abs(lon1 - lon2) % 360
-    return 360 - diff if diff > 180 else diff
-
-
-def build_sarc_aspects(directed_positions, natal_positions, orbs=None):
+    key = snapshot_cache_key(mode, slug, args)
+    if key is not None:
+        result = cache_get(mode, slug, key)
+        if result is not None:
+            return result, True
+    result = compute(args)
+    if key is not None:
+        cache_put(mode, slug, key, result)
+    return result, False
+
+
+def prune_snapshot_cache(max_bytes=None):
     """
-    Find aspects between SA directed positions and natal positions.
+    Evict snapshot cache entries that can no longer be hit, then the oldest.
 
-    Uses manual nested-loop calculation (no AspectsFactory) because directed
-    positions are not a Kerykeion AstrologicalSubjectModel.
+    Entries older than their profile's chart.json (or whose profile is gone)
+    and entries keyed to a past UTC day are deleted first; if the rest still
+    exceed max_bytes, the least recently written are deleted until it fits.
 
     Args:
-        directed_positions: dict of {name: directed_longitude}
-        natal_positions: dict of {name: natal_longitude}
-        orbs: dict of {aspect_name: max_orb}, defaults to SARC_DEFAULT_ORBS
+        max_bytes: Size cap in bytes (default: SNAPSHOT_CACHE_MAX_BYTES)
 
     Returns:
-        list: Aspect dicts sorted by orb ascending
+        tuple: (entries deleted, bytes freed)
     """
-    if orbs is None:
-        orbs = SARC_DEFAULT_ORBS
-
-    aspects = []
-    for d_name, d_lon in directed_positions.items():
-        for n_name, n_lon in natal_positions.items():
-            # Skip self-aspects: directed and natal point with same name are redundant
-            if d_name == n_name:
+    import shutil
+
+    max_bytes = SNAPSHOT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    deleted = freed = 0
+    kept = []
+    if not SNAPSHOT_CACHE_DIR.exists():
+        return 0, 0
+    for slug_dir in SNAPSHOT_CACHE_DIR.iterdir():
+        if not slug_dir.is_dir():
+            continue
+        stamp = profile_stamp(slug_dir.name)
+        for path in slug_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
                 continue
-            dist = angular_distance(d_lon, n_lon)
-            for asp_name, asp_angle in SARC_ASPECT_ANGLES.items():
-                orb = abs(dist - asp_angle)
-                if orb <= orbs.get(asp_name, 1.0):
-                    aspects.append({
-                        'directed_point': d_name,
-                        'natal_point': n_name,
-                        'aspect': asp_name,
-                        'orb': round(orb, 3),
-                    })
-    return sorted(aspects, key=lambda x: x['orb'])
+            match = SNAPSHOT_CACHE_DATED_RE.search(path.name)
+            if (stamp is None or stat.st_mtime_ns < stamp[0]
+                    or (match is not None and match.group(1) != today)):
+                path.unlink(missing_ok=True)
+                deleted += 1
+                freed += stat.st_size
+            else:
+                kept.append((stat.st_mtime_ns, stat.st_size, path))
+        if stamp is None:
+            shutil.rmtree(slug_dir, ignore_errors=True)
+
+    size = sum(entry_size for _mtime, entry_size, _path in kept)
+    for _mtime, entry_size, path in sorted(kept, key=lambda entry: entry[0]):
+        if size <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        deleted += 1
+        freed += entry_size
+        size -= entry_size
+    return deleted, freed
+
+
+def clear_profile_cache(slug):
+    """
+    Delete every cached result for a profile (after its chart.json is rewritten).
 
+    Entries for an old chart.json are already unreachable through the key; this
+    only reclaims their space.
 
-def build_solar_arc_json(natal_data, slug, birth_jd, target_jd, arc, arc_method):
+    Args:
+        slug: Profile slug
     """
-    Assemble the complete solar arc directions JSON dict.
+    import shutil
 
-    Args:
-        natal_data: Parsed natal chart.json dict
-        slug: Profile slug string
-        birth_jd: Julian Day number of birth
-        target_jd: Julian Day number of target date
-        arc: Solar arc in degrees (float)
-        arc_method: 'true' or 'mean'
+    shutil.rmtree(SNAPSHOT_CACHE_DIR / slug, ignore_errors=True)
+
+
+def cache_stats():
+    """
+    Print snapshot cache hit rates per mode and the cache's size on disk.
 
     Returns:
-        dict: Complete solar arc directions output
+        0 always
     """
-    elapsed_years = (target_jd - birth_jd) / 365.25
+    counts = read_cache_counts()
+
+    entries = size = 0
+    if SNAPSHOT_CACHE_DIR.exists():
+        for path in SNAPSHOT_CACHE_DIR.glob("*/*.json"):
+            entries += 1
+            size += path.stat().st_size
+
+    print(f"Snapshot cache: {SNAPSHOT_CACHE_DIR}")
+    print(f"  Entries:  {entries} ({size / 1024:.1f} KB)")
+    if not counts:
+        print("  No lookups recorded")
+        return 0
 
-    # Derive target date string from JD
-    y, m, d, h = swe.revjul(target_jd)
-    target_date_str = f"{int(y):04d}-{int(m):02d}-{int(d):02d}"
+    def rate(hits, misses):
+        return f"{hits} hit(s), {misses} miss(es), {100.0 * hits / (hits + misses):.1f}% hit rate"
 
-    # Build meta section
+    for mode in sorted(counts):
+        print(f"  {mode + ':':<14}{rate(counts[mode]['hit'], counts[mode]['miss'])}")
+    print(f"  {'total:':<14}{rate(sum(c['hit'] for c in counts.values()), sum(c['miss'] for c in counts.values()))}")
+    return 0
+
+
+def build_transit_json(transit_subject, natal_subject, natal_data, query_date_str, slug):
+    """
+    Build a transit snapshot JSON dict from transit and natal AstrologicalSubject instances.
+
+    Calculates transit planet positions, natal house placements for transiting planets,
+    transit-to-natal aspects using TRANSIT_DEFAULT_ORBS (find_aspects()), and aspect
+    movement (applying/separating).
+
+    Args:
+        transit_subject: AstrologicalSubjectModel for the transit moment (UTC)
+        natal_subject: AstrologicalSubjectModel for the natal chart
+        natal_data: dict — full parsed chart.json from the natal profile
+        query_date_str: str — YYYY-MM-DD date used for the transit (for meta)
+        slug: str — natal profile slug (for meta)
+
+    Returns:
+        dict: Transit snapshot with meta, transit_planets, and transit_aspects sections
+    """
     natal_meta = natal_data.get('meta', {})
     natal_name = natal_meta.get('name', slug)
-    meta = {
-        'natal_name': natal_name,
-        'natal_slug': slug,
-        'target_date': target_date_str,
-        'arc_degrees': round(arc, 3),
-        'arc_method': arc_method,
-        'elapsed_years': round(elapsed_years, 2),
-        'chart_type': 'solar_arc_directions',
-        'calculated_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S+00:00'),
-        'orbs_used': SARC_DEFAULT_ORBS,
-    }
 
-    # Extract natal planet positions (10 major planets)
-    natal_planets = {
-        p['name']: p['abs_position']
-        for p in natal_data['planets']
-        if p['name'] in MAJOR_PLANETS
-    }
+    # Build orbs_used dict for meta (aspect name -> orb)
+    orbs_used = {ao['name']: ao['orb'] for ao in TRANSIT_DEFAULT_ORBS}
 
-    # Extract natal angle positions (ASC and MC)
-    natal_angles = {
-        a['name']: a['abs_position']
-        for a in natal_data['angles']
-        if a['name'] in ['ASC', 'MC']
+    meta = {
+        "natal_name": natal_name,
+        "natal_slug": slug,
+        "query_date": query_date_str,
+        "query_time_utc": "12:00" if transit_subject.hour == 12 and transit_subject.minute == 0 else
+                          f"{transit_subject.hour:02d}:{transit_subject.minute:02d}",
+        "chart_type": "transit_snapshot",
+        "calculated_at": datetime.now(timezone.utc).isoformat(),
+        "orbs_used": orbs_used,
     }
 
-    # Combine natal positions for aspect calculation
-    all_natal = {**natal_planets, **natal_angles}
+    # Build transit planet position list (10 major planets)
+    planet_attrs = [
+        ('Sun', transit_subject.sun),
+        ('Moon', transit_subject.moon),
+        ('Mercury', transit_subject.mercury),
+        ('Venus', transit_subject.venus),
+        ('Mars', transit_subject.mars),
+        ('Jupiter', transit_subject.jupiter),
+        ('Saturn', transit_subject.saturn),
+        ('Uranus', transit_subject.uranus),
+        ('Neptune', transit_subject.neptune),
+        ('Pluto', transit_subject.pluto),
+    ]
 
-    # Compute directed positions: add arc to every natal longitude
-    directed_positions = {name: (lon + arc) % 360 for name, lon in all_natal.items()}
+    # Natal house of each transit planet: circular bisection over the natal cusps
+    natal_houses = place_in_houses(
+        house_cusp_index(natal_house_cusps(natal_data)), [planet.abs_pos for _name, planet in planet_attrs]
+    )
 
-    # Build directed_planets list in MAJOR_PLANETS order
-    # Build lookup for natal planet data (sign, degree) from natal_data
-    natal_planet_lookup = {p['name']: p for p in natal_data['planets']}
-    directed_planets = []
-    for planet_name in MAJOR_PLANETS:
-        if planet_name not in natal_planet_lookup:
-            continue
-        natal_p = natal_planet_lookup[planet_name]
-        natal_abs = natal_p['abs_position']
-        directed_abs = directed_positions[planet_name]
-        dir_sign, dir_degree = position_to_sign_degree(directed_abs)
-        directed_planets.append({
-            'name': planet_name,
-            'natal_sign': natal_p.get('sign', ''),
-            'natal_degree': round(natal_p.get('degree', 0.0), 2),
-            'natal_abs_position': round(natal_abs, 3),
-            'directed_abs_position': round(directed_abs, 3),
-            'directed_sign': dir_sign,
-            'directed_degree': round(dir_degree, 2),
+    transit_planets = []
+    for (name, planet), natal_house in zip(planet_attrs, natal_houses):
+        transit_planets.append({
+            "name": name,
+            "sign": planet.sign,
+            "degree": round(planet.abs_pos % 30, 2),
+            "abs_position": round(planet.abs_pos, 4),
+            "retrograde": bool(planet.retrograde),
+            "natal_house": natal_house,
         })
 
-    # Build directed_angles list (ASC then MC)
-    natal_angle_lookup = {a['name']: a for a in natal_data['angles']}
-    directed_angles = []
-    for angle_name in ['ASC', 'MC']:
-        if angle_name not in natal_angle_lookup:
-            continue
-        natal_a = natal_angle_lookup[angle_name]
-        natal_abs = natal_a['abs_position']
-        directed_abs = directed_positions[angle_name]
-        dir_sign, dir_degree = position_to_sign_degree(directed_abs)
-        directed_angles.append({
-            'name': angle_name,
-            'natal_abs_position': round(natal_abs, 3),
-            'directed_abs_position': round(directed_abs, 3),
-            'directed_sign': dir_sign,
-            'directed_degree': round(dir_degree, 2),
+    # Calculate transit-to-natal aspects (transit moving, natal fixed)
+    transit_aspects = []
+    for asp in find_aspects(
+        subject_points(transit_subject, MAJOR_PLANETS),
+        subject_points(natal_subject, MAJOR_PLANETS),
+        orbs=TRANSIT_DEFAULT_ORBS,
+        second_fixed=True,
+    ):
+        transit_aspects.append({
+            "transit_planet": asp['p1'],
+            "natal_planet": asp['p2'],
+            "aspect": asp['aspect'],
+            "orb": round(asp['orb'], 2),
+            "applying": asp['movement'] == 'Applying',
+            "movement": asp['movement'],
         })
 
-    # Compute aspects with applying/separating detection
-    aspects_raw = build_sarc_aspects(directed_positions, all_natal)
+    return {
+        "meta": meta,
+        "transit_planets": transit_planets,
+        "transit_aspects": transit_aspects,
+    }
 
-    # Compute arc one year forward for applying/separating detection
-    natal_sun_lon = natal_planets.get('Sun', 0.0)
-    arc_future = compute_solar_arc(birth_jd, target_jd + 365.25, natal_sun_lon, method=arc_method)
 
-    aspects = []
-    for asp in aspects_raw:
-        d_name = asp['directed_point']
-        n_name = asp['natal_point']
-        asp_name = asp['aspect']
-        asp_angle = SARC_ASPECT_ANGLES[asp_name]
+def transit_subject_for(query_dt):
+    """
+    Create the geocentric transit subject for a UTC moment.
 
-        natal_lon_of_directed = all_natal.get(d_name, 0.0)
-        natal_lon_of_natal = all_natal.get(n_name, 0.0)
+    Cached per minute: the sky is the same for every profile, so a warm worker
+    (--serve) building many snapshots for one moment computes it once.
 
-        # Current orb
-        current_orb = asp['orb']
+    Args:
+        query_dt: datetime (UTC) of the transit moment
 
-        # Future directed position (1 year forward)
-        directed_lon_future = (natal_lon_of_directed + arc_future) % 360
+    Returns:
+        AstrologicalSubjectModel for the transit moment at 0,0 UTC
+    """
+    return _transit_subject_cached(query_dt.year, query_dt.month, query_dt.day,
+                                   query_dt.hour, query_dt.minute)
+
+
+@lru_cache(maxsize=64)
+def _transit_subject_cached(year, month, day, hour, minute):
+    from kerykeion import AstrologicalSubjectFactory
+
+    # Create transit subject at 0,0 UTC (geocentric, no location bias)
+    return AstrologicalSubjectFactory.from_birth_data(
+        name='Current Transits',
+        year=year,
+        month=month,
+        day=day,
+        hour=hour,
+        minute=minute,
+        lat=0.0,
+        lng=0.0,
+        tz_str='UTC',
+        online=False,
+        houses_system_identifier='P',
+    )
 
-        # Future orb
-        orb_future = abs(angular_distance(directed_lon_future, natal_lon_of_natal) - asp_angle)
 
-        movement = 'Applying' if orb_future < current_orb else 'Separating'
+def transit_query_moment(args):
+    """
+    Resolve the transit moment of a --transits query.
 
-        aspects.append({
-            'directed_point': d_name,
-            'natal_point': n_name,
-            'aspect': asp_name,
-            'orb': current_orb,
-            'movement': movement,
-        })
+    Args:
+        args: Parsed argparse Namespace with .query_date (datetime or None)
 
-    return {
-        'meta': meta,
-        'directed_planets': directed_planets,
-        'directed_angles': directed_angles,
-        'aspects': aspects,
-    }
+    Returns:
+        tuple: (query datetime in UTC, YYYY-MM-DD date string) — UTC noon of
+               --query-date, or the current UTC moment
+    """
+    if args.query_date is not None:
+        # Use specified date at UTC noon
+        query_dt = args.query_date.replace(hour=12, minute=0, second=0, microsecond=0)
+        return query_dt, args.query_date.strftime("%Y-%m-%d")
+    # Use current UTC moment
+    query_dt = datetime.now(timezone.utc)
+    return query_dt, query_dt.strftime("%Y-%m-%d")
 
 
-def calculate_solar_arcs(args):
+def profile_transits(slug, query_dt, query_date_str):
     """
-    Orchestrate solar arc directions calculation for an existing natal profile.
+    Compute one profile's transit snapshot for a transit moment.
 
-    Loads natal profile, computes arc (true or mean method), applies arc to all
-    natal positions, finds SA-to-natal aspects, and outputs JSON to stdout.
+    The transit subject comes from transit_subject_for(), so profiles queried
+    for the same moment in one process share it; only the natal house
+    placements and aspects are computed per profile.
 
     Args:
-        args: Parsed argparse namespace (solar_arcs, target_date, age, arc_method)
+        slug: Profile slug
+        query_dt: Transit moment (UTC datetime)
+        query_date_str: YYYY-MM-DD date for the snapshot meta
 
     Returns:
-        int: Exit code (0 = success, 1 = error)
-    """
-    try:
-        natal_subject, natal_data = load_natal_profile(args.solar_arcs)
-
-        natal_meta = natal_data.get('meta', {})
-        birth_date_str = natal_meta['birth_date']
-        birth_time_str = natal_meta['birth_time']
-        birth_dt = datetime.strptime(birth_date_str + ' ' + birth_time_str, "%Y-%m-%d %H:%M")
-        birth_jd = swe.julday(birth_dt.year, birth_dt.month, birth_dt.day,
-                              birth_dt.hour + birth_dt.minute / 60.0)
-
-        # Validate mutually exclusive --age and --target-date
-        if args.age is not None and args.target_date is not None:
-            print("Error: --age and --target-date are mutually exclusive", file=sys.stderr)
-            return 1
-
-        # Determine target Julian Day
-        if args.age is not None:
-            target_jd = birth_jd + args.age * 365.25
-        elif args.target_date is not None:
-            target_jd = swe.julday(args.target_date.year, args.target_date.month,
-                                   args.target_date.day, 12.0)
-        else:
-            today = datetime.now(timezone.utc)
-            target_jd = swe.julday(today.year, today.month, today.day, 12.0)
+        dict: Transit snapshot from build_transit_json()
 
-        # Get arc method (default: 'true')
-        arc_method = getattr(args, 'arc_method', 'true')
+    Raises:
+        FileNotFoundError: If the profile does not exist
+    """
+    natal_subject, natal_data = load_natal_profile(slug)
+    return build_transit_json(
+        transit_subject_for(query_dt), natal_subject, natal_data, query_date_str, slug
+    )
 
-        # Get natal Sun longitude from profile
-        natal_sun_lon = next(
-            p['abs_position'] for p in natal_data['planets'] if p['name'] == 'Sun'
-        )
 
-        # Compute solar arc
-        arc = compute_solar_arc(birth_jd, target_jd, natal_sun_lon, method=arc_method)
+def compute_transits(args):
+    """
+    Compute the transit snapshot dict for an existing natal profile.
 
-        # Build and emit JSON
-        sarc_dict = build_solar_arc_json(natal_data, args.solar_arcs, birth_jd, target_jd, arc, arc_method)
-        print(json.dumps(sarc_dict, indent=2))
+    Loads the natal profile identified by args.transits and creates a transit
+    subject for the requested date (args.query_date, or current UTC if not specified).
 
-        if args.save:
-            date_str = sarc_dict['meta'].get('target_date', 'unknown')
-            try:
-                out_path = save_snapshot(CHARTS_DIR / args.solar_arcs, 'solar-arc', date_str, sarc_dict)
-                print(f"Snapshot saved: {out_path}", file=sys.stderr)
-            except Exception as e:
-                print(f"Warning: Could not save snapshot: {e}", file=sys.stderr)
+    Args:
+        args: Parsed argparse Namespace with .transits (one slug) and .query_date
+              (datetime or None)
 
-        return 0
+    Returns:
+        dict: Transit snapshot from build_transit_json()
 
-    except FileNotFoundError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return 1
-    except Exception as e:
-        print(f"Error calculating solar arc directions: {e}", file=sys.stderr)
-        return 1
+    Raises:
+        FileNotFoundError: If the profile does not exist
+        ValueError: If more than one profile is given
+    """
+    slugs = requested_slugs(args.transits, False, '--transits')
+    if len(slugs) != 1:
+        raise ValueError("compute_transits() takes exactly one profile")
+    query_dt, query_date_str = transit_query_moment(args)
+    return profile_transits(slugs[0], query_dt, query_date_str)
 
 
-def position_to_sign_degree(position):
+def transit_snapshot_job(slug, args, query_dt, query_date_str):
     """
-    Convert absolute ecliptic longitude (0-360°) to zodiac sign and degree within sign.
+    Compute one profile's transit snapshot for a multi-profile --transits run.
+
+    Runs in a worker process (or inline for one worker). Goes through the
+    snapshot cache like a single-profile query.
 
     Args:
-        position: Absolute ecliptic longitude in degrees (0-360)
+        slug: Profile slug
+        args: Parsed argparse Namespace of the run
+        query_dt: Transit moment shared by every profile (UTC datetime)
+        query_date_str: YYYY-MM-DD date for the snapshot meta
 
     Returns:
-        tuple: (sign_abbreviation, degree_within_sign)
+        tuple: (slug, snapshot dict or None, error message or None)
     """
-    # Sign abbreviations matching Kerykeion's 3-letter format
-    signs = ['Ari', 'Tau', 'Gem', 'Can', 'Leo', 'Vir',
-             'Lib', 'Sco', 'Sag', 'Cap', 'Aqu', 'Pis']
-    sign_index = int(position // 30) % 12
-    degree = position % 30
-    return signs[sign_index], degree
+    profile_args = argparse.Namespace(**{**vars(args), 'transits': [slug]})
+    try:
+        result, _hit = cached_compute(
+            'transits', slug, lambda _args: profile_transits(slug, query_dt, query_date_str), profile_args,
+        )
+        return slug, result, None
+    except (FileNotFoundError, ValueError) as e:
+        return slug, None, str(e)
+    except Exception as e:
+        return slug, None, f"Error calculating transits for '{slug}': {e}"
 
 
-def get_planet_dignities(planet_name, planet_sign):
+def iter_transit_snapshots(slugs, args, workers=None):
     """
-    Determine essential dignities for a planet based on its sign placement.
+    Compute transit snapshots for many profiles at one shared transit moment.
+
+    The transit moment and subject are resolved once before the worker pool
+    starts, so forked workers inherit the computed sky and repeat only the
+    per-profile house placements and aspects.
 
     Args:
-        planet_name: Name of the planet (e.g., 'Sun', 'Moon', 'Mercury')
-        planet_sign: Sign abbreviation (e.g., 'Ari', 'Tau', 'Gem')
+        slugs: Profile slugs
+        args: Parsed argparse Namespace with .query_date
+        workers: Worker process count (default: os.cpu_count())
 
-    Returns:
-        list: List of dignity strings (e.g., ['Domicile'], ['Exaltation'], ['Peregrine'])
+    Yields:
+        tuple: (slug, snapshot dict or None, error message or None), in slug order
     """
-    if planet_name not in DIGNITIES:
-        return []  # Not a traditional planet
-
-    dignities = []
-    planet_data = DIGNITIES[planet_name]
+    query_dt, query_date_str = transit_query_moment(args)
+    transit_subject_for(query_dt)
+
+    workers = min(workers or os.cpu_count() or 1, len(slugs))
+    if workers <= 1:
+        for slug in slugs:
+            yield transit_snapshot_job(slug, args, query_dt, query_date_str)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            transit_snapshot_job, slugs, [args] * len(slugs),
+            [query_dt] * len(slugs), [query_date_str] * len(slugs),
+            chunksize=max(1, len(slugs) // (workers * 4)),
+        )
 
-    if planet_sign in planet_data['domicile']:
-        dignities.append('Domicile')
-    if planet_sign in planet_data['exaltation']:
-        dignities.append('Exaltation')
-    if planet_sign in planet_data['detriment']:
-        dignities.append('Detriment')
-    if planet_sign in planet_data['fall']:
-        dignities.append('Fall')
 
-    # If no dignity found, planet is peregrine
-    if not dignities:
-        dignities.append('Peregrine')
+def save_transit_snapshot(slug, transit_dict):
+    """
+    Archive a transit snapshot for --save, warning instead of failing.
 
-    return dignities
+    Args:
+        slug: Profile slug
+        transit_dict: Snapshot from build_transit_json()
+    """
+    date_str = transit_dict['meta'].get('query_date', 'unknown')
+    try:
+        out_path = save_snapshot(CHARTS_DIR / slug, 'transit', date_str, transit_dict)
+        print(f"Snapshot saved: {out_path}", file=sys.stderr)
+    except Exception as e:
+        print(f"Warning: Could not save snapshot: {e}", file=sys.stderr)
 
 
-def check_existing_profile(profile_dir, person_name):
+def calculate_transits(args):
     """
-    Check if profile exists and display existing data. Returns True if ok to proceed.
+    Orchestrate transit snapshot calculation for one or more natal profiles.
+
+    A single profile computes its snapshot with compute_transits() (through the
+    snapshot cache) and prints the transit JSON to stdout. Several slugs (or
+    --all) share one transit moment and fan the per-profile work out across
+    --workers processes, printing one compact snapshot JSON per profile per
+    line (NDJSON) in slug order; profiles that fail are reported on stderr
+    and skipped.
 
     Args:
-        profile_dir: Path to the profile directory
-        person_name: Name of the person (for display)
+        args: Parsed argparse Namespace with .transits (list of slugs), .all,
+              .query_date (datetime or None), .workers and .save
 
     Returns:
-        True if profile doesn't exist (ok to proceed), False if exists (needs confirmation)
+        0 on success, 1 on error (including any profile that failed)
     """
-    chart_json = profile_dir / "chart.json"
-    if not chart_json.exists():
-        return True  # No existing profile, proceed
-
-    # Load and display existing birth details
-    with open(chart_json, 'r', encoding='utf-8') as f:
-        existing = json.load(f)
+    try:
+        slugs = requested_slugs(args.transits, args.all, '--transits')
+
+        if len(slugs) == 1:
+            args.transits = slugs
+            transit_dict, _hit = cached_compute('transits', slugs[0], compute_transits, args)
+
+            # Output to stdout
+            print(json.dumps(transit_dict, indent=2))
+            if args.save:
+                save_transit_snapshot(slugs[0], transit_dict)
+            return 0
+
+        failed = False
+        for slug, transit_dict, error in iter_transit_snapshots(slugs, args, workers=args.workers):
+            if error is not None:
+                print(f"Error: {error}", file=sys.stderr)
+                failed = True
+                continue
+            print(json.dumps(transit_dict, ensure_ascii=False))
+            if args.save:
+                save_transit_snapshot(slug, transit_dict)
+        return 1 if failed else 0
 
-    meta = existing.get('meta', {})
-    loc = meta.get('location', {})
-    print(f"\nWARNING: Profile '{person_name}' already exists")
-    print(f"  Birth date: {meta.get('birth_date', 'Unknown')}")
-    print(f"  Birth time: {meta.get('birth_time', 'Unknown')}")
-    print(f"  Location:   {loc.get('city', 'N/A')}, {loc.get('nation', 'N/A')}")
-    print(f"  Lat/Lng:    {loc.get('latitude', 'N/A')}, {loc.get('longitude', 'N/A')}")
-    print(f"  Timezone:   {loc.get('timezone', 'N/A')}")
-    print(f"  Generated:  {meta.get('generated_at', 'Unknown')}")
-    print()
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error calculating transits: {e}", file=sys.stderr)
+        return 1
 
-    # In non-interactive mode (piped input), default to not overwriting
-    # For script use, require --force flag
-    return False  # Signal that confirmation is needed
 
+def parse_preset_range(preset, reference_date=None):
+    """
+    Convert preset range string to (start_dt, end_dt) UTC noon datetimes.
+
+    Args:
+        preset: One of 'week', '30d', '3m', 'year'
+        reference_date: datetime to use as 'today' (default: today UTC)
 
-def build_chart_json(subject, args):
+    Returns:
+        Tuple[datetime, datetime]: (start, end) at UTC noon
     """
-    Build comprehensive JSON-serializable dictionary from AstrologicalSubject.
+    if reference_date is None:
+        reference_date = datetime.now(timezone.utc).replace(tzinfo=None)
 
-    Extracts all astrological calculations into a structured format including:
-    meta, planets, houses, angles, aspects, asteroids, fixed_stars, arabic_parts,
-    dignities, and distributions.
+    today = reference_date.replace(hour=12, minute=0, second=0, microsecond=0)
+
+    DELTAS = {
+        'week':  timedelta(days=6),
+        '30d':   timedelta(days=29),
+        '3m':    timedelta(days=89),
+        'year':  timedelta(days=364),
+    }
+    if preset not in DELTAS:
+        raise ValueError(f"Invalid preset: {preset}. Use: week, 30d, 3m, year")
+
+    return today, today + DELTAS[preset]
+
+
+def aspect_target_offsets(angle):
+    """
+    Return the signed longitude offsets at which an aspect is exact.
+
+    Conjunction (0) and opposition (180) are exact at a single offset; every other
+    aspect is exact on both sides of the natal point (+angle and -angle).
 
     Args:
-        subject: AstrologicalSubject instance with calculated chart data
-        args: Parsed command-line arguments containing birth data
+        angle: Aspect angle in degrees (0-180)
 
     Returns:
-        dict: Comprehensive chart data structure
+        List[float]: Offsets to add to the natal longitude
     """
-    # META SECTION
-    meta = {
-        "name": args.name,
-        "slug": slugify(args.name),
-        "birth_date": args.date.strftime("%Y-%m-%d"),
-        "birth_time": args.time.strftime("%H:%M"),
-        "location": {
-            "city": getattr(subject, 'city', None),
-            "nation": getattr(subject, 'nation', None),
-            "latitude": subject.lat,
-            "longitude": subject.lng,
-            "timezone": subject.tz_str
-        },
-        "house_system": "Placidus",
-        "chart_type": None,  # Will be determined below
-        "generated_at": datetime.now(timezone.utc).isoformat()
-    }
+    if angle in (0, 180):
+        return [float(angle)]
+    return [float(angle), -float(angle)]
 
-    # PLANETS SECTION - all 10 main planets
-    planets_list = [
-        ('Sun', subject.sun), ('Moon', subject.moon),
-        ('Mercury', subject.mercury), ('Venus', subject.venus),
-        ('Mars', subject.mars), ('Jupiter', subject.jupiter),
-        ('Saturn', subject.saturn), ('Uranus', subject.uranus),
-        ('Neptune', subject.neptune), ('Pluto', subject.pluto),
-    ]
 
-    planets = []
-    for name, planet in planets_list:
-        planets.append({
-            "name": name,
-            "sign": planet.sign,
-            "degree": planet.position % 30,
-            "abs_position": planet.abs_pos,
-            "house": str(planet.house),
-            "retrograde": getattr(planet, 'retrograde', False)
-        })
+def build_ephemeris_table(start_jd, days, planets=None):
+    """
+    Build a dense daily ephemeris table straight from swe.calc_ut.
 
-    # HOUSES SECTION - all 12 house cusps
-    houses_list = [
-        subject.first_house, subject.second_house, subject.third_house,
-        subject.fourth_house, subject.fifth_house, subject.sixth_house,
-        subject.seventh_house, subject.eighth_house, subject.ninth_house,
-        subject.tenth_house, subject.eleventh_house, subject.twelfth_house,
-    ]
+    Layout is (days x planets x [longitude, speed]) in one flat array('d'):
+    the value for row d, planet p, field f sits at
+    (d * len(planets) + p) * EPHEMERIS_TABLE_FIELDS + f.
 
-    houses = []
-    for i, house in enumerate(houses_list, 1):
-        houses.append({
-            "number": i,
-            "sign": house.sign,
-            "degree": house.position % 30
-        })
+    Args:
+        start_jd: UT Julian Day of row 0
+        days: Number of rows (spaced EPHEMERIS_TABLE_STEP_DAYS apart)
+        planets: Planet names (default: MAJOR_PLANETS)
 
-    # ANGLES SECTION
-    angles_list = [
-        ('ASC', subject.ascendant),
-        ('MC', subject.medium_coeli),
-        ('DSC', subject.descendant),
-        ('IC', subject.imum_coeli),
-    ]
+    Returns:
+        dict: {'start_jd', 'step', 'days', 'planets', 'data'}
+    """
+    ensure_ephemeris_path()
+    planets = list(planets or MAJOR_PLANETS)
+    body_ids = [SWE_PLANET_IDS[name] for name in planets]
+    data = array('d')
+    for day in range(days):
+        jd = start_jd + day * EPHEMERIS_TABLE_STEP_DAYS
+        for body_id in body_ids:
+            pos = swe.calc_ut(jd, body_id, SWE_FLAGS)[0]
+            data.append(pos[0])
+            data.append(pos[3])
+    return {
+        'start_jd': start_jd,
+        'step': EPHEMERIS_TABLE_STEP_DAYS,
+        'days': days,
+        'planets': planets,
+        'data': data,
+    }
 
-    angles = []
-    for name, angle in angles_list:
-        angles.append({
-            "name": name,
-            "sign": angle.sign,
-            "degree": angle.position % 30,
-            "abs_position": angle.abs_pos
-        })
 
-    # ASPECTS SECTION - major aspects between 10 main planets
-    natal_aspects = NatalAspects(subject)
-    major_types = ['conjunction', 'opposition', 'trine', 'square', 'sextile']
-    planet_names = ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto']
-
-    filtered_aspects = [
-        asp for asp in natal_aspects.all_aspects
-        if asp.aspect in major_types
-        and asp.p1_name in planet_names
-        and asp.p2_name in planet_names
-    ]
+def ephemeris_cache_path():
+    """
+    Return the path of the shared daily ephemeris cache file.
 
-    aspects = []
-    for asp in filtered_aspects:
-        movement = asp.aspect_movement if hasattr(asp, 'aspect_movement') else ''
-        aspects.append({
-            "planet1": asp.p1_name,
-            "planet2": asp.p2_name,
-            "type": asp.aspect,
-            "orb": asp.orbit,
-            "movement": movement
-        })
+    Returns:
+        Path: ~/.natal-charts/.ephemeris/daily-v{EPHEMERIS_CACHE_VERSION}.bin
+    """
+    return EPHEMERIS_CACHE_DIR / f"daily-v{EPHEMERIS_CACHE_VERSION}.bin"
 
-    # ASTEROIDS SECTION
-    asteroid_attrs = [
-        ('Chiron', 'chiron'),
-        ('Mean Lilith', 'mean_lilith'),
-        ('True Lilith', 'true_lilith'),
-        ('Ceres', 'ceres'),
-        ('Pallas', 'pallas'),
-        ('Juno', 'juno'),
-        ('Vesta', 'vesta'),
-    ]
 
-    asteroids = []
-    for name, attr in asteroid_attrs:
-        body = getattr(subject, attr, None)
-        if body is not None:
-            asteroids.append({
-                "name": name,
-                "sign": body.sign,
-                "degree": body.position % 30,
-                "house": str(body.house),
-                "retrograde": getattr(body, 'retrograde', False)
-            })
+def ephemeris_cache_header():
+    """
+    Return the header metadata the current ephemeris cache must carry.
 
-    # ARABIC PARTS SECTION - Determine day/night chart and calculate parts
-    sun_house_str = str(subject.sun.house)
-    house_names = {
-        'First_House': 1, 'Second_House': 2, 'Third_House': 3, 'Fourth_House': 4,
-        'Fifth_House': 5, 'Sixth_House': 6, 'Seventh_House': 7, 'Eighth_House': 8,
-        'Ninth_House': 9, 'Tenth_House': 10, 'Eleventh_House': 11, 'Twelfth_House': 12
+    Returns:
+        dict: Version, row range, planets, field count, byte order and library versions
+    """
+    start_jd = swe.julday(EPHEMERIS_CACHE_FIRST_YEAR, 1, 1, 0.0)
+    end_jd = swe.julday(EPHEMERIS_CACHE_LAST_YEAR + 1, 1, 1, 0.0)
+    return {
+        'version': EPHEMERIS_CACHE_VERSION,
+        'start_jd': start_jd,
+        'step': EPHEMERIS_TABLE_STEP_DAYS,
+        'days': int(round((end_jd - start_jd) / EPHEMERIS_TABLE_STEP_DAYS)) + 1,
+        'planets': MAJOR_PLANETS,
+        'fields': EPHEMERIS_TABLE_FIELDS,
+        'byteorder': sys.byteorder,
+        'libraries': library_versions(),
     }
-    sun_house = house_names.get(sun_house_str, int(sun_house_str) if sun_house_str.isdigit() else 1)
-    is_day_chart = 7 <= sun_house <= 12
 
-    # Update meta with chart type
-    meta["chart_type"] = "Day" if is_day_chart else "Night"
 
-    asc_pos = subject.ascendant.position
-    sun_pos = subject.sun.position
-    moon_pos = subject.moon.position
+def build_ephemeris_cache(workers=None, chunk_days=3653):
+    """
+    Precompute the shared daily ephemeris cache file.
 
-    # Calculate Part of Fortune
-    if is_day_chart:
-        fortune_pos = (asc_pos + moon_pos - sun_pos) % 360
-    else:
-        fortune_pos = (asc_pos + sun_pos - moon_pos) % 360
+    Rows are computed in chunks across a ProcessPoolExecutor and written after a
+    fixed-size JSON header; the file is renamed into place atomically, so
+    concurrent readers never see a partial cache.
 
-    # Calculate Part of Spirit
-    if is_day_chart:
-        spirit_pos = (asc_pos + sun_pos - moon_pos) % 360
-    else:
-        spirit_pos = (asc_pos + moon_pos - sun_pos) % 360
+    Args:
+        workers: Worker process count (default: os.cpu_count())
+        chunk_days: Rows per worker task
 
-    fortune_sign, fortune_degree = position_to_sign_degree(fortune_pos)
-    spirit_sign, spirit_degree = position_to_sign_degree(spirit_pos)
+    Returns:
+        Path: The written cache file
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    header = ephemeris_cache_header()
+    header_bytes = EPHEMERIS_CACHE_MAGIC + json.dumps(header).encode('utf-8')
+    if len(header_bytes) > EPHEMERIS_CACHE_HEADER_SIZE:
+        raise ValueError("Ephemeris cache header exceeds EPHEMERIS_CACHE_HEADER_SIZE")
+
+    starts = list(range(0, header['days'], chunk_days))
+    chunk_jds = [header['start_jd'] + i * header['step'] for i in starts]
+    chunk_sizes = [min(chunk_days, header['days'] - i) for i in starts]
+
+    out_path = ephemeris_cache_path()
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_suffix(f'.tmp{os.getpid()}')
+    with open(tmp_path, 'wb') as f:
+        f.write(header_bytes.ljust(EPHEMERIS_CACHE_HEADER_SIZE, b' '))
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+            # map() yields chunks in submission order, so rows are written sequentially
+            for table in executor.map(build_ephemeris_table, chunk_jds, chunk_sizes):
+                table['data'].tofile(f)
+    os.replace(tmp_path, out_path)
+    open_ephemeris_cache.cache_clear()
+    return out_path
 
-    arabic_parts = {
-        "part_of_fortune": {"sign": fortune_sign, "degree": fortune_degree},
-        "part_of_spirit": {"sign": spirit_sign, "degree": spirit_degree}
+
+@lru_cache(maxsize=None)
+def open_ephemeris_cache():
+    """
+    Memory-map the shared daily ephemeris cache, if present and current.
+
+    The file is mapped read-only, so concurrent processes share its pages
+    through the OS page cache. Mapped once per process.
+
+    Returns:
+        dict or None: Ephemeris table (as from build_ephemeris_table(), with a
+                      memoryview 'data'), or None if the cache is missing or stale
+    """
+    path = ephemeris_cache_path()
+    try:
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    raw_header = mapped[:EPHEMERIS_CACHE_HEADER_SIZE]
+    try:
+        if not raw_header.startswith(EPHEMERIS_CACHE_MAGIC):
+            raise ValueError("bad magic")
+        header = json.loads(raw_header[len(EPHEMERIS_CACHE_MAGIC):].decode('utf-8'))
+    except (ValueError, UnicodeDecodeError):
+        mapped.close()
+        return None
+
+    expected = ephemeris_cache_header()
+    data_bytes = header.get('days', 0) * len(MAJOR_PLANETS) * EPHEMERIS_TABLE_FIELDS * 8
+    if header != expected or len(mapped) != EPHEMERIS_CACHE_HEADER_SIZE + data_bytes:
+        mapped.close()
+        return None
+
+    return {
+        'start_jd': header['start_jd'],
+        'step': header['step'],
+        'days': header['days'],
+        'planets': list(header['planets']),
+        'data': memoryview(mapped)[EPHEMERIS_CACHE_HEADER_SIZE:].cast('d'),
     }
 
-    # DIGNITIES SECTION - traditional planets only
-    traditional_planets = [
-        ('Sun', subject.sun),
-        ('Moon', subject.moon),
-        ('Mercury', subject.mercury),
-        ('Venus', subject.venus),
-        ('Mars', subject.mars),
-        ('Jupiter', subject.jupiter),
-        ('Saturn', subject.saturn),
-    ]
 
-    dignities = []
-    for name, planet in traditional_planets:
-        dignity_status = get_planet_dignities(name, planet.sign)
-        dignities.append({
-            "planet": name,
-            "sign": planet.sign,
-            "status": dignity_status
-        })
+def ephemeris_table_for_range(start_jd, end_jd):
+    """
+    Return an ephemeris table whose rows cover [start_jd, end_jd].
 
-    # FIXED STARS SECTION
-    # Set Swiss Ephemeris path
-    kerykeion_path = Path(kerykeion.__file__).parent
-    sweph_path = kerykeion_path / 'sweph'
-    swe.set_ephe_path(str(sweph_path))
+    Uses the memory-mapped daily cache when it covers the range (no ephemeris
+    calculation at all), otherwise builds a table for just this range.
 
-    # Calculate Julian day
-    jd = swe.julday(args.date.year, args.date.month, args.date.day,
-                    args.time.hour + args.time.minute / 60.0)
+    Args:
+        start_jd: Range start (UT Julian Day)
+        end_jd: Range end (UT Julian Day)
 
-    # Build points to check: all 10 planets + 4 angles
-    points_to_check = [(name, p.abs_pos) for name, p in planets_list] + \
-                      [(name, a.abs_pos) for name, a in angles_list]
+    Returns:
+        dict: Ephemeris table (see build_ephemeris_table())
+    """
+    cache = open_ephemeris_cache()
+    if cache is not None:
+        cache_end_jd = cache['start_jd'] + (cache['days'] - 1) * cache['step']
+        if cache['start_jd'] <= start_jd and end_jd <= cache_end_jd:
+            return cache
 
-    fixed_stars = []
-    for star_lookup, star_display in MAJOR_STARS:
-        try:
-            star_data, returned_name, ret_flag = swe.fixstar2_ut(star_lookup, jd, 0)
-            star_long = star_data[0]
-
-            for point_name, point_long in points_to_check:
-                diff = abs(point_long - star_long)
-                if diff > 180:
-                    diff = 360 - diff
-
-                if diff <= 1.0:
-                    fixed_stars.append({
-                        "star": star_display,
-                        "conjunct_body": point_name,
-                        "orb": diff
-                    })
-        except Exception:
-            # Silently skip stars that can't be calculated
-            pass
+    days = max(2, math.ceil((end_jd - start_jd) / EPHEMERIS_TABLE_STEP_DAYS) + 1)
+    return build_ephemeris_table(start_jd, days)
 
-    # DISTRIBUTIONS SECTION - Elements and Modalities
-    # Collect placements: 10 planets + ASC (11 total)
-    placements = [(name, p) for name, p in planets_list] + [('ASC', subject.ascendant)]
 
-    # Element distribution
-    element_count = {'Fire': 0, 'Earth': 0, 'Air': 0, 'Water': 0}
-    element_planets = {'Fire': [], 'Earth': [], 'Air': [], 'Water': []}
+def hermite_value(y0, y1, m0, m1, u):
+    """
+    Evaluate a cubic Hermite segment and its slope.
 
-    for name, body in placements:
-        element = ELEMENT_MAP.get(body.sign)
-        if element:
-            element_count[element] += 1
-            element_planets[element].append(name)
+    Args:
+        y0: Value at u=0
+        y1: Value at u=1
+        m0: Slope at u=0 (per unit u)
+        m1: Slope at u=1 (per unit u)
+        u: Position within the segment (0-1)
 
-    total_placements = sum(element_count.values())
+    Returns:
+        tuple: (value at u, slope at u per unit u)
+    """
+    u2, u3 = u * u, u * u * u
+    value = ((2 * u3 - 3 * u2 + 1) * y0 + (u3 - 2 * u2 + u) * m0
+             + (-2 * u3 + 3 * u2) * y1 + (u3 - u2) * m1)
+    slope = ((6 * u2 - 6 * u) * y0 + (3 * u2 - 4 * u + 1) * m0
+             + (-6 * u2 + 6 * u) * y1 + (3 * u2 - 2 * u) * m1)
+    return value, slope
 
-    elements = {}
-    for element in ['Fire', 'Earth', 'Air', 'Water']:
-        count = element_count[element]
-        percentage = (count / total_placements * 100) if total_placements > 0 else 0
-        elements[element] = {
-            "count": count,
-            "percentage": round(percentage, 1),
-            "planets": element_planets[element]
-        }
 
-    # Modality distribution
-    modality_count = {'Cardinal': 0, 'Fixed': 0, 'Mutable': 0}
-    modality_planets = {'Cardinal': [], 'Fixed': [], 'Mutable': []}
+def table_position(table, planet_index, jd_ut):
+    """
+    Interpolate a planet's longitude and speed from an ephemeris table.
 
-    for name, body in placements:
-        modality = MODALITY_MAP.get(body.sign)
-        if modality:
-            modality_count[modality] += 1
-            modality_planets[modality].append(name)
+    Args:
+        table: Ephemeris table (see build_ephemeris_table()) whose rows cover jd_ut
+        planet_index: Index of the planet in table['planets']
+        jd_ut: UT Julian Day
 
-    modalities = {}
-    for modality in ['Cardinal', 'Fixed', 'Mutable']:
-        count = modality_count[modality]
-        percentage = (count / total_placements * 100) if total_placements > 0 else 0
-        modalities[modality] = {
-            "count": count,
-            "percentage": round(percentage, 1),
-            "planets": modality_planets[modality]
-        }
+    Returns:
+        tuple: (longitude 0-360, speed in degrees/day)
+    """
+    step = table['step']
+    row = min(int((jd_ut - table['start_jd']) // step), table['days'] - 2)
+    u = (jd_ut - table['start_jd']) / step - row
+    idx = (row * len(table['planets']) + planet_index) * EPHEMERIS_TABLE_FIELDS
+    row_width = len(table['planets']) * EPHEMERIS_TABLE_FIELDS
+    data = table['data']
+    lon0, speed0 = data[idx], data[idx + 1]
+    lon1, speed1 = data[idx + row_width], data[idx + row_width + 1]
+    value, slope = hermite_value(0.0, wrap_degrees(lon1 - lon0), speed0 * step, speed1 * step, u)
+    return (lon0 + value) % 360, slope / step
+
+
+def hermite_crossing(y0, y1, m0, m1):
+    """
+    Solve for where a cubic Hermite segment crosses zero.
 
-    distributions = {
-        "elements": elements,
-        "modalities": modalities
-    }
+    The segment runs over u in [0, 1] with values y0, y1 and slopes m0, m1
+    (per unit u) at its ends; y0 and y1 must have opposite signs. Newton steps are
+    kept inside the shrinking bracket, falling back to bisection.
 
-    # Assemble final dictionary
-    return {
-        "meta": meta,
-        "planets": planets,
-        "houses": houses,
+    Args:
+        y0: Value at u=0
+        y1: Value at u=1
+        m0: Slope at u=0
+        m1: Slope at u=1
+
+    Returns:
+        tuple: (u of the crossing, slope at u)
+    """
+    lo, hi, y_lo = 0.0, 1.0, y0
+    u = y0 / (y0 - y1)
+    while True:
+        y, slope = hermite_value(y0, y1, m0, m1, u)
+        if (y < 0) == (y_lo < 0):
+            lo, y_lo = u, y
+        else:
+            hi = u
+        next_u = u - y / slope if slope else None
+        if next_u is not None and abs(next_u - u) < EXACT_HIT_TOLERANCE_DAYS:
+            return next_u, slope
+        if hi - lo < EXACT_HIT_TOLERANCE_DAYS:
+            return u, slope
+        if next_u is None or not lo < next_u < hi:
+            next_u = (lo + hi) / 2
+        u = next_u
+
+
+def build_timeline_events(natal_positions, start_jd, end_jd, aspect_angles=None, table=None):
+    """
+    Find exact transit-to-natal aspect hits between two moments.
+
+    Single-chart form of build_profile_timeline_events().
+
+    Args:
+        natal_positions: dict of {natal_point_name: abs_longitude}
+        start_jd: Range start (UT Julian Day)
+        end_jd: Range end (UT Julian Day)
+        aspect_angles: dict of {aspect_name: angle}, defaults to the aspects in
+                       TRANSIT_DEFAULT_ORBS
+        table: Ephemeris table covering the range (default: built for the range)
+
+    Returns:
+        List[dict]: Events sorted by exact time (see build_profile_timeline_events())
+    """
+    return build_profile_timeline_events(
+        {None: natal_positions}, start_jd, end_jd, aspect_angles=aspect_angles, table=table,
+    )[None]
+
+
+def build_profile_timeline_events(profile_positions, start_jd, end_jd, aspect_angles=None, table=None,
+                                  profile_cusps=None):
+    """
+    Find exact transit-to-natal aspect hits for several natal charts in one pass.
+
+    Collects iter_profile_timeline_events() into per-profile lists.
+
+    Args:
+        profile_positions: dict of {profile_key: {natal_point_name: abs_longitude}}
+        start_jd: Range start (UT Julian Day)
+        end_jd: Range end (UT Julian Day)
+        aspect_angles: dict of {aspect_name: angle}, defaults to the aspects in
+                       TRANSIT_DEFAULT_ORBS
+        table: Ephemeris table covering the range (default: per chunk, see
+               ephemeris_table_for_range())
+        profile_cusps: Optional dict of {profile_key: house_cusp_index()} adding
+                       house placements and ingresses (see iter_profile_timeline_events())
+
+    Returns:
+        dict: {profile_key: List[dict]} with events sorted by exact time (see
+              timeline_event())
+    """
+    events = {profile_key: [] for profile_key in profile_positions}
+    for profile_key, event in iter_profile_timeline_events(
+            profile_positions, start_jd, end_jd, aspect_angles=aspect_angles, table=table,
+            profile_cusps=profile_cusps):
+        events[profile_key].append(event)
+    return events
+
+
+def iter_profile_timeline_events(profile_positions, start_jd, end_jd, aspect_angles=None,
+                                 table=None, chunk_days=TIMELINE_CHUNK_DAYS, profile_cusps=None):
+    """
+    Stream exact transit-to-natal aspect hits for several natal charts, in time order.
+
+    Reads transit longitudes and speeds from a dense daily ephemeris table. The
+    natal points of every profile, shifted by every aspect offset, are stacked
+    into one longitude-sorted target list, so each table row is read once and
+    only checks the arc it swept, however many charts are matched. The residual
+    wrap_degrees(transit_lon - target_lon) is scanned for sign changes row by
+    row and each bracket is solved on the row's cubic Hermite interpolant to an
+    exact UT timestamp. Retrograde passes produce one event per crossing, and
+    fast Moon aspects are included.
+
+    The range is walked in windows of chunk_days. Consecutive windows share their
+    boundary row, so a crossing that straddles a boundary is bracketed by the
+    next window, and a hit landing exactly on a boundary belongs to the later
+    window only. Events are yielded as each window is solved; memory use depends
+    on the window, not the length of the range.
+
+    With profile_cusps, a profile's natal house cusps join the target list, so
+    each cusp crossing comes out as a house ingress event (house_ingress_event())
+    from the same scan, and every aspect event gains the natal house of the
+    transit planet, placed at its exact longitude with place_in_houses().
+
+    Args:
+        profile_positions: dict of {profile_key: {natal_point_name: abs_longitude}}
+        start_jd: Range start (UT Julian Day)
+        end_jd: Range end (UT Julian Day)
+        aspect_angles: dict of {aspect_name: angle}, defaults to the aspects in
+                       TRANSIT_DEFAULT_ORBS
+        table: Ephemeris table covering the range (default: per window, see
+               ephemeris_table_for_range())
+        chunk_days: Window length in days
+        profile_cusps: Optional dict of {profile_key: house_cusp_index()} for the
+                       profiles that get house placements and ingresses
+
+    Yields:
+        tuple: (profile_key, event dict from timeline_event() or house_ingress_event())
+    """
+    if aspect_angles is None:
+        aspect_angles = {ao['name']: SARC_ASPECT_ANGLES[ao['name']] for ao in TRANSIT_DEFAULT_ORBS}
+    profile_cusps = profile_cusps or {}
+
+    targets = [
+        (profile_key, natal_name, aspect_name, (natal_lon + offset) % 360)
+        for profile_key, natal_positions in profile_positions.items()
+        for natal_name, natal_lon in natal_positions.items()
+        for aspect_name, angle in aspect_angles.items()
+        for offset in aspect_target_offsets(angle)
+    ]
+    # Cusp targets carry the number of the house the cusp opens
+    for profile_key, (ordered, first) in profile_cusps.items():
+        targets += [(profile_key, (first + j) % 12 + 1, HOUSE_INGRESS, cusp) for j, cusp in enumerate(ordered)]
+    targets.sort(key=lambda t: t[3])
+    target_lons = [t[3] for t in targets]
+
+    chunk_start = start_jd
+    while True:
+        chunk_end = min(chunk_start + chunk_days, end_jd)
+        last_chunk = chunk_end >= end_jd
+        chunk_table = table if table is not None else ephemeris_table_for_range(chunk_start, chunk_end)
+        hits = [
+            hit for hit in scan_timeline_hits(targets, target_lons, chunk_table, chunk_start, chunk_end)
+            if last_chunk or hit[0] < chunk_end
+        ]
+        hits.sort(key=lambda h: h[0])
+        for hit_jd, profile_key, planet_name, aspect_name, natal_name, retrograde, target_lon in hits:
+            if aspect_name == HOUSE_INGRESS:
+                # Moving backwards over a cusp re-enters the house before it
+                house = (natal_name - 2) % 12 + 1 if retrograde else natal_name
+                yield profile_key, house_ingress_event(hit_jd, planet_name, house, retrograde)
+                continue
+            event = timeline_event(hit_jd, planet_name, aspect_name, natal_name, retrograde)
+            if profile_key in profile_cusps:
+                event['transit_house'] = place_in_houses(profile_cusps[profile_key], [target_lon])[0]
+            yield profile_key, event
+        if last_chunk:
+            return
+        chunk_start = chunk_end
+
+
+def scan_timeline_hits(targets, target_lons, table, start_jd, end_jd):
+    """
+    Solve every target crossing within [start_jd, end_jd] from an ephemeris table.
+
+    Args:
+        targets: Longitude-sorted list of (profile_key, natal_name, aspect_name, target_lon)
+        target_lons: The target_lon column of targets (for bisect)
+        table: Ephemeris table whose rows cover the range
+        start_jd: Range start (UT Julian Day)
+        end_jd: Range end (UT Julian Day)
+
+    Returns:
+        List[tuple]: Unsorted (hit_jd, profile_key, transit_planet, aspect_name,
+                     natal_name, retrograde, target_lon) hits
+    """
+    data = table['data']
+    step = table['step']
+    n_planets = len(table['planets'])
+    row_width = n_planets * EPHEMERIS_TABLE_FIELDS
+    first_row = max(0, int((start_jd - table['start_jd']) // step))
+    last_row = min(table['days'] - 1, math.ceil((end_jd - table['start_jd']) / step))
+
+    hits = []
+    for p, planet_name in enumerate(table['planets']):
+        idx = first_row * row_width + p * EPHEMERIS_TABLE_FIELDS
+        lon_prev, speed_prev = data[idx], data[idx + 1]
+        for row in range(first_row + 1, last_row + 1):
+            idx += row_width
+            lon_curr, speed_curr = data[idx], data[idx + 1]
+            swept = wrap_degrees(lon_curr - lon_prev)
+            lo = (lon_prev if swept >= 0 else lon_curr) % 360
+            hi = lo + abs(swept)
+            candidates = range(bisect_left(target_lons, lo), bisect_right(target_lons, hi))
+            if hi >= 360:
+                candidates = list(candidates) + list(range(0, bisect_right(target_lons, hi - 360)))
+            for t in candidates:
+                profile_key, natal_name, aspect_name, target_lon = targets[t]
+                g_prev = wrap_degrees(lon_prev - target_lon)
+                g_curr = g_prev + swept
+                # Sign change near zero (not the +/-180 wrap) brackets an exact hit
+                if (g_prev < 0) != (g_curr < 0) and abs(g_prev) < 90 and abs(g_curr) < 90:
+                    u, slope = hermite_crossing(g_prev, g_curr, speed_prev * step, speed_curr * step)
+                    hit_jd = table['start_jd'] + (row - 1 + u) * step
+                    if start_jd <= hit_jd <= end_jd:
+                        hits.append((hit_jd, profile_key, planet_name, aspect_name, natal_name, slope < 0,
+                                     target_lon))
+            lon_prev, speed_prev = lon_curr, speed_curr
+    return hits
+
+
+def timeline_event(hit_jd, planet_name, aspect_name, natal_name, retrograde):
+    """
+    Format one exact timeline hit.
+
+    Args:
+        hit_jd: UT Julian Day of the exact hit
+        planet_name: Name of the transiting planet
+        aspect_name: Aspect type
+        natal_name: Name of the natal planet
+        retrograde: Whether the transiting planet is retrograde at the hit
+
+    Returns:
+        dict: Event with:
+            - date (str): YYYY-MM-DD (UT) of the exact hit
+            - exact_utc (str): ISO timestamp of the exact hit (UT, second precision)
+            - transit_planet (str): Name of the transiting planet
+            - aspect (str): Aspect type (conjunction, opposition, etc.)
+            - natal_planet (str): Name of the natal planet
+            - orb_at_hit (float): Orb at the solved time (0.0: every hit is exact)
+            - transit_retrograde (bool): Whether the transiting planet is retrograde
+    """
+    exact_dt = jd_to_utc_datetime(hit_jd)
+    return {
+        'date': exact_dt.strftime("%Y-%m-%d"),
+        'exact_utc': exact_dt.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        'transit_planet': planet_name,
+        'aspect': aspect_name,
+        'natal_planet': natal_name,
+        'orb_at_hit': 0.0,
+        'transit_retrograde': retrograde,
+    }
+
+
+def house_ingress_event(hit_jd, planet_name, house, retrograde):
+    """
+    Format one transit house ingress (a transit planet crossing a natal house cusp).
+
+    Args:
+        hit_jd: UT Julian Day of the cusp crossing
+        planet_name: Name of the transiting planet
+        house: Natal house (1-12) the planet enters
+        retrograde: Whether the planet crosses moving backwards
+
+    Returns:
+        dict: Event with:
+            - date (str): YYYY-MM-DD (UT) of the crossing
+            - exact_utc (str): ISO timestamp of the crossing (UT, second precision)
+            - transit_planet (str): Name of the transiting planet
+            - event (str): 'house_ingress'
+            - natal_house (int): Natal house entered
+            - transit_retrograde (bool): Whether the transiting planet is retrograde
+    """
+    exact_dt = jd_to_utc_datetime(hit_jd)
+    return {
+        'date': exact_dt.strftime("%Y-%m-%d"),
+        'exact_utc': exact_dt.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        'transit_planet': planet_name,
+        'event': HOUSE_INGRESS,
+        'natal_house': house,
+        'transit_retrograde': retrograde,
+    }
+
+
+def build_timeline_json(events, natal_data, slug, start_dt, end_dt, houses=False):
+    """
+    Assemble complete timeline JSON dict from exact hit events and natal data.
+
+    Args:
+        events: List of event dicts from build_timeline_events()
+        natal_data: dict — full parsed chart.json from the natal profile
+        slug: str — natal profile slug
+        start_dt: datetime — timeline start (UTC noon)
+        end_dt: datetime — timeline end (UTC noon)
+        houses: Whether events include house placements and ingresses (--houses)
+
+    Returns:
+        dict: Timeline JSON with 'meta' and 'events' sections
+    """
+    natal_meta = natal_data.get('meta', {})
+    natal_name = natal_meta.get('name', slug)
+
+    range_days = (end_dt - start_dt).days
+
+    orbs_used = {ao['name']: ao['orb'] for ao in TRANSIT_DEFAULT_ORBS}
+
+    meta = {
+        "natal_name": natal_name,
+        "natal_slug": slug,
+        "start_date": start_dt.strftime("%Y-%m-%d"),
+        "end_date": end_dt.strftime("%Y-%m-%d"),
+        "range_days": range_days,
+        "chart_type": "transit_timeline",
+        "calculated_at": datetime.now(timezone.utc).isoformat(),
+        "orbs_used": orbs_used,
+        "event_count": len(events),
+        "sampling_note": "Exact hit times (UT, ~1 second) solved from a daily Swiss Ephemeris table; "
+                         "includes Moon aspects. Each retrograde pass is a separate event.",
+    }
+    if houses:
+        meta["house_ingresses"] = True
+
+    return {
+        "meta": meta,
+        "events": events,
+    }
+
+
+def timeline_date_range(args):
+    """
+    Resolve the timeline date range from --range or --start/--end.
+
+    Args:
+        args: Parsed argparse Namespace with .range, .start, .end
+
+    Returns:
+        tuple: (start_dt, end_dt) as UTC-noon datetimes
+
+    Raises:
+        ValueError: If the custom range is incomplete or reversed
+    """
+    if args.start and args.end:
+        # Custom range (TRAN-07)
+        start_dt = args.start.replace(hour=12, minute=0, second=0, microsecond=0)
+        end_dt = args.end.replace(hour=12, minute=0, second=0, microsecond=0)
+        if start_dt >= end_dt:
+            raise ValueError("--start must be before --end")
+        return start_dt, end_dt
+    if args.start or args.end:
+        raise ValueError("both --start and --end required for custom range")
+    # Preset range (TRAN-06)
+    return parse_preset_range(args.range)
+
+
+def build_profile_timelines(profiles, start_dt, end_dt, houses=False):
+    """
+    Build timeline JSON for several natal profiles over one shared date range.
+
+    The ephemeris table is read once and every chart is matched against it in the
+    same scan (see build_profile_timeline_events()).
+
+    Args:
+        profiles: dict of {slug: parsed chart.json data}
+        start_dt: datetime — timeline start (UTC noon)
+        end_dt: datetime — timeline end (UTC noon)
+        houses: Add natal house placements and house ingresses (--houses)
+
+    Returns:
+        dict: {slug: timeline dict from build_timeline_json()}, in input order
+    """
+    # Natal longitudes straight from chart.json (no natal subject needed)
+    profile_positions = {
+        slug: {p['name']: p['abs_position'] for p in natal_data['planets'] if p['name'] in MAJOR_PLANETS}
+        for slug, natal_data in profiles.items()
+    }
+
+    # Solve exact hits (geocentric, location-independent) and assemble output
+    start_jd = swe.julday(start_dt.year, start_dt.month, start_dt.day, 12.0)
+    end_jd = swe.julday(end_dt.year, end_dt.month, end_dt.day, 12.0)
+    profile_cusps = profile_cusp_indexes(profiles) if houses else None
+    events = build_profile_timeline_events(profile_positions, start_jd, end_jd, profile_cusps=profile_cusps)
+    return {
+        slug: build_timeline_json(events[slug], natal_data, slug, start_dt, end_dt, houses=houses)
+        for slug, natal_data in profiles.items()
+    }
+
+
+def profile_cusp_indexes(profiles):
+    """
+    Precompute the natal cusp array of every profile for timeline house placement.
+
+    Args:
+        profiles: dict of {slug: parsed chart.json data}
+
+    Returns:
+        dict: {slug: house_cusp_index()}
+    """
+    return {slug: house_cusp_index(natal_house_cusps(natal_data)) for slug, natal_data in profiles.items()}
+
+
+def stream_timelines(profiles, start_dt, end_dt, outstream=None, houses=False):
+    """
+    Write timeline events for several natal profiles as NDJSON while they are found.
+
+    One JSON object per line: the event fields from timeline_event() preceded by
+    natal_slug. Events come out in time order across all profiles, one window at
+    a time, so arbitrarily long ranges (e.g. 1900-2100) stream with flat memory.
+
+    Args:
+        profiles: dict of {slug: parsed chart.json data}
+        start_dt: datetime — timeline start (UTC noon)
+        end_dt: datetime — timeline end (UTC noon)
+        outstream: Text stream to write to (default: sys.stdout)
+        houses: Add natal house placements and house ingresses (--houses)
+
+    Returns:
+        int: Number of events written
+    """
+    outstream = outstream if outstream is not None else sys.stdout
+    profile_positions = {
+        slug: {p['name']: p['abs_position'] for p in natal_data['planets'] if p['name'] in MAJOR_PLANETS}
+        for slug, natal_data in profiles.items()
+    }
+    start_jd = swe.julday(start_dt.year, start_dt.month, start_dt.day, 12.0)
+    end_jd = swe.julday(end_dt.year, end_dt.month, end_dt.day, 12.0)
+
+    profile_cusps = profile_cusp_indexes(profiles) if houses else None
+
+    count = 0
+    for slug, event in iter_profile_timeline_events(profile_positions, start_jd, end_jd,
+                                                    profile_cusps=profile_cusps):
+        outstream.write(json.dumps({'natal_slug': slug, **event}, ensure_ascii=False) + "\n")
+        count += 1
+    outstream.flush()
+    return count
+
+
+def requested_slugs(slugs, include_all, flag):
+    """
+    Resolve the profile slugs of a multi-profile flag (and --all).
+
+    Args:
+        slugs: Slugs given with the flag (list, None if absent)
+        include_all: True to add every saved profile (--all)
+        flag: Flag name for the error message (e.g. '--timeline')
+
+    Returns:
+        List[str]: Slugs in request order, duplicates removed
+
+    Raises:
+        ValueError: If no profile was named and --all was not given
+    """
+    slugs = list(slugs or [])
+    if include_all:
+        slugs += profile_slugs()
+    if not slugs:
+        raise ValueError(f"{flag} needs at least one SLUG (or --all)")
+    return list(dict.fromkeys(slugs))
+
+
+def timeline_slugs(args):
+    """
+    Resolve the profile slugs requested with --timeline (and --all).
+
+    Args:
+        args: Parsed argparse Namespace with .timeline (list of slugs) and .all
+
+    Returns:
+        List[str]: Slugs in request order, duplicates removed
+
+    Raises:
+        ValueError: If no profile was named and --all was not given
+    """
+    return requested_slugs(args.timeline, getattr(args, 'all', False), '--timeline')
+
+
+def compute_timeline(args):
+    """
+    Compute the transit timeline dict for an existing natal profile.
+
+    Loads the natal profile identified by args.timeline, determines the date range
+    with timeline_date_range(), and solves exact transit hit times with
+    build_profile_timelines().
+
+    Args:
+        args: Parsed argparse Namespace with .timeline (one slug), .range, .start, .end
+
+    Returns:
+        dict: Timeline JSON from build_timeline_json()
+
+    Raises:
+        FileNotFoundError: If the profile does not exist
+        ValueError: If the requested range is invalid or more than one profile is given
+    """
+    slugs = timeline_slugs(args)
+    if len(slugs) != 1:
+        raise ValueError("compute_timeline() takes exactly one profile")
+    slug = slugs[0]
+    _natal_subject, natal_data = load_natal_profile(slug, build_subject=False)
+    start_dt, end_dt = timeline_date_range(args)
+    return build_profile_timelines({slug: natal_data}, start_dt, end_dt, houses=args.houses)[slug]
+
+
+def calculate_timeline(args):
+    """
+    Orchestrate transit timeline calculation for one or more natal profiles.
+
+    A single profile prints its timeline JSON to stdout as before. Several slugs
+    (or --all) share one ephemeris pass and print one compact timeline JSON per
+    profile per line; profiles that fail to load are reported on stderr and
+    skipped. Profiles with a snapshot cache hit are not loaded or scanned; the
+    rest share the ephemeris pass. With --stream, events are written as NDJSON
+    while they are found (see stream_timelines()) instead of being collected
+    into timeline JSON.
+
+    Args:
+        args: Parsed argparse Namespace with .timeline (list of slugs), .all,
+              .range, .start, .end, .stream
+
+    Returns:
+        0 on success, 1 on error (including any profile that failed to load)
+    """
+    try:
+        slugs = timeline_slugs(args)
+        start_dt, end_dt = timeline_date_range(args)
+        if args.stream and args.save:
+            raise ValueError("--save cannot be combined with --stream")
+
+        timelines = {}
+        cache_keys = {}
+        if not args.stream:
+            for slug in slugs:
+                # Keyed as a one-profile query, whatever else was requested alongside it
+                profile_args = argparse.Namespace(**{**vars(args), 'timeline': [slug], 'all': False})
+                cache_keys[slug] = snapshot_cache_key('timeline', slug, profile_args)
+                if cache_keys[slug] is not None:
+                    cached = cache_get('timeline', slug, cache_keys[slug])
+                    if cached is not None:
+                        timelines[slug] = cached
+
+        profiles = {}
+        failed = False
+        for slug in slugs:
+            if slug in timelines:
+                continue
+            try:
+                _natal_subject, profiles[slug] = load_natal_profile(slug, build_subject=False)
+            except (FileNotFoundError, ValueError) as e:
+                print(f"Error: {e}", file=sys.stderr)
+                failed = True
+        if not profiles and not timelines:
+            return 1
+
+        if args.stream:
+            stream_timelines(profiles, start_dt, end_dt, houses=args.houses)
+            return 1 if failed else 0
+
+        if profiles:
+            for slug, timeline_dict in build_profile_timelines(profiles, start_dt, end_dt,
+                                                               houses=args.houses).items():
+                timelines[slug] = timeline_dict
+                if cache_keys.get(slug) is not None:
+                    cache_put('timeline', slug, cache_keys[slug], timeline_dict)
+
+        single = len(slugs) == 1
+        for slug in slugs:
+            if slug not in timelines:
+                continue
+            timeline_dict = timelines[slug]
+            if single:
+                print(json.dumps(timeline_dict, indent=2))
+            else:
+                print(json.dumps(timeline_dict, ensure_ascii=False))
+
+            if args.save:
+                date_str = timeline_dict['meta'].get('start_date', 'unknown')
+                try:
+                    out_path = save_snapshot(CHARTS_DIR / slug, 'timeline', date_str, timeline_dict)
+                    print(f"Snapshot saved: {out_path}", file=sys.stderr)
+                except Exception as e:
+                    print(f"Warning: Could not save snapshot: {e}", file=sys.stderr)
+
+        return 1 if failed else 0
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error calculating timeline: {e}", file=sys.stderr)
+        return 1
+
+
+def compute_progressed_jd(birth_jd, target_jd):
+    """
+    Compute the progressed Julian Day using the day-for-a-year formula.
+
+    Formula: progressed_jd = birth_jd + (target_jd - birth_jd) / 365.25
+
+    The elapsed years between birth and target become elapsed days in the
+    ephemeris (one day of ephemeris time = one year of life). The divisor
+    365.25 is the Julian year — standard in Western tropical astrology.
+
+    Args:
+        birth_jd: Julian Day number of the birth moment (including fractional hour)
+        target_jd: Julian Day number of the target date/moment
+
+    Returns:
+        float: Progressed Julian Day number
+    """
+    return birth_jd + (target_jd - birth_jd) / 365.25
+
+
+def progressed_moment_ut(prog_jd, natal_tz):
+    """
+    Return the UT Julian Day at which a progressed chart is cast.
+
+    The progressed date and time (to the minute) are read as natal local time and
+    converted to UT the way Kerykeion does (pytz), so positions computed directly
+    from this moment match a progressed AstrologicalSubject.
+
+    Args:
+        prog_jd: Progressed Julian Day from compute_progressed_jd()
+        natal_tz: pytz timezone of the natal chart
+
+    Returns:
+        float: UT Julian Day of the progressed chart
+    """
+    py, pm, pd, ph = swe.revjul(prog_jd)
+    local_dt = natal_tz.localize(
+        datetime(int(py), int(pm), int(pd), int(ph), int((ph - int(ph)) * 60)), is_dst=False,
+    )
+    utc_dt = local_dt.astimezone(pytz.utc)
+    return swe.julday(utc_dt.year, utc_dt.month, utc_dt.day, utc_dt.hour + utc_dt.minute / 60.0)
+
+
+def build_monthly_moon(birth_jd, target_year, natal_tz_str, years=1):
+    """
+    Calculate progressed Moon position for each month of target_year onwards.
+
+    Uses the 1st day of each month at UTC noon as the target moment, calculates
+    the progressed JD and takes the Moon directly from swe.calc_ut() at the
+    progressed chart moment (see progressed_moment_ut()). No subject is built,
+    so a full 27-year lunar cycle costs a few hundred ephemeris calls. Sign
+    changes are detected and flagged.
+
+    Args:
+        birth_jd: Julian Day number of the birth moment
+        target_year: Integer year of the first month in the report
+        natal_tz_str: Natal chart timezone string (local time of the progressed moment)
+        years: Number of consecutive years to report (default 1)
+
+    Returns:
+        List[dict]: 12 * years entries with month (YYYY-MM), sign, degree, and
+                    optional sign_change
+    """
+    ensure_ephemeris_path()
+    natal_tz = pytz.timezone(natal_tz_str)
+
+    months = []
+    for year in range(target_year, target_year + years):
+        for month in range(1, 13):
+            prog_jd = compute_progressed_jd(birth_jd, swe.julday(year, month, 1, 12.0))
+            months.append((f"{year}-{month:02d}", progressed_moment_ut(prog_jd, natal_tz)))
+
+    monthly = []
+    prev_sign = None
+    for month_str, moon_jd in months:
+        sign, degree = position_to_sign_degree(swe.calc_ut(moon_jd, swe.MOON, SWE_FLAGS)[0][0])
+
+        entry = {
+            "month": month_str,
+            "sign": sign,
+            "degree": round(degree, 2),
+        }
+        if prev_sign is not None and sign != prev_sign:
+            entry["sign_change"] = f"{prev_sign} -> {sign}"
+
+        monthly.append(entry)
+        prev_sign = sign
+
+    return monthly
+
+
+def build_progressed_json(progressed_subject, natal_subject, natal_data, slug,
+                          target_date_str, target_jd, birth_jd, prog_year=None, moon_years=1):
+    """
+    Assemble complete secondary progressions JSON dict.
+
+    Args:
+        progressed_subject: AstrologicalSubjectModel for the progressed date
+        natal_subject: AstrologicalSubjectModel for the natal chart
+        natal_data: dict — full parsed chart.json from natal profile
+        slug: str — natal profile slug
+        target_date_str: str — YYYY-MM-DD target date (may be None for age-based)
+        target_jd: float — Julian Day number of target date
+        birth_jd: float — Julian Day number of birth moment
+        prog_year: int or None — year for monthly Moon report (defaults to target year)
+        moon_years: int — number of years covered by the monthly Moon report
+
+    Returns:
+        dict: Complete progressions JSON with meta, progressed_planets, progressed_angles,
+              progressed_aspects, monthly_moon, and distribution_shift sections
+    """
+    natal_meta = natal_data.get('meta', {})
+    natal_name = natal_meta.get('name', slug)
+    location = natal_meta.get('location', {})
+    natal_tz_str = location['timezone']
+
+    # Compute progressed date parts
+    prog_jd = compute_progressed_jd(birth_jd, target_jd)
+    py, pm, pd, ph = swe.revjul(prog_jd)
+    prog_hour = int(ph)
+    prog_minute = int((ph - prog_hour) * 60)
+
+    # Compute target_date_str if not provided (age-based mode)
+    if target_date_str is None:
+        ty, tm, td, th = swe.revjul(target_jd)
+        target_date_str = f"{int(ty):04d}-{int(tm):02d}-{int(td):02d}"
+
+    # Compute age at target
+    age_at_target = int((target_jd - birth_jd) / 365.25)
+
+    # Determine prog_year for monthly Moon report
+    if prog_year is None:
+        # Default: year portion of target date
+        ty, tm, td, th = swe.revjul(target_jd)
+        prog_year = int(ty)
+
+    # Build orbs_used dict for meta
+    orbs_used = {ao['name']: ao['orb'] for ao in PROG_DEFAULT_ORBS}
+
+    # META section
+    meta = {
+        "natal_name": natal_name,
+        "natal_slug": slug,
+        "target_date": target_date_str,
+        "progressed_date": f"{int(py):04d}-{int(pm):02d}-{int(pd):02d}",
+        "progressed_time": f"{prog_hour:02d}:{prog_minute:02d}",
+        "age_at_target": age_at_target,
+        "chart_type": "secondary_progressions",
+        "calculated_at": datetime.now(timezone.utc).isoformat(),
+        "orbs_used": orbs_used,
+        "prog_year": prog_year,
+    }
+    if moon_years > 1:
+        meta["moon_years"] = moon_years
+
+    # PROGRESSED PLANETS section (10 planets)
+    planet_attrs = [
+        ('Sun', progressed_subject.sun),
+        ('Moon', progressed_subject.moon),
+        ('Mercury', progressed_subject.mercury),
+        ('Venus', progressed_subject.venus),
+        ('Mars', progressed_subject.mars),
+        ('Jupiter', progressed_subject.jupiter),
+        ('Saturn', progressed_subject.saturn),
+        ('Uranus', progressed_subject.uranus),
+        ('Neptune', progressed_subject.neptune),
+        ('Pluto', progressed_subject.pluto),
+    ]
+
+    progressed_planets = []
+    for name, planet in planet_attrs:
+        progressed_planets.append({
+            "name": name,
+            "sign": planet.sign,
+            "degree": round(planet.position % 30, 2),
+            "abs_position": round(planet.abs_pos, 2),
+            "retrograde": getattr(planet, 'retrograde', False),
+        })
+
+    # PROGRESSED ANGLES section (ASC and MC)
+    progressed_angles = [
+        {
+            "name": "ASC",
+            "sign": progressed_subject.ascendant.sign,
+            "degree": round(progressed_subject.ascendant.position % 30, 2),
+            "abs_position": round(progressed_subject.ascendant.abs_pos, 2),
+        },
+        {
+            "name": "MC",
+            "sign": progressed_subject.medium_coeli.sign,
+            "degree": round(progressed_subject.medium_coeli.position % 30, 2),
+            "abs_position": round(progressed_subject.medium_coeli.abs_pos, 2),
+        },
+    ]
+
+    # PROGRESSED ASPECTS section (progressed-to-natal, 1-degree orb)
+    progressed_aspects = build_progressed_natal_aspects(
+        subject_points(progressed_subject, MAJOR_PLANETS),
+        subject_points(natal_subject, MAJOR_PLANETS),
+    )
+
+    # MONTHLY MOON section
+    monthly_moon = build_monthly_moon(birth_jd, prog_year, natal_tz_str, years=moon_years)
+
+    # DISTRIBUTION SHIFT section
+    def compute_distributions_for_subject(subject):
+        """Compute element and modality counts for 10 planets + ASC."""
+        planet_bodies = [
+            ('Sun', subject.sun), ('Moon', subject.moon),
+            ('Mercury', subject.mercury), ('Venus', subject.venus),
+            ('Mars', subject.mars), ('Jupiter', subject.jupiter),
+            ('Saturn', subject.saturn), ('Uranus', subject.uranus),
+            ('Neptune', subject.neptune), ('Pluto', subject.pluto),
+        ]
+        placements = planet_bodies + [('ASC', subject.ascendant)]
+        elem = {'Fire': 0, 'Earth': 0, 'Air': 0, 'Water': 0}
+        mod = {'Cardinal': 0, 'Fixed': 0, 'Mutable': 0}
+        for name, body in placements:
+            e = ELEMENT_MAP.get(body.sign)
+            m = MODALITY_MAP.get(body.sign)
+            if e:
+                elem[e] += 1
+            if m:
+                mod[m] += 1
+        return elem, mod
+
+    natal_elem, natal_mod = compute_distributions_for_subject(natal_subject)
+    prog_elem, prog_mod = compute_distributions_for_subject(progressed_subject)
+
+    distribution_shift = {
+        "elements": {
+            element: {
+                "natal": natal_elem[element],
+                "progressed": prog_elem[element],
+                "delta": prog_elem[element] - natal_elem[element],
+            }
+            for element in ['Fire', 'Earth', 'Air', 'Water']
+        },
+        "modalities": {
+            modality: {
+                "natal": natal_mod[modality],
+                "progressed": prog_mod[modality],
+                "delta": prog_mod[modality] - natal_mod[modality],
+            }
+            for modality in ['Cardinal', 'Fixed', 'Mutable']
+        }
+    }
+
+    return {
+        "meta": meta,
+        "progressed_planets": progressed_planets,
+        "progressed_angles": progressed_angles,
+        "progressed_aspects": progressed_aspects,
+        "monthly_moon": monthly_moon,
+        "distribution_shift": distribution_shift,
+    }
+
+
+def build_progressed_natal_aspects(progressed_points, natal_points, orbs=None):
+    """
+    Format progressed-to-natal aspects (natal chart fixed) from find_aspects().
+
+    Args:
+        progressed_points: dict of {name: (longitude, speed)} in output order
+        natal_points: dict of {name: (longitude, speed)} in output order
+        orbs: List of {'name', 'orb'} dicts, defaults to PROG_DEFAULT_ORBS
+
+    Returns:
+        List[dict]: progressed_aspects entries for progressions JSON
+    """
+    progressed_aspects = []
+    for asp in find_aspects(progressed_points, natal_points,
+                            orbs=orbs if orbs is not None else PROG_DEFAULT_ORBS, second_fixed=True):
+        progressed_aspects.append({
+            "progressed_planet": asp['p1'],
+            "natal_planet": asp['p2'],
+            "aspect": asp['aspect'],
+            "orb": round(asp['orb'], 2),
+            "applying": asp['movement'] == 'Applying',
+            "movement": asp['movement'],
+        })
+    return progressed_aspects
+
+
+def progression_series_targets(birth_jd, start_bound, end_bound, step):
+    """
+    Expand a --prog-range into the target Julian Days of each step.
+
+    A date START steps through calendar years or months at UTC noon, so every
+    entry matches --target-date for that date; an age START steps in Julian
+    years (or twelfths) from the birth moment, matching --age.
+
+    Args:
+        birth_jd: Julian Day number of the birth moment
+        start_bound: ('age', int) or ('date', datetime) from valid_prog_bound()
+        end_bound: ('age', int) or ('date', datetime) from valid_prog_bound()
+        step: Key of PROG_SERIES_STEP_DAYS
+
+    Returns:
+        List[float]: Target Julian Days from start to end inclusive
+
+    Raises:
+        ValueError: If the range is empty or reversed
+    """
+    def bound_jd(bound):
+        kind, value = bound
+        if kind == 'age':
+            return birth_jd + value * 365.25
+        return swe.julday(value.year, value.month, value.day, 12.0)
+
+    start_jd, end_jd = bound_jd(start_bound), bound_jd(end_bound)
+    if start_jd >= end_jd:
+        raise ValueError("--prog-range START must be before END")
+
+    if start_bound[0] == 'age':
+        step_days = PROG_SERIES_STEP_DAYS[step]
+        count = int((end_jd - start_jd) / step_days + 1e-9) + 1
+        return [start_jd + i * step_days for i in range(count)]
+
+    start_dt = start_bound[1]
+    months_per_step = 12 if step == 'year' else 1
+    targets = []
+    while True:
+        months = start_dt.month - 1 + len(targets) * months_per_step
+        year, month = start_dt.year + months // 12, months % 12 + 1
+        day = min(start_dt.day, calendar.monthrange(year, month)[1])
+        target_jd = swe.julday(year, month, day, 12.0)
+        if target_jd > end_jd:
+            return targets
+        targets.append(target_jd)
+
+
+def build_progression_series(natal_subject, natal_data, slug, birth_jd, target_jds, step):
+    """
+    Assemble a secondary progressions time series from one ephemeris pass.
+
+    A century of life is only ~100 ephemeris days, so the progressed planets for
+    every step are interpolated from one small daily ephemeris table instead of
+    building a progressed subject per step. Angles come from swe.houses() at the
+    progressed chart moment (as Kerykeion computes them), and progressed-to-natal
+    aspects from build_progressed_natal_aspects().
+
+    Args:
+        natal_subject: AstrologicalSubjectModel for the natal chart
+        natal_data: dict — full parsed chart.json from natal profile
+        slug: str — natal profile slug
+        birth_jd: float — Julian Day number of birth moment
+        target_jds: List[float] from progression_series_targets()
+        step: str — step name for meta
+
+    Returns:
+        dict: Progression series JSON with 'meta' and 'series' sections
+    """
+    natal_meta = natal_data.get('meta', {})
+    location = natal_meta.get('location', {})
+    natal_lat = float(location['latitude'])
+    natal_lng = float(location['longitude'])
+    natal_tz = pytz.timezone(location['timezone'])
+
+    prog_jds = [compute_progressed_jd(birth_jd, t) for t in target_jds]
+    moments = [progressed_moment_ut(prog_jd, natal_tz) for prog_jd in prog_jds]
+
+    table_start = math.floor(min(moments)) - 0.5
+    table = build_ephemeris_table(table_start, math.ceil(max(moments) - table_start) + 2)
+    planet_index = {name: i for i, name in enumerate(table['planets'])}
+
+    natal_points = subject_points(natal_subject, MAJOR_PLANETS)
+
+    series = []
+    for target_jd, prog_jd, moment in zip(target_jds, prog_jds, moments):
+        py, pm, pd, ph = swe.revjul(prog_jd)
+        ty, tm, td, _th = swe.revjul(target_jd)
+
+        points = {name: table_position(table, planet_index[name], moment) for name in MAJOR_PLANETS}
+        progressed_planets = []
+        for name, (lon, speed) in points.items():
+            sign, degree = position_to_sign_degree(lon)
+            progressed_planets.append({
+                "name": name,
+                "sign": sign,
+                "degree": round(degree, 2),
+                "abs_position": round(lon, 2),
+                "retrograde": speed < 0,
+            })
+
+        _cusps, ascmc = swe.houses(moment, natal_lat, natal_lng, b'P')
+        progressed_angles = []
+        for name, lon in (('ASC', ascmc[0]), ('MC', ascmc[1])):
+            sign, degree = position_to_sign_degree(lon)
+            progressed_angles.append({
+                "name": name,
+                "sign": sign,
+                "degree": round(degree, 2),
+                "abs_position": round(lon, 2),
+            })
+
+        series.append({
+            "target_date": f"{int(ty):04d}-{int(tm):02d}-{int(td):02d}",
+            "age": round((target_jd - birth_jd) / 365.25, 2),
+            "progressed_date": f"{int(py):04d}-{int(pm):02d}-{int(pd):02d}",
+            "progressed_time": f"{int(ph):02d}:{int((ph - int(ph)) * 60):02d}",
+            "progressed_planets": progressed_planets,
+            "progressed_angles": progressed_angles,
+            "progressed_aspects": build_progressed_natal_aspects(points, natal_points),
+        })
+
+    meta = {
+        "natal_name": natal_meta.get('name', slug),
+        "natal_slug": slug,
+        "start_date": series[0]["target_date"],
+        "end_date": series[-1]["target_date"],
+        "step": step,
+        "steps": len(series),
+        "chart_type": "secondary_progressions_series",
+        "calculated_at": datetime.now(timezone.utc).isoformat(),
+        "orbs_used": {ao['name']: ao['orb'] for ao in PROG_DEFAULT_ORBS},
+    }
+
+    return {
+        "meta": meta,
+        "series": series,
+    }
+
+
+def compute_progressions(args):
+    """
+    Compute the secondary progressions dict for an existing natal profile.
+
+    Loads the natal profile identified by args.progressions, computes the progressed
+    Julian Day using the day-for-a-year formula and creates a progressed subject at
+    the natal location. With --prog-range, returns a time series from
+    build_progression_series() instead.
+
+    Args:
+        args: Parsed argparse Namespace with .progressions (slug), .target_date,
+              .age (int or None), .prog_year (int or None), .moon_years,
+              .prog_range (pair of bounds or None) and .step
+
+    Returns:
+        dict: Progressions JSON from build_progressed_json() or build_progression_series()
+
+    Raises:
+        FileNotFoundError: If the profile does not exist
+        ValueError: If both --age and --target-date are given, --moon-years < 1,
+                    or --prog-range is invalid or combined with a single target
+    """
+    # Load natal chart profile
+    natal_subject, natal_data = load_natal_profile(args.progressions)
+
+    natal_meta = natal_data.get('meta', {})
+    location = natal_meta.get('location', {})
+    natal_lat = float(location['latitude'])
+    natal_lng = float(location['longitude'])
+    natal_tz = location['timezone']
+
+    # Extract birth date/time and compute birth JD
+    birth_date_str = natal_meta['birth_date']
+    birth_time_str = natal_meta['birth_time']
+    birth_dt = datetime.strptime(birth_date_str + ' ' + birth_time_str, "%Y-%m-%d %H:%M")
+    birth_jd = swe.julday(birth_dt.year, birth_dt.month, birth_dt.day,
+                          birth_dt.hour + birth_dt.minute / 60.0)
+
+    # Validate: cannot use both --age and --target-date
+    if args.age is not None and args.target_date is not None:
+        raise ValueError("Cannot use both --age and --target-date")
+    if args.moon_years < 1:
+        raise ValueError("--moon-years must be at least 1")
+
+    # Time series mode: one ephemeris pass for every step of --prog-range
+    if args.prog_range is not None:
+        if args.age is not None or args.target_date is not None:
+            raise ValueError("--prog-range cannot be combined with --age or --target-date")
+        start_bound, end_bound = args.prog_range
+        target_jds = progression_series_targets(birth_jd, start_bound, end_bound, args.step)
+        return build_progression_series(
+            natal_subject, natal_data, args.progressions, birth_jd, target_jds, args.step,
+        )
+
+    # Determine target JD and target_date_str
+    if args.age is not None:
+        target_jd = birth_jd + args.age * 365.25
+        target_date_str = None  # will be computed in build_progressed_json
+    elif args.target_date is not None:
+        target_jd = swe.julday(args.target_date.year, args.target_date.month,
+                               args.target_date.day, 12.0)
+        target_date_str = args.target_date.strftime("%Y-%m-%d")
+    else:
+        # Default: today UTC noon
+        today = datetime.now(timezone.utc)
+        target_jd = swe.julday(today.year, today.month, today.day, 12.0)
+        target_date_str = today.strftime("%Y-%m-%d")
+
+    # Compute progressed JD
+    prog_jd = compute_progressed_jd(birth_jd, target_jd)
+    py, pm, pd, ph = swe.revjul(prog_jd)
+    prog_hour = int(ph)
+    prog_minute = int((ph - prog_hour) * 60)
+
+    # Create progressed subject using natal location (CRITICAL: not lat=0.0, lng=0.0)
+    from kerykeion import AstrologicalSubjectFactory
+    progressed_subject = AstrologicalSubjectFactory.from_birth_data(
+        name='Progressed',
+        year=int(py), month=int(pm), day=int(pd),
+        hour=prog_hour, minute=prog_minute,
+        lat=natal_lat, lng=natal_lng, tz_str=natal_tz,
+        online=False, houses_system_identifier='P',
+    )
+
+    # Determine prog_year for monthly Moon report
+    if args.prog_year is not None:
+        prog_year = args.prog_year
+    elif args.age is not None:
+        prog_year = birth_dt.year + args.age
+    elif args.target_date is not None:
+        prog_year = args.target_date.year
+    else:
+        prog_year = datetime.now(timezone.utc).year
+
+    # Assemble progressions JSON
+    return build_progressed_json(
+        progressed_subject, natal_subject, natal_data,
+        args.progressions, target_date_str, target_jd, birth_jd,
+        prog_year=prog_year, moon_years=args.moon_years,
+    )
+
+
+def calculate_progressions(args):
+    """
+    Orchestrate secondary progressions calculation for an existing natal profile.
+
+    Computes the progressions with compute_progressions() (through the snapshot
+    cache) and prints the complete progressions JSON to stdout.
+
+    Args:
+        args: Parsed argparse Namespace with .progressions (slug), .target_date,
+              .age (int or None), and .prog_year (int or None)
+
+    Returns:
+        0 on success, 1 on error
+    """
+    try:
+        prog_dict, _hit = cached_compute('progressions', args.progressions, compute_progressions, args)
+        print(json.dumps(prog_dict, indent=2))
+
+        if args.save:
+            if args.prog_range is not None:
+                mode = 'progressions-series'
+                date_str = prog_dict['meta'].get('start_date', 'unknown')
+            else:
+                mode = 'progressions'
+                date_str = prog_dict['meta'].get('target_date', 'unknown')
+            try:
+                out_path = save_snapshot(CHARTS_DIR / args.progressions, mode, date_str, prog_dict)
+                print(f"Snapshot saved: {out_path}", file=sys.stderr)
+            except Exception as e:
+                print(f"Warning: Could not save snapshot: {e}", file=sys.stderr)
+
+        return 0
+
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error calculating progressions: {e}", file=sys.stderr)
+        return 1
+
+
+def compute_solar_arc(birth_jd, target_jd, natal_sun_lon, method='true'):
+    """
+    Compute the solar arc for a target date.
+
+    Two methods supported:
+    - 'true': actual distance the progressed Sun has traveled (swe.calc_ut)
+    - 'mean': Naibod constant rate (0.98564733 degrees/year)
+
+    Args:
+        birth_jd: Julian Day number of the birth moment
+        target_jd: Julian Day number of the target date
+        natal_sun_lon: Natal Sun absolute longitude (from chart.json abs_position)
+        method: 'true' (default) or 'mean'
+
+    Returns:
+        float: Solar arc in degrees (0-360)
+    """
+    elapsed_years = (target_jd - birth_jd) / 365.25
+    if method == 'mean':
+        return (elapsed_years * NAIBOD_ARC) % 360
+    # True arc: progressed Sun longitude - natal Sun longitude
+    # Reuse compute_progressed_jd() from Phase 9 for consistent JD arithmetic
+    progressed_jd = compute_progressed_jd(birth_jd, target_jd)
+    ensure_ephemeris_path()
+    prog_sun_data, _ = swe.calc_ut(progressed_jd, swe.SUN)
+    prog_sun_lon = prog_sun_data[0]
+    return (prog_sun_lon - natal_sun_lon) % 360
+
+
+def angular_distance(lon1, lon2):
+    """
+    Compute the smallest angular distance between two ecliptic longitudes.
+
+    Args:
+        lon1: First longitude in degrees (0-360)
+        lon2: Second longitude in degrees (0-360)
+
+    Returns:
+        float: Angular distance in degrees (0-180)
+    """
+    diff = abs(lon1 - lon2) % 360
+    return 360 - diff if diff > 180 else diff
+
+
+def build_sarc_aspects(directed_positions, natal_positions, orbs=None):
+    """
+    Find aspects between SA directed positions and natal positions.
+
+    Args:
+        directed_positions: dict of {name: directed_longitude}
+        natal_positions: dict of {name: natal_longitude}
+        orbs: dict of {aspect_name: max_orb}, defaults to SARC_DEFAULT_ORBS
+
+    Returns:
+        list: Aspect dicts sorted by orb ascending
+    """
+    if orbs is None:
+        orbs = SARC_DEFAULT_ORBS
+
+    matches = find_aspects(
+        {name: (lon, 0.0) for name, lon in directed_positions.items()},
+        {name: (lon, 0.0) for name, lon in natal_positions.items()},
+        orbs=[{'name': name, 'orb': orbs.get(name, 1.0)} for name in SARC_ASPECT_ANGLES],
+        # Skip self-aspects: directed and natal point with same name are redundant
+        skip_same_name=True,
+    )
+    aspects = [
+        {
+            'directed_point': asp['p1'],
+            'natal_point': asp['p2'],
+            'aspect': asp['aspect'],
+            'orb': round(asp['orb'], 3),
+        }
+        for asp in matches
+    ]
+    return sorted(aspects, key=lambda x: x['orb'])
+
+
+def build_solar_arc_json(natal_data, slug, birth_jd, target_jd, arc, arc_method):
+    """
+    Assemble the complete solar arc directions JSON dict.
+
+    Args:
+        natal_data: Parsed natal chart.json dict
+        slug: Profile slug string
+        birth_jd: Julian Day number of birth
+        target_jd: Julian Day number of target date
+        arc: Solar arc in degrees (float)
+        arc_method: 'true' or 'mean'
+
+    Returns:
+        dict: Complete solar arc directions output
+    """
+    elapsed_years = (target_jd - birth_jd) / 365.25
+
+    # Derive target date string from JD
+    y, m, d, h = swe.revjul(target_jd)
+    target_date_str = f"{int(y):04d}-{int(m):02d}-{int(d):02d}"
+
+    # Build meta section
+    natal_meta = natal_data.get('meta', {})
+    natal_name = natal_meta.get('name', slug)
+    meta = {
+        'natal_name': natal_name,
+        'natal_slug': slug,
+        'target_date': target_date_str,
+        'arc_degrees': round(arc, 3),
+        'arc_method': arc_method,
+        'elapsed_years': round(elapsed_years, 2),
+        'chart_type': 'solar_arc_directions',
+        'calculated_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S+00:00'),
+        'orbs_used': SARC_DEFAULT_ORBS,
+    }
+
+    # Extract natal planet positions (10 major planets)
+    natal_planets = {
+        p['name']: p['abs_position']
+        for p in natal_data['planets']
+        if p['name'] in MAJOR_PLANETS
+    }
+
+    # Extract natal angle positions (ASC and MC)
+    natal_angles = {
+        a['name']: a['abs_position']
+        for a in natal_data['angles']
+        if a['name'] in ['ASC', 'MC']
+    }
+
+    # Combine natal positions for aspect calculation
+    all_natal = {**natal_planets, **natal_angles}
+
+    # Compute directed positions: add arc to every natal longitude
+    directed_positions = {name: (lon + arc) % 360 for name, lon in all_natal.items()}
+
+    # Build directed_planets list in MAJOR_PLANETS order
+    # Build lookup for natal planet data (sign, degree) from natal_data
+    natal_planet_lookup = {p['name']: p for p in natal_data['planets']}
+    directed_planets = []
+    for planet_name in MAJOR_PLANETS:
+        if planet_name not in natal_planet_lookup:
+            continue
+        natal_p = natal_planet_lookup[planet_name]
+        natal_abs = natal_p['abs_position']
+        directed_abs = directed_positions[planet_name]
+        dir_sign, dir_degree = position_to_sign_degree(directed_abs)
+        directed_planets.append({
+            'name': planet_name,
+            'natal_sign': natal_p.get('sign', ''),
+            'natal_degree': round(natal_p.get('degree', 0.0), 2),
+            'natal_abs_position': round(natal_abs, 3),
+            'directed_abs_position': round(directed_abs, 3),
+            'directed_sign': dir_sign,
+            'directed_degree': round(dir_degree, 2),
+        })
+
+    # Build directed_angles list (ASC then MC)
+    natal_angle_lookup = {a['name']: a for a in natal_data['angles']}
+    directed_angles = []
+    for angle_name in ['ASC', 'MC']:
+        if angle_name not in natal_angle_lookup:
+            continue
+        natal_a = natal_angle_lookup[angle_name]
+        natal_abs = natal_a['abs_position']
+        directed_abs = directed_positions[angle_name]
+        dir_sign, dir_degree = position_to_sign_degree(directed_abs)
+        directed_angles.append({
+            'name': angle_name,
+            'natal_abs_position': round(natal_abs, 3),
+            'directed_abs_position': round(directed_abs, 3),
+            'directed_sign': dir_sign,
+            'directed_degree': round(dir_degree, 2),
+        })
+
+    # Compute aspects with applying/separating detection
+    aspects_raw = build_sarc_aspects(directed_positions, all_natal)
+
+    # Compute arc one year forward for applying/separating detection
+    natal_sun_lon = natal_planets.get('Sun', 0.0)
+    arc_future = compute_solar_arc(birth_jd, target_jd + 365.25, natal_sun_lon, method=arc_method)
+
+    aspects = []
+    for asp in aspects_raw:
+        d_name = asp['directed_point']
+        n_name = asp['natal_point']
+        asp_name = asp['aspect']
+        asp_angle = SARC_ASPECT_ANGLES[asp_name]
+
+        natal_lon_of_directed = all_natal.get(d_name, 0.0)
+        natal_lon_of_natal = all_natal.get(n_name, 0.0)
+
+        # Current orb
+        current_orb = asp['orb']
+
+        # Future directed position (1 year forward)
+        directed_lon_future = (natal_lon_of_directed + arc_future) % 360
+
+        # Future orb
+        orb_future = abs(angular_distance(directed_lon_future, natal_lon_of_natal) - asp_angle)
+
+        movement = 'Applying' if orb_future < current_orb else 'Separating'
+
+        aspects.append({
+            'directed_point': d_name,
+            'natal_point': n_name,
+            'aspect': asp_name,
+            'orb': current_orb,
+            'movement': movement,
+        })
+
+    return {
+        'meta': meta,
+        'directed_planets': directed_planets,
+        'directed_angles': directed_angles,
+        'aspects': aspects,
+    }
+
+
+@lru_cache(maxsize=32)
+def progressed_sun_curve(birth_jd, days):
+    """
+    Tabulate the progressed Sun for the day-for-a-year solar arc.
+
+    One row per ephemeris day from birth_jd (one row per year of life), with the
+    longitude unwrapped so the curve rises monotonically past 360 degrees.
+    Cached, so every event of a lifetime calendar reuses one ephemeris pass.
+
+    Args:
+        birth_jd: Julian Day number of the birth moment
+        days: Number of ephemeris days (years of life) to cover
+
+    Returns:
+        tuple: (unwrapped longitudes, speeds in degrees/day), one entry per row
+    """
+    table = build_ephemeris_table(birth_jd, days + 1, planets=['Sun'])
+    data = table['data']
+    lons, speeds = [data[0]], [data[1]]
+    for row in range(1, table['days']):
+        lon, speed = data[row * EPHEMERIS_TABLE_FIELDS], data[row * EPHEMERIS_TABLE_FIELDS + 1]
+        lons.append(lons[-1] + wrap_degrees(lon - lons[-1]))
+        speeds.append(speed)
+    return tuple(lons), tuple(speeds)
+
+
+def solar_arc_target_jd(birth_jd, arc, natal_sun_lon, max_age, method='true'):
+    """
+    Find the date at which the solar arc reaches a given value.
+
+    Inverts compute_solar_arc(): the mean arc is linear in time, and the true arc
+    is solved on the cached progressed-Sun curve (bisect to the ephemeris day,
+    then the day's cubic Hermite interpolant).
+
+    Args:
+        birth_jd: Julian Day number of the birth moment
+        arc: Solar arc in degrees (may exceed 360 for very long spans)
+        natal_sun_lon: Natal Sun absolute longitude (from chart.json abs_position)
+        max_age: Whole years of life covered by the progressed-Sun curve
+        method: 'true' (default) or 'mean'
+
+    Returns:
+        float or None: Target Julian Day, or None if the arc is not reached by max_age
+    """
+    if method == 'mean':
+        years = arc / NAIBOD_ARC
+        return birth_jd + years * 365.25 if 0 <= years <= max_age else None
+
+    lons, speeds = progressed_sun_curve(birth_jd, max_age)
+    # Arc measured from the natal Sun, on the same unwrapped scale as the curve
+    target_lon = lons[0] + wrap_degrees(natal_sun_lon - lons[0]) + arc
+    row = bisect_right(lons, target_lon) - 1
+    if row < 0 or row >= len(lons) - 1:
+        return None
+    u, _slope = hermite_crossing(lons[row] - target_lon, lons[row + 1] - target_lon, speeds[row], speeds[row + 1])
+    progressed_jd = birth_jd + row + u
+    # Day-for-a-year: back from progressed ephemeris time to calendar time
+    return birth_jd + (progressed_jd - birth_jd) * 365.25
+
+
+def build_solar_arc_calendar(natal_data, slug, birth_jd, max_age, arc_method):
+    """
+    Assemble every directed-to-natal solar arc aspect of a lifetime in one call.
+
+    A directed point (natal longitude + arc) perfects an aspect to a natal point
+    exactly when arc = natal_point - directed_point +/- aspect_angle (mod 360), so
+    the perfection arcs are solved in closed form and each is mapped to a date
+    with solar_arc_target_jd().
+
+    Args:
+        natal_data: Parsed natal chart.json dict
+        slug: Profile slug string
+        birth_jd: Julian Day number of birth
+        max_age: Whole years of life to cover
+        arc_method: 'true' or 'mean'
+
+    Returns:
+        dict: Solar arc calendar with 'meta' and date-sorted 'events' sections
+    """
+    natal_planets = {
+        p['name']: p['abs_position']
+        for p in natal_data['planets']
+        if p['name'] in MAJOR_PLANETS
+    }
+    natal_angles = {
+        a['name']: a['abs_position']
+        for a in natal_data['angles']
+        if a['name'] in ['ASC', 'MC']
+    }
+    all_natal = {**natal_planets, **natal_angles}
+    natal_sun_lon = natal_planets.get('Sun', 0.0)
+
+    hits = []
+    for d_name, d_lon in all_natal.items():
+        for n_name, n_lon in all_natal.items():
+            # Skip self-aspects: directed and natal point with same name are redundant
+            if d_name == n_name:
+                continue
+            for asp_name, asp_angle in SARC_ASPECT_ANGLES.items():
+                arcs = {(n_lon - d_lon + asp_angle) % 360, (n_lon - d_lon - asp_angle) % 360}
+                for arc in sorted(arcs):
+                    target_jd = solar_arc_target_jd(birth_jd, arc, natal_sun_lon, max_age, method=arc_method)
+                    if target_jd is None:
+                        continue
+                    hits.append((target_jd, arc, d_name, asp_name, n_name))
+
+    events = []
+    for target_jd, arc, d_name, asp_name, n_name in sorted(hits):
+        y, m, d, _h = swe.revjul(target_jd)
+        events.append({
+            'date': f"{int(y):04d}-{int(m):02d}-{int(d):02d}",
+            'age': round((target_jd - birth_jd) / 365.25, 2),
+            'arc_degrees': round(arc, 3),
+            'directed_point': d_name,
+            'aspect': asp_name,
+            'natal_point': n_name,
+        })
+
+    natal_meta = natal_data.get('meta', {})
+    end_y, end_m, end_d, _h = swe.revjul(birth_jd + max_age * 365.25)
+    meta = {
+        'natal_name': natal_meta.get('name', slug),
+        'natal_slug': slug,
+        'start_date': natal_meta.get('birth_date'),
+        'end_date': f"{int(end_y):04d}-{int(end_m):02d}-{int(end_d):02d}",
+        'max_age': max_age,
+        'arc_method': arc_method,
+        'event_count': len(events),
+        'chart_type': 'solar_arc_calendar',
+        'calculated_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S+00:00'),
+    }
+
+    return {
+        'meta': meta,
+        'events': events,
+    }
+
+
+def compute_solar_arcs(args):
+    """
+    Compute the solar arc directions dict for an existing natal profile.
+
+    Loads natal profile, computes arc (true or mean method), applies arc to all
+    natal positions and finds SA-to-natal aspects. With --arc-calendar, returns the
+    lifetime event list from build_solar_arc_calendar() instead.
+
+    Args:
+        args: Parsed argparse namespace (solar_arcs, target_date, age, arc_method,
+              arc_calendar, max_age)
+
+    Returns:
+        dict: Solar arc JSON from build_solar_arc_json() or build_solar_arc_calendar()
+
+    Raises:
+        FileNotFoundError: If the profile does not exist
+        ValueError: If both --age and --target-date are given, or --arc-calendar is
+                    combined with either or given an invalid --max-age
+    """
+    _natal_subject, natal_data = load_natal_profile(args.solar_arcs, build_subject=False)
+
+    natal_meta = natal_data.get('meta', {})
+    birth_date_str = natal_meta['birth_date']
+    birth_time_str = natal_meta['birth_time']
+    birth_dt = datetime.strptime(birth_date_str + ' ' + birth_time_str, "%Y-%m-%d %H:%M")
+    birth_jd = swe.julday(birth_dt.year, birth_dt.month, birth_dt.day,
+                          birth_dt.hour + birth_dt.minute / 60.0)
+
+    # Validate mutually exclusive --age and --target-date
+    if args.age is not None and args.target_date is not None:
+        raise ValueError("--age and --target-date are mutually exclusive")
+
+    # Get arc method (default: 'true')
+    arc_method = getattr(args, 'arc_method', 'true')
+
+    # Lifetime calendar mode: every perfection date up to --max-age in one call
+    if args.arc_calendar:
+        if args.age is not None or args.target_date is not None:
+            raise ValueError("--arc-calendar cannot be combined with --age or --target-date")
+        if args.max_age < 1:
+            raise ValueError("--max-age must be at least 1")
+        return build_solar_arc_calendar(natal_data, args.solar_arcs, birth_jd, args.max_age, arc_method)
+
+    # Determine target Julian Day
+    if args.age is not None:
+        target_jd = birth_jd + args.age * 365.25
+    elif args.target_date is not None:
+        target_jd = swe.julday(args.target_date.year, args.target_date.month,
+                               args.target_date.day, 12.0)
+    else:
+        today = datetime.now(timezone.utc)
+        target_jd = swe.julday(today.year, today.month, today.day, 12.0)
+
+    # Get natal Sun longitude from profile
+    natal_sun_lon = next(
+        p['abs_position'] for p in natal_data['planets'] if p['name'] == 'Sun'
+    )
+
+    # Compute solar arc
+    arc = compute_solar_arc(birth_jd, target_jd, natal_sun_lon, method=arc_method)
+
+    # Build JSON
+    return build_solar_arc_json(natal_data, args.solar_arcs, birth_jd, target_jd, arc, arc_method)
+
+
+def calculate_solar_arcs(args):
+    """
+    Orchestrate solar arc directions calculation for an existing natal profile.
+
+    Computes the directions with compute_solar_arcs() (through the snapshot cache)
+    and outputs JSON to stdout.
+
+    Args:
+        args: Parsed argparse namespace (solar_arcs, target_date, age, arc_method)
+
+    Returns:
+        int: Exit code (0 = success, 1 = error)
+    """
+    try:
+        sarc_dict, _hit = cached_compute('solar_arcs', args.solar_arcs, compute_solar_arcs, args)
+        print(json.dumps(sarc_dict, indent=2))
+
+        if args.save:
+            if args.arc_calendar:
+                mode = 'solar-arc-calendar'
+                date_str = sarc_dict['meta'].get('start_date', 'unknown')
+            else:
+                mode = 'solar-arc'
+                date_str = sarc_dict['meta'].get('target_date', 'unknown')
+            try:
+                out_path = save_snapshot(CHARTS_DIR / args.solar_arcs, mode, date_str, sarc_dict)
+                print(f"Snapshot saved: {out_path}", file=sys.stderr)
+            except Exception as e:
+                print(f"Warning: Could not save snapshot: {e}", file=sys.stderr)
+
+        return 0
+
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error calculating solar arc directions: {e}", file=sys.stderr)
+        return 1
+
+
+def position_to_sign_degree(position):
+    """
+    Convert absolute ecliptic longitude (0-360°) to zodiac sign and degree within sign.
+
+    Args:
+        position: Absolute ecliptic longitude in degrees (0-360)
+
+    Returns:
+        tuple: (sign_abbreviation, degree_within_sign)
+    """
+    # Sign abbreviations matching Kerykeion's 3-letter format
+    signs = ['Ari', 'Tau', 'Gem', 'Can', 'Leo', 'Vir',
+             'Lib', 'Sco', 'Sag', 'Cap', 'Aqu', 'Pis']
+    sign_index = int(position // 30) % 12
+    degree = position % 30
+    return signs[sign_index], degree
+
+
+def get_planet_dignities(planet_name, planet_sign):
+    """
+    Determine essential dignities for a planet based on its sign placement.
+
+    Args:
+        planet_name: Name of the planet (e.g., 'Sun', 'Moon', 'Mercury')
+        planet_sign: Sign abbreviation (e.g., 'Ari', 'Tau', 'Gem')
+
+    Returns:
+        list: List of dignity strings (e.g., ['Domicile'], ['Exaltation'], ['Peregrine'])
+    """
+    if planet_name not in DIGNITIES:
+        return []  # Not a traditional planet
+
+    dignities = []
+    planet_data = DIGNITIES[planet_name]
+
+    if planet_sign in planet_data['domicile']:
+        dignities.append('Domicile')
+    if planet_sign in planet_data['exaltation']:
+        dignities.append('Exaltation')
+    if planet_sign in planet_data['detriment']:
+        dignities.append('Detriment')
+    if planet_sign in planet_data['fall']:
+        dignities.append('Fall')
+
+    # If no dignity found, planet is peregrine
+    if not dignities:
+        dignities.append('Peregrine')
+
+    return dignities
+
+
+def star_catalog_path():
+    """
+    Return the path of the Swiss Ephemeris star catalog bundled with Kerykeion.
+
+    Returns:
+        Path: .../kerykeion/sweph/sefstars.txt
+    """
+    return sweph_dir() / STAR_CATALOG_FILENAME
+
+
+def star_table_path():
+    """
+    Return the path of the persisted fixed-star table.
+
+    Returns:
+        Path: ~/.natal-charts/.ephemeris/stars-v{STAR_TABLE_VERSION}.json
+    """
+    return EPHEMERIS_CACHE_DIR / f"stars-v{STAR_TABLE_VERSION}.json"
+
+
+def star_table_source():
+    """
+    Return the catalog file and library versions a persisted star table depends on.
+
+    Returns:
+        dict: catalog_size, catalog_mtime_ns, libraries
+    """
+    stat = star_catalog_path().stat()
+    return {
+        'catalog_size': stat.st_size,
+        'catalog_mtime_ns': stat.st_mtime_ns,
+        'libraries': library_versions(),
+    }
+
+
+def parse_star_catalog():
+    """
+    Parse sefstars.txt into its unique stars, in catalog order.
+
+    Data lines are "name,nomenclature,frame,RA h,m,s,Dec d,m,s,...". The catalog
+    keeps the most used stars at the top and lists some stars more than once
+    (alternate names such as Rohini for Aldebaran, and again in its full
+    listing); entries with identical coordinates collapse onto the first.
+    Each star keeps its Swiss Ephemeris sequence number, since a numbered
+    fixstar2_ut lookup skips the name search.
+
+    Returns:
+        List[list]: [name, nomenclature, seq (int)] per star
+    """
+    ensure_ephemeris_path()
+    seq_by_key = {}
+    seq = 1
+    while True:
+        try:
+            _magnitude, found = swe.fixstar2_mag(str(seq))
+        except swe.Error:
+            break
+        seq_by_key.setdefault(found, seq)
+        seq += 1
+
+    stars = []
+    seen_coords = set()
+    with open(star_catalog_path(), 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if line.startswith('#') or not line.strip():
+                continue
+            fields = [field.strip() for field in line.split(',')]
+            if len(fields) < 9:
+                continue
+            key = f"{fields[0]},{fields[1]}"
+            coords = tuple(fields[3:9])
+            if key not in seq_by_key or coords in seen_coords:
+                continue
+            seen_coords.add(coords)
+            stars.append([fields[0] or fields[1], fields[1], seq_by_key[key]])
+    return stars
+
+
+def star_anchor_jd(year):
+    """
+    Return the UT Julian Day of a star table anchor (1 January, noon).
+
+    Args:
+        year: Anchor year (a multiple of STAR_TABLE_SPAN_YEARS)
+
+    Returns:
+        float: Julian Day (UT)
+    """
+    return swe.julday(year, 1, 1, 12.0)
+
+
+def save_star_table(table):
+    """
+    Write the fixed-star table atomically; an unwritable cache directory is not an error.
+
+    Args:
+        table: dict from load_star_table()
+    """
+    out_path = star_table_path()
+    tmp_path = out_path.with_suffix(f'.tmp{os.getpid()}')
+    try:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(table, f, ensure_ascii=False)
+        os.replace(tmp_path, out_path)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=None)
+def load_star_table():
+    """
+    Load the persisted fixed-star table, building it on first use (once per process).
+
+    The table holds every catalog star with its interpolation tolerance and its
+    apparent ecliptic longitude at each century anchor computed so far; anchors
+    are added on demand by star_anchor_longitudes(). A table built from another
+    catalog file or library version is rebuilt.
+
+    Returns:
+        dict: version, source, stars (rows from parse_star_catalog()), tolerances
+              (degrees, per star), anchors ({year str: [longitude per star]})
+    """
+    ensure_ephemeris_path()
+    source = star_table_source()
+    try:
+        with open(star_table_path(), 'r', encoding='utf-8') as f:
+            table = json.load(f)
+        if table.get('version') == STAR_TABLE_VERSION and table.get('source') == source:
+            return table
+    except (OSError, json.JSONDecodeError):
+        pass
+
+    stars = parse_star_catalog()
+    jd = star_anchor_jd(2000)
+    positions = [swe.fixstar2_ut(str(star[2]), jd, 0)[0] for star in stars]
+    table = {
+        'version': STAR_TABLE_VERSION,
+        'source': source,
+        'stars': stars,
+        'tolerances': [round(STAR_TABLE_TOLERANCE / max(math.cos(math.radians(pos[1])), 1e-6), 5)
+                       for pos in positions],
+        # 1e-9 deg is far inside the tolerance and halves the file's parse time
+        'anchors': {'2000': [round(pos[0], 9) for pos in positions]},
+    }
+    save_star_table(table)
+    return table
+
+
+def star_anchor_longitudes(table, year):
+    """
+    Return every star's apparent longitude at an anchor, computing and saving it if new.
+
+    Args:
+        table: dict from load_star_table()
+        year: Anchor year (a multiple of STAR_TABLE_SPAN_YEARS)
+
+    Returns:
+        list: Longitude per star, in table['stars'] order
+    """
+    key = str(year)
+    if key not in table['anchors']:
+        jd = star_anchor_jd(year)
+        table['anchors'][key] = [round(swe.fixstar2_ut(str(star[2]), jd, 0)[0][0], 9)
+                                 for star in table['stars']]
+        save_star_table(table)
+    return table['anchors'][key]
+
+
+def star_longitude_index(table, indices, jd_ut):
+    """
+    Sort stars by their longitude at an epoch, interpolated between century anchors.
+
+    Precession moves every star by about 1.4 deg per century, so longitudes are
+    interpolated linearly between the anchors either side of the epoch; each
+    star's interpolation error stays within its table tolerance.
+
+    Args:
+        table: dict from load_star_table()
+        indices: Star indices (into table['stars']) to include
+        jd_ut: Epoch as a UT Julian Day
+
+    Returns:
+        tuple: (sorted longitudes, star index for each longitude)
+    """
+    year = swe.revjul(jd_ut)[0]
+    first = year - year % STAR_TABLE_SPAN_YEARS
+    start_lons = star_anchor_longitudes(table, first)
+    end_lons = star_anchor_longitudes(table, first + STAR_TABLE_SPAN_YEARS)
+    start_jd = star_anchor_jd(first)
+    u = (jd_ut - start_jd) / (star_anchor_jd(first + STAR_TABLE_SPAN_YEARS) - start_jd)
+
+    by_lon = sorted(
+        ((start_lons[i] + u * swe.difdeg2n(end_lons[i], start_lons[i])) % 360.0, i)
+        for i in indices
+    )
+    return [lon for lon, _i in by_lon], [i for _lon, i in by_lon]
+
+
+@lru_cache(maxsize=None)
+def star_ranking(selection):
+    """
+    Rank the stars a selection checks, in report order.
+
+    Args:
+        selection: 'major' (MAJOR_STARS) or 'all' (every sefstars.txt star)
+
+    Returns:
+        dict: {star index: (rank, display name)}; MAJOR_STARS first, then the
+              rest of the catalog in file order
+    """
+    stars = load_star_table()['stars']
+    by_name = {}
+    for i, star in enumerate(stars):
+        by_name.setdefault(star[0].lower(), i)
+    ranked = []
+    for lookup, display in MAJOR_STARS:
+        if lookup in by_name:
+            ranked.append((by_name[lookup], display))
+        else:
+            print(f"Warning: Could not calculate {display}: not in {STAR_CATALOG_FILENAME}", file=sys.stderr)
+    if selection == 'all':
+        major = {i for i, _display in ranked}
+        ranked += [(i, stars[i][0]) for i in range(len(stars)) if i not in major]
+    return {i: (r, display) for r, (i, display) in enumerate(ranked)}
+
+
+def find_star_conjunctions(points, jd_ut, selection='major', orb=FIXED_STAR_ORB):
+    """
+    Find fixed stars conjunct any of a set of chart points.
+
+    Stars are bisected from a longitude index around each point (see
+    star_longitude_index()), so checking the full catalog costs little more than
+    checking MAJOR_STARS; only the few stars that fall near a point are
+    calculated exactly with swe.fixstar2_ut.
+
+    Args:
+        points: List of (name, longitude) tuples
+        jd_ut: Chart epoch as a UT Julian Day
+        selection: 'major' (MAJOR_STARS) or 'all' (every sefstars.txt star)
+        orb: Maximum separation in degrees
+
+    Returns:
+        List[dict]: {'star', 'conjunct_body', 'orb'} in star_ranking() order, and
+                    point order within a star
+    """
+    table = load_star_table()
+    stars = table['stars']
+    tolerances = table['tolerances']
+    rank = star_ranking(selection)
+
+    indexed = [i for i in rank if tolerances[i] <= STAR_TABLE_MAX_TOLERANCE]
+    sorted_lons, order = star_longitude_index(table, indexed, jd_ut)
+    candidates = {i for i in rank if tolerances[i] > STAR_TABLE_MAX_TOLERANCE}
+    reach = orb + STAR_TABLE_MAX_TOLERANCE
+    for _name, point_long in points:
+        lo, hi = point_long - reach, point_long + reach
+        if lo < 0:
+            spans = [(lo + 360, 360), (0, hi)]
+        elif hi >= 360:
+            spans = [(lo, 360), (0, hi - 360)]
+        else:
+            spans = [(lo, hi)]
+        for span_lo, span_hi in spans:
+            for k in range(bisect_left(sorted_lons, span_lo), bisect_right(sorted_lons, span_hi)):
+                if abs(swe.difdeg2n(sorted_lons[k], point_long)) <= orb + tolerances[order[k]]:
+                    candidates.add(order[k])
+
+    hits = []
+    for i in candidates:
+        star_rank, display = rank[i]
+        try:
+            star_long = swe.fixstar2_ut(str(stars[i][2]), jd_ut, 0)[0][0]
+        except swe.Error as e:
+            # Skip stars that can't be calculated (warn, continue)
+            print(f"Warning: Could not calculate {display}: {e}", file=sys.stderr)
+            continue
+        for point_rank, (point_name, point_long) in enumerate(points):
+            diff = abs(point_long - star_long)
+            if diff > 180:
+                diff = 360 - diff
+            if diff <= orb:
+                hits.append((star_rank, point_rank, {
+                    "star": display,
+                    "conjunct_body": point_name,
+                    "orb": diff
+                }))
+    hits.sort(key=lambda hit: hit[:2])
+    return [hit[2] for hit in hits]
+
+
+def check_existing_profile(profile_dir, person_name):
+    """
+    Check if profile exists and display existing data. Returns True if ok to proceed.
+
+    Args:
+        profile_dir: Path to the profile directory
+        person_name: Name of the person (for display)
+
+    Returns:
+        True if profile doesn't exist (ok to proceed), False if exists (needs confirmation)
+    """
+    if profile_stamp(profile_dir.name) is None:
+        return True  # No existing profile, proceed
+
+    # Load and display existing birth details
+    existing = read_profile_chart(profile_dir.name)
+
+    meta = existing.get('meta', {})
+    loc = meta.get('location', {})
+    print(f"\nWARNING: Profile '{person_name}' already exists")
+    print(f"  Birth date: {meta.get('birth_date', 'Unknown')}")
+    print(f"  Birth time: {meta.get('birth_time', 'Unknown')}")
+    print(f"  Location:   {loc.get('city', 'N/A')}, {loc.get('nation', 'N/A')}")
+    print(f"  Lat/Lng:    {loc.get('latitude', 'N/A')}, {loc.get('longitude', 'N/A')}")
+    print(f"  Timezone:   {loc.get('timezone', 'N/A')}")
+    print(f"  Generated:  {meta.get('generated_at', 'Unknown')}")
+    print()
+
+    # In non-interactive mode (piped input), default to not overwriting
+    # For script use, require --force flag
+    return False  # Signal that confirmation is needed
+
+
+def build_chart_json(subject, args, timings=None):
+    """
+    Build comprehensive JSON-serializable dictionary from AstrologicalSubject.
+
+    Extracts all astrological calculations into a structured format including:
+    meta, planets, houses, angles, aspects, asteroids, fixed_stars, arabic_parts,
+    dignities, and distributions. This is the single computed chart model: both
+    chart.json and the console report (print_chart_report) read from it, so each
+    section is calculated exactly once per profile creation.
+
+    Args:
+        subject: AstrologicalSubject instance with calculated chart data
+        args: Parsed command-line arguments containing birth data
+        timings: Optional dict; when given, per-section wall-clock seconds are
+                 recorded into it (section name -> seconds)
+
+    Returns:
+        dict: Comprehensive chart data structure
+    """
+    from slugify import slugify
+
+    if timings is None:
+        timings = {}
+    t0 = time.perf_counter()
+
+    # META SECTION
+    meta = {
+        "name": args.name,
+        "slug": slugify(args.name),
+        "birth_date": args.date.strftime("%Y-%m-%d"),
+        "birth_time": args.time.strftime("%H:%M"),
+        "location": {
+            "city": getattr(subject, 'city', None),
+            "nation": getattr(subject, 'nation', None),
+            "latitude": subject.lat,
+            "longitude": subject.lng,
+            "timezone": subject.tz_str
+        },
+        "house_system": "Placidus",
+        "chart_type": None,  # Will be determined below
+        "generated_at": datetime.now(timezone.utc).isoformat()
+    }
+
+    # PLANETS SECTION - all 10 main planets
+    planets_list = [(name, getattr(subject, name.lower())) for name in MAJOR_PLANETS]
+
+    planets = []
+    for name, planet in planets_list:
+        planets.append({
+            "name": name,
+            "sign": planet.sign,
+            "degree": planet.position % 30,
+            "abs_position": planet.abs_pos,
+            "house": str(planet.house),
+            "retrograde": getattr(planet, 'retrograde', False)
+        })
+    t0 = _record_timing(timings, 'planets', t0)
+
+    # HOUSES SECTION - all 12 house cusps
+    houses_list = [getattr(subject, attr) for attr in HOUSE_ATTRS]
+
+    houses = []
+    for i, house in enumerate(houses_list, 1):
+        houses.append({
+            "number": i,
+            "sign": house.sign,
+            "degree": house.position % 30
+        })
+    t0 = _record_timing(timings, 'houses', t0)
+
+    # ANGLES SECTION
+    angles_list = [
+        ('ASC', subject.ascendant),
+        ('MC', subject.medium_coeli),
+        ('DSC', subject.descendant),
+        ('IC', subject.imum_coeli),
+    ]
+
+    angles = []
+    for name, angle in angles_list:
+        angles.append({
+            "name": name,
+            "sign": angle.sign,
+            "degree": angle.position % 30,
+            "abs_position": angle.abs_pos
+        })
+    t0 = _record_timing(timings, 'angles', t0)
+
+    # ASPECTS SECTION - major aspects between 10 main planets
+    aspects = []
+    for asp in find_aspects(subject_points(subject, MAJOR_PLANETS), orbs=NATAL_DEFAULT_ORBS):
+        aspects.append({
+            "planet1": asp['p1'],
+            "planet2": asp['p2'],
+            "type": asp['aspect'],
+            "orb": asp['orb'],
+            "movement": asp['movement']
+        })
+    t0 = _record_timing(timings, 'aspects', t0)
+
+    # ASTEROIDS SECTION
+    asteroids = []
+    for name, attr in ASTEROID_ATTRS:
+        body = getattr(subject, attr, None)
+        if body is not None:
+            asteroids.append({
+                "name": name,
+                "sign": body.sign,
+                "degree": body.position % 30,
+                "house": str(body.house),
+                "retrograde": getattr(body, 'retrograde', False)
+            })
+    t0 = _record_timing(timings, 'asteroids', t0)
+
+    # ARABIC PARTS SECTION - Determine day/night chart and calculate parts
+    # Day chart: Sun in houses 7-12 (above horizon)
+    # Night chart: Sun in houses 1-6 (below horizon)
+    sun_house_str = str(subject.sun.house)
+    house_names = {
+        'First_House': 1, 'Second_House': 2, 'Third_House': 3, 'Fourth_House': 4,
+        'Fifth_House': 5, 'Sixth_House': 6, 'Seventh_House': 7, 'Eighth_House': 8,
+        'Ninth_House': 9, 'Tenth_House': 10, 'Eleventh_House': 11, 'Twelfth_House': 12
+    }
+    sun_house = house_names.get(sun_house_str, int(sun_house_str) if sun_house_str.isdigit() else 1)
+    is_day_chart = 7 <= sun_house <= 12
+
+    # Update meta with chart type
+    meta["chart_type"] = "Day" if is_day_chart else "Night"
+
+    asc_pos = subject.ascendant.position
+    sun_pos = subject.sun.position
+    moon_pos = subject.moon.position
+
+    # Calculate Part of Fortune
+    if is_day_chart:
+        fortune_pos = (asc_pos + moon_pos - sun_pos) % 360
+    else:
+        fortune_pos = (asc_pos + sun_pos - moon_pos) % 360
+
+    # Calculate Part of Spirit
+    if is_day_chart:
+        spirit_pos = (asc_pos + sun_pos - moon_pos) % 360
+    else:
+        spirit_pos = (asc_pos + moon_pos - sun_pos) % 360
+
+    fortune_sign, fortune_degree = position_to_sign_degree(fortune_pos)
+    spirit_sign, spirit_degree = position_to_sign_degree(spirit_pos)
+
+    arabic_parts = {
+        "part_of_fortune": {"sign": fortune_sign, "degree": fortune_degree},
+        "part_of_spirit": {"sign": spirit_sign, "degree": spirit_degree}
+    }
+    t0 = _record_timing(timings, 'arabic_parts', t0)
+
+    # DIGNITIES SECTION - traditional planets only
+    dignities = []
+    for name, planet in planets_list:
+        if name not in DIGNITIES:
+            continue
+        dignity_status = get_planet_dignities(name, planet.sign)
+        dignities.append({
+            "planet": name,
+            "sign": planet.sign,
+            "status": dignity_status
+        })
+    t0 = _record_timing(timings, 'dignities', t0)
+
+    # FIXED STARS SECTION
+    # Swiss Ephemeris path must point at Kerykeion's sweph directory (contains sefstars.txt)
+    ensure_ephemeris_path()
+
+    # Calculate Julian day
+    jd = swe.julday(args.date.year, args.date.month, args.date.day,
+                    args.time.hour + args.time.minute / 60.0)
+
+    # Build points to check: all 10 planets + 4 angles
+    points_to_check = [(name, p.abs_pos) for name, p in planets_list] + \
+                      [(name, a.abs_pos) for name, a in angles_list]
+
+    try:
+        fixed_stars = find_star_conjunctions(points_to_check, jd, getattr(args, 'stars', 'major'))
+    except (OSError, ValueError, swe.Error) as e:
+        print(f"Warning: Could not calculate fixed stars: {e}", file=sys.stderr)
+        fixed_stars = []
+    t0 = _record_timing(timings, 'fixed_stars', t0)
+
+    # DISTRIBUTIONS SECTION - Elements and Modalities
+    # Collect placements: 10 planets + ASC (11 total)
+    placements = [(name, p) for name, p in planets_list] + [('ASC', subject.ascendant)]
+
+    # Element distribution
+    element_count = {'Fire': 0, 'Earth': 0, 'Air': 0, 'Water': 0}
+    element_planets = {'Fire': [], 'Earth': [], 'Air': [], 'Water': []}
+
+    for name, body in placements:
+        element = ELEMENT_MAP.get(body.sign)
+        if element:
+            element_count[element] += 1
+            element_planets[element].append(name)
+
+    total_placements = sum(element_count.values())
+
+    elements = {}
+    for element in ['Fire', 'Earth', 'Air', 'Water']:
+        count = element_count[element]
+        percentage = (count / total_placements * 100) if total_placements > 0 else 0
+        elements[element] = {
+            "count": count,
+            "percentage": round(percentage, 1),
+            "planets": element_planets[element]
+        }
+
+    # Modality distribution
+    modality_count = {'Cardinal': 0, 'Fixed': 0, 'Mutable': 0}
+    modality_planets = {'Cardinal': [], 'Fixed': [], 'Mutable': []}
+
+    for name, body in placements:
+        modality = MODALITY_MAP.get(body.sign)
+        if modality:
+            modality_count[modality] += 1
+            modality_planets[modality].append(name)
+
+    modalities = {}
+    for modality in ['Cardinal', 'Fixed', 'Mutable']:
+        count = modality_count[modality]
+        percentage = (count / total_placements * 100) if total_placements > 0 else 0
+        modalities[modality] = {
+            "count": count,
+            "percentage": round(percentage, 1),
+            "planets": modality_planets[modality]
+        }
+
+    distributions = {
+        "elements": elements,
+        "modalities": modalities
+    }
+    _record_timing(timings, 'distributions', t0)
+
+    # Assemble final dictionary
+    return {
+        "meta": meta,
+        "planets": planets,
+        "houses": houses,
         "angles": angles,
         "aspects": aspects,
         "asteroids": asteroids,
@@ -1727,71 +4643,2827 @@ def build_chart_json(subject, args):
     }
 
 
-def list_profiles():
+def print_chart_report(chart_dict):
+    """
+    Print the human-readable natal chart report from a computed chart model.
+
+    Renders the same sections main() has always printed (positions, cusps, angles,
+    aspects, asteroids, Arabic parts, dignities, fixed stars, distributions) but
+    reads every value from the build_chart_json() dict instead of recalculating.
+
+    Args:
+        chart_dict: dict returned by build_chart_json()
+    """
+    # Planetary positions
+    print("\n=== PLANETARY POSITIONS ===")
+    for planet in chart_dict['planets']:
+        retrograde = " (R)" if planet['retrograde'] else ""
+        print(f"{planet['name']:10} {planet['sign']:3} {planet['degree']:6.2f}° House {planet['house']}{retrograde}")
+
+    # House cusps
+    print("\n=== HOUSE CUSPS (Placidus) ===")
+    for house in chart_dict['houses']:
+        print(f"House {house['number']:2}   {house['sign']:3} {house['degree']:6.2f}°")
+
+    # Angles
+    print("\n=== ANGLES ===")
+    for angle in chart_dict['angles']:
+        print(f"{angle['name']:3}        {angle['sign']:3} {angle['degree']:6.2f}°")
+
+    # Major aspects between the 10 main planets
+    print("\n=== MAJOR ASPECTS ===")
+    aspects = chart_dict['aspects']
+    print(f"Found {len(aspects)} major aspects:")
+    for asp in aspects:
+        print(f"{asp['planet1']:10} {asp['type']:12} {asp['planet2']:10} (orb: {asp['orb']:.2f}°, {asp['movement']})")
+
+    # Asteroid positions
+    print("\n=== ASTEROIDS ===")
+    asteroid_lookup = {a['name']: a for a in chart_dict['asteroids']}
+    for name, _attr in ASTEROID_ATTRS:
+        body = asteroid_lookup.get(name)
+        if body is not None:
+            retrograde = " (R)" if body['retrograde'] else ""
+            print(f"{name:12} {body['sign']:3} {body['degree']:6.2f}° House {body['house']}{retrograde}")
+        else:
+            print(f"{name:12} Not available")
+
+    # Arabic Parts
+    print("\n=== ARABIC PARTS ===")
+    fortune = chart_dict['arabic_parts']['part_of_fortune']
+    spirit = chart_dict['arabic_parts']['part_of_spirit']
+    print(f"Chart Type: {chart_dict['meta']['chart_type']}")
+    print(f"Part of Fortune:  {fortune['sign']} {fortune['degree']:6.2f}°")
+    print(f"Part of Spirit:   {spirit['sign']} {spirit['degree']:6.2f}°")
+
+    # Essential dignities for traditional planets
+    print("\n=== ESSENTIAL DIGNITIES ===")
+    for entry in chart_dict['dignities']:
+        dignity_str = ', '.join(entry['status']) if entry['status'] else 'None'
+        print(f"{entry['planet']:10} in {entry['sign']:3}  {dignity_str}")
+
+    print("\nNote: Traditional planets only (Sun-Saturn). Modern planet dignities (Uranus, Neptune, Pluto) are disputed and excluded.")
+
+    # Fixed star conjunctions
+    print("\n=== FIXED STAR CONJUNCTIONS (orb <= 1.0 deg) ===")
+    if chart_dict['fixed_stars']:
+        for star in chart_dict['fixed_stars']:
+            print(f"{star['star']} conjunct {star['conjunct_body']} (orb: {star['orb']:.2f} deg)")
+    else:
+        print("No major fixed star conjunctions detected")
+
+    # Element and modality distributions
+    distributions = chart_dict['distributions']
+    for title, groups, width in (
+        ("ELEMENT DISTRIBUTION", distributions['elements'], 5),
+        ("MODALITY DISTRIBUTION", distributions['modalities'], 8),
+    ):
+        print(f"\n=== {title} ===")
+        total_placements = sum(group['count'] for group in groups.values())
+        print(f"Total placements: {total_placements}")
+        for group_name, group in groups.items():
+            planets_str = ', '.join(group['planets']) if group['planets'] else 'None'
+            print(f"{group_name:{width}} ({group['count']}): {group['percentage']:5.1f}% - {planets_str}")
+
+
+def print_timings(timings, total_label="total"):
+    """
+    Print a per-section timing breakdown to stderr.
+
+    Args:
+        timings: dict of section name -> seconds, in execution order
+        total_label: Label for the summed row
+    """
+    print("\n=== TIMINGS ===", file=sys.stderr)
+    for section, seconds in timings.items():
+        print(f"{section:14} {seconds * 1000:9.2f} ms", file=sys.stderr)
+    print(f"{total_label:14} {sum(timings.values()) * 1000:9.2f} ms", file=sys.stderr)
+
+
+def startup_benchmark_modes(slug):
+    """
+    Return the CLI invocations measured by --startup-benchmark.
+
+    Args:
+        slug: Profile slug for the per-profile modes, or None to measure only
+              the modes that need no profile
+
+    Returns:
+        dict: {mode label: argv list}
+    """
+    modes = {'help': ['--help'], 'list': ['--list']}
+    if slug:
+        # --no-cache: measure the calculation, not a snapshot cache hit
+        modes.update({
+            'transits': ['--transits', slug, '--no-cache'],
+            'timeline': ['--timeline', slug, '--no-cache'],
+            'progressions': ['--progressions', slug, '--no-cache'],
+            'solar-arcs': ['--solar-arcs', slug, '--no-cache'],
+        })
+    return modes
+
+
+def parse_importtime(stderr_text):
+    """
+    Total -X importtime output by top-level import.
+
+    Lines look like "import time: <self us> | <cumulative us> | <name>", with the
+    name indented two spaces per nesting level; only imports made directly by
+    the interpreter or the script (one leading space) are kept, so their
+    cumulative times add up without double counting.
+
+    Args:
+        stderr_text: stderr captured from a `python -X importtime` run
+
+    Returns:
+        dict: {module name: cumulative seconds}
+    """
+    totals = {}
+    for line in stderr_text.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line.split('|')
+        if len(parts) != 3 or parts[2].startswith('  '):
+            continue
+        try:
+            cumulative = int(parts[1])
+        except ValueError:
+            continue  # column header
+        name = parts[2].strip()
+        totals[name] = totals.get(name, 0.0) + cumulative / 1e6
+    return totals
+
+
+def run_startup_benchmark(slug=None, runs=STARTUP_BENCHMARK_RUNS):
+    """
+    Measure cold-start latency of each CLI mode in fresh interpreter processes.
+
+    Each mode runs `runs` times for its median wall-clock time, then once more
+    under `python -X importtime` for the import breakdown (reported separately,
+    since import tracing slows the run it measures).
+
+    Args:
+        slug: Profile slug for the per-profile modes (default: first saved profile)
+        runs: Timed runs per mode
+
+    Returns:
+        0 if every mode ran, 1 otherwise
+    """
+    import statistics
+    import subprocess
+
+    if not slug:
+        slugs = profile_slugs()
+        slug = slugs[0] if slugs else None
+    script = str(Path(__file__).resolve())
+
+    label = f"{slug}, " if slug else "no profile, "
+    print(f"=== STARTUP BENCHMARK ({label}median of {runs} cold runs) ===")
+    print(f"{'mode':14} {'wall ms':>9} {'import ms':>10}  heaviest imports (ms)")
+    if not slug:
+        print("(Create a profile to benchmark the transits/timeline/progressions/solar-arcs modes)")
+
+    failed = False
+    for mode, argv in startup_benchmark_modes(slug).items():
+        walls = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            proc = subprocess.run([sys.executable, script] + argv, capture_output=True, text=True)
+            walls.append(time.perf_counter() - started)
+            if proc.returncode != 0:
+                break
+        if proc.returncode != 0:
+            failed = True
+            error = (proc.stderr.strip().splitlines() or ['no output'])[-1]
+            print(f"{mode:14} failed (exit {proc.returncode}): {error}")
+            continue
+
+        traced = subprocess.run([sys.executable, '-X', 'importtime', script] + argv,
+                                capture_output=True, text=True)
+        imports = parse_importtime(traced.stderr)
+        heaviest = sorted(imports.items(), key=lambda item: item[1], reverse=True)[:3]
+        heaviest_str = ', '.join(f"{name} {seconds * 1000:.0f}" for name, seconds in heaviest)
+        print(f"{mode:14} {statistics.median(walls) * 1000:9.1f} "
+              f"{sum(imports.values()) * 1000:10.1f}  {heaviest_str}")
+    return 1 if failed else 0
+
+
+def place_key(name):
+    """
+    Normalize a place name for lookups: accents stripped, case-folded, punctuation
+    and repeated whitespace collapsed ("São  Paulo" -> "sao paulo").
+
+    Args:
+        name: Place name
+
+    Returns:
+        str: Lookup key
+    """
+    import unicodedata
+
+    text = ''.join(c for c in unicodedata.normalize('NFKD', str(name)) if not unicodedata.combining(c))
+    return ' '.join(re.sub(r"[\W_]+", ' ', text.casefold()).split())
+
+
+def open_geocode_db():
+    """
+    Open (creating if needed) the local geocoding database, once per process.
+
+    Returns:
+        sqlite3.Connection with sqlite3.Row rows
+
+    Raises:
+        ValueError: If the database was written by another GEOCODE_DB_VERSION
+    """
+    import sqlite3
+
+    conn = _GEOCODE_CONNECTIONS.get(os.getpid())
+    if conn is not None:
+        return conn
+
+    GEOCODE_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(GEOCODE_DB_PATH, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version == 0:
+        # IF NOT EXISTS: parallel --batch workers may create it at the same time
+        with conn:
+            conn.executescript(GEOCODE_SCHEMA + f"PRAGMA user_version = {GEOCODE_DB_VERSION};")
+    elif version != GEOCODE_DB_VERSION:
+        conn.close()
+        raise ValueError(f"Unsupported geocoding database version {version} in {GEOCODE_DB_PATH} "
+                         f"(expected {GEOCODE_DB_VERSION})")
+
+    _GEOCODE_CONNECTIONS[os.getpid()] = conn
+    return conn
+
+
+def lookup_place(city, nation):
+    """
+    Resolve a city from the local geocoding database.
+
+    A remembered GeoNames lookup of the same query wins (it reproduces the online
+    result exactly); otherwise the most populous gazetteer place of that name.
+
+    Args:
+        city: City name as given to --city
+        nation: Two-letter country code as given to --nation
+
+    Returns:
+        dict or None: Place row (name, nation, latitude, longitude, timezone,
+                      population, source), or None if the city is unknown
+    """
+    if not GEOCODE_DB_PATH.exists():
+        return None
+    row = open_geocode_db().execute(
+        """
+        SELECT p.* FROM place_names n JOIN places p ON p.id = n.place_id
+        WHERE n.nation = ? AND n.name_key = ?
+        ORDER BY p.source = 'geonames' DESC, p.population DESC
+        LIMIT 1
+        """,
+        (nation.upper(), place_key(city)),
+    ).fetchone()
+    return None if row is None else dict(row)
+
+
+def remember_place(city, nation, subject):
+    """
+    Record a GeoNames lookup so the same --city/--nation resolves locally next time.
+
+    A warning replaces any failure: the chart has already been computed.
+
+    Args:
+        city: City name as queried
+        nation: Country code as queried
+        subject: AstrologicalSubjectModel created by the online lookup
+    """
+    import sqlite3
+
+    key, query_nation = place_key(city), nation.upper()
+    try:
+        conn = open_geocode_db()
+        with conn:
+            # Replace an earlier lookup of the same query (--geocode=online refreshes)
+            stale = [row['place_id'] for row in conn.execute(
+                """
+                SELECT n.place_id FROM place_names n JOIN places p ON p.id = n.place_id
+                WHERE n.nation = ? AND n.name_key = ? AND p.source = 'geonames'
+                """, (query_nation, key))]
+            for place_id in stale:
+                conn.execute("DELETE FROM place_names WHERE place_id = ?", (place_id,))
+                conn.execute("DELETE FROM places WHERE id = ?", (place_id,))
+            place_id = conn.execute(
+                "INSERT INTO places (name, nation, latitude, longitude, timezone, population, source) "
+                "VALUES (?, ?, ?, ?, ?, NULL, 'geonames')",
+                (city, subject.nation, subject.lat, subject.lng, subject.tz_str),
+            ).lastrowid
+            conn.execute("INSERT INTO place_names (name_key, nation, place_id) VALUES (?, ?, ?)",
+                         (key, query_nation, place_id))
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Warning: Could not update geocoding cache: {e}", file=sys.stderr)
+
+
+def read_gazetteer_places(path):
+    """
+    Read places from a gazetteer file for --load-gazetteer.
+
+    Accepts a GeoNames dump (tab-separated, no header; a .zip of one is read
+    directly) or a CSV with GAZETTEER_FIELDS columns and an optional population.
+
+    Args:
+        path: Path to the gazetteer file
+
+    Yields:
+        tuple: (names, nation, lat, lng, tz, population) where names lists the
+               place name first, then other spellings to index
+
+    Raises:
+        ValueError: If the file is in neither format or a row is invalid
+    """
+    import io
+    from itertools import chain
+
+    with ExitStack() as stack:
+        if path.suffix.lower() == '.zip':
+            import zipfile
+
+            archive = stack.enter_context(zipfile.ZipFile(path))
+            members = [m for m in archive.namelist() if m.endswith('.txt') and not m.startswith('readme')]
+            if not members:
+                raise ValueError(f"No .txt gazetteer in {path}")
+            f = stack.enter_context(io.TextIOWrapper(archive.open(members[0]), encoding='utf-8'))
+        else:
+            f = stack.enter_context(open(path, 'r', encoding='utf-8', newline=''))
+
+        first = f.readline()
+        lines = chain([first], f)
+        if first.count('\t') == GEONAMES_DUMP_COLUMNS - 1:
+            # GeoNames dump columns used: name, asciiname, lat, lng, country code, population, timezone
+            for line_no, line in enumerate(lines, start=1):
+                cols = line.rstrip('\r\n').split('\t')
+                if len(cols) != GEONAMES_DUMP_COLUMNS:
+                    raise ValueError(f"Line {line_no}: expected {GEONAMES_DUMP_COLUMNS} tab-separated columns")
+                try:
+                    yield ([cols[1], cols[2]], cols[8], float(cols[4]), float(cols[5]), cols[17],
+                           int(cols[14] or 0))
+                except ValueError as e:
+                    raise ValueError(f"Line {line_no}: {e}")
+            return
+
+        reader = csv.DictReader(lines)
+        missing = [field for field in GAZETTEER_FIELDS if field not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"Not a GeoNames dump, and the CSV header is missing: {', '.join(missing)}")
+        for line_no, row in enumerate(reader, start=2):
+            try:
+                yield ([row['name']], row['nation'], float(row['lat']), float(row['lng']), row['tz'],
+                       int(row.get('population') or 0))
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Line {line_no}: {e}")
+
+
+def load_gazetteer(path):
+    """
+    Import a gazetteer file into the local geocoding database (--load-gazetteer).
+
+    Replaces the previously loaded gazetteer in one transaction; remembered
+    GeoNames lookups are kept.
+
+    Args:
+        path: Path to a GeoNames dump or gazetteer CSV
+
+    Returns:
+        int: Number of places loaded
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a valid gazetteer
+    """
+    conn = open_geocode_db()
+    count = 0
+    with conn:
+        conn.execute("DELETE FROM place_names WHERE place_id IN (SELECT id FROM places WHERE source = 'gazetteer')")
+        conn.execute("DELETE FROM places WHERE source = 'gazetteer'")
+        for names, nation, lat, lng, tz, population in read_gazetteer_places(path):
+            nation = nation.upper()
+            place_id = conn.execute(
+                "INSERT INTO places (name, nation, latitude, longitude, timezone, population, source) "
+                "VALUES (?, ?, ?, ?, ?, ?, 'gazetteer')",
+                (names[0], nation, lat, lng, tz, population),
+            ).lastrowid
+            conn.executemany(
+                "INSERT OR IGNORE INTO place_names (name_key, nation, place_id) VALUES (?, ?, ?)",
+                [(key, nation, place_id) for key in {place_key(name) for name in names} if key],
+            )
+            count += 1
+    return count
+
+
+def search_places(query, nation=None, limit=10):
+    """
+    Search the local geocoding database by name prefix, then by fuzzy match.
+
+    Prefix matches come from the name index, most populous first. When nothing
+    matches the prefix, names starting with the same letter are compared with
+    difflib (similarity at least PLACE_FUZZY_CUTOFF) to catch typos.
+
+    Args:
+        query: Place name or prefix
+        nation: Optional two-letter country code filter
+        limit: Most places to return
+
+    Returns:
+        List[dict]: Place rows with an added 'match' ('prefix' or 'fuzzy')
+    """
+    from difflib import get_close_matches
+
+    key = place_key(query)
+    if not key or not GEOCODE_DB_PATH.exists():
+        return []
+    conn = open_geocode_db()
+    nation_clause = "AND n.nation = ?" if nation else ""
+    nation_params = [nation.upper()] if nation else []
+
+    def places_for(where, params, match):
+        rows = conn.execute(
+            f"""
+            SELECT DISTINCT p.* FROM place_names n JOIN places p ON p.id = n.place_id
+            WHERE {where} {nation_clause}
+            ORDER BY p.source = 'geonames' DESC, p.population DESC
+            LIMIT ?
+            """,
+            params + nation_params + [limit],
+        )
+        return [{**dict(row), 'match': match} for row in rows]
+
+    # name_key < key + U+10FFFF bounds the prefix range so the index is used
+    results = places_for("n.name_key >= ? AND n.name_key < ?", [key, key + '\U0010ffff'], 'prefix')
+    if not results:
+        candidates = [row[0] for row in conn.execute(
+            f"SELECT DISTINCT n.name_key FROM place_names n WHERE n.name_key >= ? AND n.name_key < ? "
+            f"{nation_clause}", [key[0], key[0] + '\U0010ffff'] + nation_params)]
+        seen = {row['id'] for row in results}
+        for name_key in get_close_matches(key, candidates, n=limit, cutoff=PLACE_FUZZY_CUTOFF):
+            for row in places_for("n.name_key = ?", [name_key], 'fuzzy'):
+                if row['id'] not in seen and len(results) < limit:
+                    seen.add(row['id'])
+                    results.append(row)
+    return results
+
+
+def find_place(query, nation=None, limit=None):
+    """
+    Print local geocoding matches for a place name (--find-place).
+
+    Args:
+        query: Place name or prefix
+        nation: Optional two-letter country code filter (--nation)
+        limit: Most places to print (--limit, default 10)
+
+    Returns:
+        0 if any place matched, 1 otherwise
+    """
+    import sqlite3
+
+    try:
+        places = search_places(query, nation, limit or 10)
+    except (ValueError, sqlite3.Error) as e:
+        print(f"Error: Could not search geocoding database: {e}", file=sys.stderr)
+        return 1
+    if not places:
+        print(f"No local match for '{query}'" + (f" in {nation.upper()}" if nation else "")
+              + " (load a gazetteer with --load-gazetteer)")
+        return 1
+    for place in places:
+        population = f"pop {place['population']:,}" if place['population'] else place['source']
+        print(f"{place['name']}, {place['nation']}  {place['latitude']:.4f}, {place['longitude']:.4f}  "
+              f"{place['timezone']}  ({population}, {place['match']})")
+    return 0
+
+
+def create_natal_subject(args):
+    """
+    Create the natal AstrologicalSubject for profile creation.
+
+    With args.city and args.nation the place is resolved locally first
+    (lookup_place(): remembered GeoNames lookups and the loaded gazetteer) and
+    the chart is built from those coordinates without network access; unknown
+    places go to the GeoNames online lookup, whose result is remembered.
+    args.geocode ('auto', 'offline' or 'online', see --geocode) can forbid or
+    force the online lookup. Otherwise offline coordinates (args.lat, args.lng,
+    args.tz). Placidus houses, with the full NATAL_ACTIVE_POINTS set.
+
+    Args:
+        args: Namespace with name, date, time and one location mode
+
+    Returns:
+        AstrologicalSubjectModel
+
+    Raises:
+        KerykeionException: If the GeoNames lookup fails, or the place is not
+                            known locally with --geocode=offline
+    """
+    from kerykeion import AstrologicalSubjectFactory, KerykeionException
+
+    if args.city and args.nation:
+        geocode = args.geocode
+        place = lookup_place(args.city, args.nation) if geocode != 'online' else None
+        if place is not None:
+            # Local hit: the coordinates GeoNames (or the gazetteer) gave for this query
+            return AstrologicalSubjectFactory.from_birth_data(
+                name=args.name,
+                year=args.date.year,
+                month=args.date.month,
+                day=args.date.day,
+                hour=args.time.hour,
+                minute=args.time.minute,
+                city=args.city,
+                nation=place['nation'],
+                lng=place['longitude'],
+                lat=place['latitude'],
+                tz_str=place['timezone'],
+                online=False,
+                houses_system_identifier='P',
+                active_points=NATAL_ACTIVE_POINTS,
+            )
+        if geocode == 'offline':
+            suggestions = search_places(args.city, args.nation, limit=3)
+            hint = f" Did you mean: {'; '.join(p['name'] for p in suggestions)}?" if suggestions else ""
+            raise KerykeionException(
+                f"'{args.city}, {args.nation}' is not in the local geocoding database.{hint}"
+            )
+
+        # GeoNames online mode
+        kwargs = {
+            'name': args.name,
+            'year': args.date.year,
+            'month': args.date.month,
+            'day': args.date.day,
+            'hour': args.time.hour,
+            'minute': args.time.minute,
+            'city': args.city,
+            'nation': args.nation,
+            'online': True,
+            'houses_system_identifier': 'P',
+            'active_points': NATAL_ACTIVE_POINTS,
+        }
+        geonames_username = os.getenv('KERYKEION_GEONAMES_USERNAME')
+        if geonames_username:
+            kwargs['geonames_username'] = geonames_username
+        subject = AstrologicalSubjectFactory.from_birth_data(**kwargs)
+        remember_place(args.city, args.nation, subject)
+        return subject
+
+    # Offline coordinate mode
+    return AstrologicalSubjectFactory.from_birth_data(
+        name=args.name,
+        year=args.date.year,
+        month=args.date.month,
+        day=args.date.day,
+        hour=args.time.hour,
+        minute=args.time.minute,
+        lng=args.lng,
+        lat=args.lat,
+        tz_str=args.tz,
+        online=False,
+        houses_system_identifier='P',
+        active_points=NATAL_ACTIVE_POINTS,
+    )
+
+
+def write_chart_files(profile_dir, subject, chart_dict):
+    """
+    Write chart.json and natal_model.json into a profile directory (or the store).
+
+    With the SQLite store both are written in one transaction; the directory is
+    still created for chart.svg.
+
+    Args:
+        profile_dir: Path — ~/.natal-charts/{slug}/ (created if missing)
+        subject: AstrologicalSubjectModel the chart was built from
+        chart_dict: dict from build_chart_json()
+
+    Returns:
+        Path or None: The chart.json path (None with the SQLite store)
+    """
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    clear_profile_cache(profile_dir.name)
+
+    if using_store():
+        store_write_profile(profile_dir.name, chart_dict,
+                            build_natal_model(subject, chart_dict['meta']),
+                            has_svg=(profile_dir / "chart.svg").exists())
+        return None
+
+    json_file = profile_dir / "chart.json"
+    write_json_atomic(json_file, chart_dict, indent=2)
+
+    # Persist the natal model so predictive modes deserialize instead of recomputing
+    write_natal_model(profile_dir, subject, chart_dict['meta'])
+    return json_file
+
+
+def render_chart_svg(subject, profile_dir):
+    """
+    Render the natal chart wheel to chart.svg using ChartDrawer.
+
+    Args:
+        subject: AstrologicalSubjectModel for the natal chart
+        profile_dir: Path — ~/.natal-charts/{slug}/
+
+    Returns:
+        Path or None: chart.svg path, or None if no SVG was produced
+    """
+    from kerykeion.charts.chart_drawer import ChartDrawer
+
+    # Try ChartDataFactory approach first (5.7.2 API)
+    try:
+        from kerykeion.chart_data_factory import ChartDataFactory
+        chart_data = ChartDataFactory.create_natal_chart_data(subject)
+        drawer = ChartDrawer(chart_data=chart_data)
+        drawer.save_svg(output_path=str(profile_dir), filename="chart", remove_css_variables=True)
+    except (ImportError, AttributeError):
+        # Fall back to direct subject approach
+        drawer = ChartDrawer(subject)
+        drawer.save_svg(output_path=str(profile_dir), filename="chart")
+
+    # Kerykeion may create files with different names - find and rename if needed
+    svg_files = list(profile_dir.glob("chart*.svg"))
+    if svg_files:
+        # If the file isn't exactly "chart.svg", rename it
+        if svg_files[0].name != "chart.svg":
+            svg_files[0].rename(profile_dir / "chart.svg")
+
+    svg_file = profile_dir / "chart.svg"
+    return svg_file if svg_file.exists() else None
+
+
+def svg_render_key(chart_dict):
+    """
+    Build the content key of a chart wheel: same key, same chart.svg.
+
+    Hashes chart.json without its generation time, plus the library versions
+    and SVG_RENDER_VERSION, so re-saving an unchanged profile keeps its key.
+
+    Args:
+        chart_dict: dict from build_chart_json() (or a parsed chart.json)
+
+    Returns:
+        str: Hex key
+    """
+    import hashlib
+
+    content = {
+        'chart': {**chart_dict, 'meta': {k: v for k, v in chart_dict['meta'].items() if k != 'generated_at'}},
+        'libraries': library_versions(),
+        'render': SVG_RENDER_VERSION,
+    }
+    text = json.dumps(content, sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def read_svg_key(path):
+    """
+    Read the render key stored in a chart.svg key file or render queue entry.
+
+    Args:
+        path: Path of the JSON file
+
+    Returns:
+        str or None: The key, or None if the file is missing or unreadable
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('key')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def svg_is_current(profile_dir, key):
+    """
+    Check whether a profile's chart.svg was rendered from chart data with this key.
+
+    Args:
+        profile_dir: Path — ~/.natal-charts/{slug}/
+        key: Key from svg_render_key()
+
+    Returns:
+        bool: True if chart.svg exists and its key file matches
+    """
+    return (profile_dir / "chart.svg").exists() and read_svg_key(profile_dir / SVG_KEY_FILENAME) == key
+
+
+def render_profile_svg(subject, profile_dir, key):
+    """
+    Render chart.svg and record the render key it was drawn for.
+
+    Args:
+        subject: AstrologicalSubjectModel for the natal chart
+        profile_dir: Path — ~/.natal-charts/{slug}/
+        key: Key from svg_render_key() for the chart being drawn
+
+    Returns:
+        Path or None: chart.svg path, or None if no SVG was produced
+    """
+    svg_file = render_chart_svg(subject, profile_dir)
+    if svg_file is not None:
+        write_json_atomic(profile_dir / SVG_KEY_FILENAME, {'key': key})
+    return svg_file
+
+
+def queue_svg_render(slug, key):
+    """
+    Add (or refresh) a profile's entry in the deferred render queue.
+
+    Args:
+        slug: Profile slug
+        key: Key from svg_render_key() for the chart to draw
+    """
+    SVG_QUEUE_DIR.mkdir(parents=True, exist_ok=True)
+    write_json_atomic(SVG_QUEUE_DIR / f"{slug}.json",
+                      {'key': key, 'queued_at': datetime.now(timezone.utc).isoformat()})
+
+
+def dequeue_svg_render(slug, key=None):
+    """
+    Remove a profile's render queue entry.
+
+    Args:
+        slug: Profile slug
+        key: Only remove the entry if it was queued for this key (a profile
+             re-saved during a render keeps its newer entry); None removes it
+             unconditionally
+    """
+    entry = SVG_QUEUE_DIR / f"{slug}.json"
+    if key is None or read_svg_key(entry) == key:
+        entry.unlink(missing_ok=True)
+
+
+def update_chart_svg(subject, profile_dir, chart_dict, mode='sync'):
+    """
+    Bring a just-saved profile's chart.svg in line with its chart data.
+
+    An up-to-date chart.svg (same svg_render_key()) is kept without rendering.
+    Otherwise the stale wheel is removed and, depending on mode, rendered now
+    ('sync'), queued for --render-pending ('defer') or left out ('off').
+
+    Args:
+        subject: AstrologicalSubjectModel the chart was built from
+        profile_dir: Path — ~/.natal-charts/{slug}/
+        chart_dict: dict from build_chart_json()
+        mode: One of SVG_MODES
+
+    Returns:
+        str: 'unchanged', 'rendered', 'missing' (rendered, but no chart.svg
+             appeared), 'queued' or 'off'
+    """
+    slug = profile_dir.name
+    key = svg_render_key(chart_dict)
+    if svg_is_current(profile_dir, key):
+        dequeue_svg_render(slug, key)
+        return 'unchanged'
+
+    (profile_dir / "chart.svg").unlink(missing_ok=True)
+    (profile_dir / SVG_KEY_FILENAME).unlink(missing_ok=True)
+    if mode == 'defer':
+        queue_svg_render(slug, key)
+        return 'queued'
+    dequeue_svg_render(slug)
+    if mode == 'off':
+        return 'off'
+    return 'rendered' if render_profile_svg(subject, profile_dir, key) is not None else 'missing'
+
+
+def pending_svg_renders():
+    """
+    Return the deferred render queue.
+
+    Returns:
+        List[tuple]: (slug, key) per queued profile, sorted by slug
+    """
+    if not SVG_QUEUE_DIR.exists():
+        return []
+    return [(entry.stem, read_svg_key(entry)) for entry in sorted(SVG_QUEUE_DIR.glob("*.json"))]
+
+
+def render_queued_svg(slug, key):
+    """
+    Render one queued chart.svg for --render-pending.
+
+    Runs inside a worker process, so it never raises: failures are returned in
+    the result dict. The subject comes from the persisted natal model.
+
+    Args:
+        slug: Profile slug
+        key: Render key the entry was queued with
+
+    Returns:
+        dict: slug, status ('rendered', 'unchanged' or None on failure), error
+    """
+    result = {'slug': slug, 'status': None, 'error': None}
+    profile_dir = CHARTS_DIR / slug
+    try:
+        subject, chart_dict = load_natal_profile(slug)
+        current_key = svg_render_key(chart_dict)
+        if svg_is_current(profile_dir, current_key):
+            result['status'] = 'unchanged'
+        elif render_profile_svg(subject, profile_dir, current_key) is not None:
+            result['status'] = 'rendered'
+            index_profile(profile_dir, chart_dict)
+        else:
+            result['error'] = "SVG generation may have failed - chart.svg not found"
+            return result
+        dequeue_svg_render(slug, key)
+    except FileNotFoundError as e:
+        # Profile deleted since it was queued: nothing left to draw
+        dequeue_svg_render(slug, key)
+        result['error'] = str(e)
+    except Exception as e:
+        result['error'] = f"SVG generation failed: {e}"
+    return result
+
+
+def render_pending(workers=None):
+    """
+    Drain the deferred render queue (--render-pending) using a process pool.
+
+    Entries whose chart.svg is already current are dropped without rendering.
+    Failed renders stay queued for the next run.
+
+    Args:
+        workers: Worker process count (default: os.cpu_count())
+
+    Returns:
+        0 if every queued render succeeded, 1 otherwise
+    """
+    started = time.perf_counter()
+    pending = pending_svg_renders()
+    if not pending:
+        print("No pending SVG renders.")
+        return 0
+
+    results = []
+
+    def report(result):
+        results.append(result)
+        if result['error']:
+            print(f"{result['slug']}: {result['error']}", file=sys.stderr)
+
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    if workers == 1:
+        for slug, key in pending:
+            report(render_queued_svg(slug, key))
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        # Load the chart stack before the pool starts so forked workers inherit it
+        import kerykeion  # noqa: F401
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(render_queued_svg, slug, key) for slug, key in pending]
+            for future in as_completed(futures):
+                report(future.result())
+
+    elapsed = time.perf_counter() - started
+    rendered = sum(1 for r in results if r['status'] == 'rendered')
+    unchanged = sum(1 for r in results if r['status'] == 'unchanged')
+    failed = sum(1 for r in results if r['error'])
+
+    print("\n=== RENDER COMPLETE ===")
+    print(f"Queued:    {len(results)}")
+    print(f"Rendered:  {rendered}")
+    print(f"Unchanged: {unchanged}")
+    print(f"Failed:    {failed}")
+    print(f"Workers:   {workers}")
+    print(f"Elapsed:   {elapsed:.2f}s")
+
+    return 0 if failed == 0 else 1
+
+
+# Columns/keys accepted in --batch CSV and JSONL records
+BATCH_FIELDS = ['name', 'date', 'time', 'city', 'nation', 'lat', 'lng', 'tz']
+
+
+def read_batch_records(path):
+    """
+    Read birth records for --batch from a CSV or JSONL file.
+
+    CSV files need a header row with BATCH_FIELDS column names; JSONL files hold
+    one JSON object per line with the same keys. Blank lines are skipped.
+
+    Args:
+        path: Path to a .csv, .jsonl or .ndjson file
+
+    Returns:
+        List[tuple]: (line_number, record dict or None, error str or None)
+
+    Raises:
+        ValueError: If the file extension is not supported
+    """
+    suffix = path.suffix.lower()
+    records = []
+    if suffix == '.csv':
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                if not any((value or '').strip() for value in row.values()):
+                    continue
+                records.append((reader.line_num, row, None))
+    elif suffix in ('.jsonl', '.ndjson'):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    records.append((line_no, None, f"Invalid JSON: {e}"))
+                    continue
+                if not isinstance(record, dict):
+                    records.append((line_no, None, "Record must be a JSON object"))
+                    continue
+                records.append((line_no, record, None))
+    else:
+        raise ValueError(f"Unsupported batch file type '{suffix}'. Use .csv or .jsonl")
+    return records
+
+
+def batch_record_to_args(record, geocode='auto'):
+    """
+    Validate one batch record and convert it to a profile-creation Namespace.
+
+    Applies the same validators and location-mode rules as the CLI.
+
+    Args:
+        record: dict with BATCH_FIELDS keys (values may be strings or numbers)
+        geocode: --city/--nation resolution, one of GEOCODE_MODES (--geocode)
+
+    Returns:
+        argparse.Namespace with name, date, time, city, nation, lat, lng, tz, geocode
+
+    Raises:
+        ValueError: If a field is missing or invalid
+    """
+    def field(key):
+        value = record.get(key)
+        if value is None:
+            return None
+        value = str(value).strip()
+        return value or None
+
+    name = field('name')
+    if not name:
+        raise ValueError("name is required")
+    if not field('date') or not field('time'):
+        raise ValueError("date and time are required")
+    if geocode not in GEOCODE_MODES:
+        raise ValueError(f"geocode must be one of {', '.join(GEOCODE_MODES)}, got {geocode!r}")
+
+    try:
+        args = argparse.Namespace(
+            name=name,
+            date=valid_date(field('date')),
+            time=valid_time(field('time')),
+            city=field('city'),
+            nation=field('nation'),
+            lat=valid_latitude(field('lat')) if field('lat') else None,
+            lng=valid_longitude(field('lng')) if field('lng') else None,
+            tz=field('tz'),
+            geocode=geocode,
+        )
+    except argparse.ArgumentTypeError as e:
+        raise ValueError(str(e))
+
+    has_geonames = args.city and args.nation
+    has_coords = args.lat is not None and args.lng is not None and args.tz
+    if not has_geonames and not has_coords:
+        raise ValueError("Must provide either (city and nation) or (lat, lng, tz)")
+    if has_geonames and has_coords:
+        raise ValueError("Cannot mix location modes: use either (city/nation) or (lat/lng/tz)")
+    return args
+
+
+def create_profile_from_record(line_no, record, force, svg='sync', geocode='auto'):
+    """
+    Create one profile (chart.json, natal model, chart.svg) from a batch record.
+
+    Runs inside a --batch worker process, so it never raises: failures are
+    returned in the result dict for the parent to report.
+
+    Args:
+        line_no: Source line number (for reporting)
+        record: Birth record dict
+        force: Overwrite an existing profile if True
+        svg: chart.svg mode, one of SVG_MODES (see update_chart_svg())
+        geocode: --city/--nation resolution, one of GEOCODE_MODES (--geocode)
+
+    Returns:
+        dict: line, name, slug, ok, error, svg (update_chart_svg() status, or
+              False if the profile was not written)
+    """
+    from slugify import slugify
+
+    result = {'line': line_no, 'name': record.get('name'), 'slug': None,
+              'ok': False, 'error': None, 'svg': False}
+    try:
+        args = batch_record_to_args(record, geocode)
+        result['slug'] = slugify(args.name)
+        profile_dir = CHARTS_DIR / result['slug']
+        if not force and profile_stamp(result['slug']) is not None:
+            raise ValueError("Profile already exists (use --force to overwrite)")
+
+        subject = create_natal_subject(args)
+        chart_dict = build_chart_json(subject, args)
+        write_chart_files(profile_dir, subject, chart_dict)
+        result['ok'] = True
+
+        try:
+            result['svg'] = update_chart_svg(subject, profile_dir, chart_dict, svg)
+        except Exception as e:
+            result['error'] = f"SVG generation failed: {e}"
+        index_profile(profile_dir, chart_dict)
+    except Exception as e:
+        result['error'] = str(e)
+    return result
+
+
+def run_batch(path, workers=None, force=False, svg='sync', geocode='auto'):
+    """
+    Create profiles for every record in a CSV/JSONL file using a process pool.
+
+    Chart computation and SVG rendering fan out across a ProcessPoolExecutor.
+    Per-record failures go to stderr as they complete; a summary with the total
+    records per second is printed at the end.
+
+    Args:
+        path: Path to the batch file
+        workers: Worker process count (default: os.cpu_count())
+        force: Overwrite existing profiles if True
+        svg: chart.svg mode, one of SVG_MODES (--svg)
+        geocode: --city/--nation resolution, one of GEOCODE_MODES (--geocode)
+
+    Returns:
+        0 if every record succeeded, 1 otherwise
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    # Load the chart stack before the pool starts so forked workers inherit it
+    import kerykeion  # noqa: F401
+    from slugify import slugify
+
+    started = time.perf_counter()
+    try:
+        records = read_batch_records(path)
+    except (OSError, ValueError) as e:
+        print(f"Error reading batch file: {e}", file=sys.stderr)
+        return 1
+
+    results = []
+    jobs = []
+    seen_slugs = {}
+
+    def report(result):
+        results.append(result)
+        if result['error']:
+            label = result['name'] or result['slug'] or '?'
+            print(f"Line {result['line']} ({label}): {result['error']}", file=sys.stderr)
+
+    for line_no, record, error in records:
+        if error is None:
+            slug = slugify(str(record.get('name') or ''))
+            if slug and slug in seen_slugs:
+                error = f"Duplicate profile '{slug}' (first seen on line {seen_slugs[slug]})"
+            elif slug:
+                seen_slugs[slug] = line_no
+        if error is not None:
+            report({'line': line_no, 'name': (record or {}).get('name'), 'slug': None,
+                    'ok': False, 'error': error, 'svg': False})
+        else:
+            jobs.append((line_no, record))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for line_no, record in jobs:
+            report(create_profile_from_record(line_no, record, force, svg, geocode))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(create_profile_from_record, line_no, record, force, svg, geocode)
+                for line_no, record in jobs
+            ]
+            for future in as_completed(futures):
+                report(future.result())
+
+    elapsed = time.perf_counter() - started
+    created = sum(1 for r in results if r['ok'])
+    failed = len(results) - created
+    rate = len(results) / elapsed if elapsed > 0 else 0.0
+
+    print("\n=== BATCH COMPLETE ===")
+    print(f"Records:  {len(results)}")
+    print(f"Created:  {created}")
+    print(f"Failed:   {failed}")
+    queued = sum(1 for r in results if r['svg'] == 'queued')
+    if queued:
+        print(f"SVGs:     {queued} queued (run --render-pending)")
+    print(f"Workers:  {workers}")
+    print(f"Elapsed:  {elapsed:.2f}s ({rate:.1f} records/s)")
+
+    return 0 if failed == 0 else 1
+
+
+def check_profile_slug(slug):
+    """
+    Validate a profile slug taken from a request before it touches the filesystem.
+
+    Only slugs that slugify() could have produced are accepted, so a request
+    cannot name a path outside CHARTS_DIR (e.g. '../..' or 'a/b').
+
+    Args:
+        slug: Requested profile slug
+
+    Returns:
+        str: The slug
+
+    Raises:
+        ValueError: If the slug is not a plain profile slug
+    """
+    from slugify import slugify
+
+    slug = str(slug)
+    if '/' in slug or slug.startswith('.') or slug != slugify(slug):
+        raise ValueError(f"Invalid profile slug '{slug}'")
+    return slug
+
+
+def profile_slugs():
+    """
+    Return the slugs of all saved profiles.
+
+    Returns:
+        List[str]: Sorted profile slugs (empty if there are none)
+    """
+    if using_store():
+        return [row['slug'] for row in open_store().execute("SELECT slug FROM profiles ORDER BY slug")]
+    return profile_dir_slugs()
+
+
+def profile_stamp(slug):
+    """
+    Return a stamp that changes whenever a profile's chart.json is rewritten.
+
+    Args:
+        slug: Profile slug
+
+    Returns:
+        tuple or None: (mtime_ns, size) of chart.json (write time and length in
+                       the store), or None if the profile does not exist
+    """
+    if using_store():
+        row = open_store().execute("SELECT chart_mtime_ns, chart_size FROM profiles WHERE slug = ?",
+                                   (slug,)).fetchone()
+        return None if row is None else (row['chart_mtime_ns'], row['chart_size'])
+    try:
+        stat = (CHARTS_DIR / slug / "chart.json").stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def read_profile_chart(slug):
+    """
+    Read and parse a profile's chart.json.
+
+    Args:
+        slug: Profile slug
+
+    Returns:
+        dict: Parsed chart.json
+
+    Raises:
+        FileNotFoundError: If the profile does not exist
+        OSError, json.JSONDecodeError: If chart.json cannot be read or parsed
+    """
+    if using_store():
+        row = open_store().execute("SELECT chart FROM profiles WHERE slug = ?", (slug,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"Profile '{slug}' not found in {STORE_PATH}")
+        return json.loads(row['chart'])
+    with open(CHARTS_DIR / slug / "chart.json", 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def profile_dir_slugs():
+    """
+    Return the slugs of all profile directories that have a chart.json.
+
+    Returns:
+        List[str]: Sorted profile slugs (empty if the charts directory is missing)
+    """
+    if not CHARTS_DIR.exists():
+        return []
+    return sorted(
+        d.name for d in CHARTS_DIR.iterdir()
+        if d.is_dir() and not d.name.startswith('.') and (d / "chart.json").exists()
+    )
+
+
+def open_profile_index():
+    """
+    Open (creating if needed) the SQLite profile index.
+
+    The index is a cache of chart.json summaries: an index written by another
+    PROFILE_INDEX_VERSION is dropped and rebuilt from the profile directories on
+    the next sync_profile_index().
+
+    Returns:
+        sqlite3.Connection with sqlite3.Row rows
+    """
+    import sqlite3
+
+    PROFILE_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(PROFILE_INDEX_PATH, timeout=30)
+    conn.row_factory = sqlite3.Row
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version != PROFILE_INDEX_VERSION:
+        # A new index may be created by several processes at once (--batch
+        # workers), so creation must be idempotent; only older versions are dropped
+        if version != 0:
+            with conn:
+                conn.executescript("DROP TABLE IF EXISTS profiles; DROP TABLE IF EXISTS index_meta;")
+        with conn:
+            conn.executescript(f"""
+                CREATE TABLE IF NOT EXISTS profiles (
+                    slug TEXT PRIMARY KEY,
+                    name TEXT,
+                    name_key TEXT,
+                    birth_date TEXT,
+                    birth_time TEXT,
+                    city TEXT,
+                    nation TEXT,
+                    latitude REAL,
+                    longitude REAL,
+                    timezone TEXT,
+                    sun_sign TEXT,
+                    moon_sign TEXT,
+                    asc_sign TEXT,
+                    has_chart INTEGER NOT NULL,
+                    has_svg INTEGER NOT NULL,
+                    chart_mtime_ns INTEGER,
+                    chart_size INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS profiles_name_key ON profiles (name_key);
+                CREATE INDEX IF NOT EXISTS profiles_birth_date ON profiles (birth_date);
+                CREATE INDEX IF NOT EXISTS profiles_signs ON profiles (sun_sign, moon_sign, asc_sign);
+                PRAGMA user_version = {PROFILE_INDEX_VERSION};
+            """)
+    return conn
+
+
+def profile_index_row(profile_dir, chart_dict=None):
+    """
+    Build the index row for one profile directory.
+
+    Args:
+        profile_dir: Path — ~/.natal-charts/{slug}/
+        chart_dict: Parsed chart.json if already in hand (read from disk otherwise)
+
+    Returns:
+        dict: Column values for the profiles table (summary columns are None when
+              chart.json is missing or unreadable)
+    """
+    chart_json = profile_dir / "chart.json"
+    row = dict.fromkeys(PROFILE_INDEX_COLUMNS)
+    row.update(slug=profile_dir.name, has_chart=0,
+               has_svg=int((profile_dir / "chart.svg").exists()))
+    try:
+        stat = chart_json.stat()
+    except OSError:
+        return row
+    row.update(has_chart=1, chart_mtime_ns=stat.st_mtime_ns, chart_size=stat.st_size)
+
+    try:
+        if chart_dict is None:
+            with open(chart_json, 'r', encoding='utf-8') as f:
+                chart_dict = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return row  # Indexed as invalid chart data
+    row.update(profile_summary(chart_dict))
+    return row
+
+
+def profile_summary(chart_dict):
+    """
+    Extract the searchable summary columns from a chart.json dict.
+
+    Args:
+        chart_dict: Parsed chart.json
+
+    Returns:
+        dict: name, name_key, birth data, location and Sun/Moon/ASC sign columns
+              (empty if the chart is malformed)
+    """
+    summary = {}
+    try:
+        meta = chart_dict['meta']
+        loc = meta.get('location', {})
+        planet_signs = {p['name']: p['sign'] for p in chart_dict.get('planets', [])}
+        angle_signs = {a['name']: a['sign'] for a in chart_dict.get('angles', [])}
+        summary.update(
+            name=meta['name'],
+            name_key=meta['name'].casefold(),
+            birth_date=meta.get('birth_date'),
+            birth_time=meta.get('birth_time'),
+            city=loc.get('city'),
+            nation=loc.get('nation'),
+            latitude=loc.get('latitude'),
+            longitude=loc.get('longitude'),
+            timezone=loc.get('timezone'),
+            sun_sign=planet_signs.get('Sun'),
+            moon_sign=planet_signs.get('Moon'),
+            asc_sign=angle_signs.get('ASC'),
+        )
+    except (KeyError, TypeError, AttributeError):
+        return {}
+    return summary
+
+
+def upsert_profile_row(conn, row):
+    """
+    Insert or replace one profile's index row.
+
+    Args:
+        conn: Connection from open_profile_index()
+        row: dict from profile_index_row()
+    """
+    conn.execute(
+        f"INSERT OR REPLACE INTO profiles ({', '.join(PROFILE_INDEX_COLUMNS)}) "
+        f"VALUES ({', '.join('?' * len(PROFILE_INDEX_COLUMNS))})",
+        [row[column] for column in PROFILE_INDEX_COLUMNS],
+    )
+
+
+def index_profile(profile_dir, chart_dict=None, files=False):
+    """
+    Record a just-written profile in the profile index.
+
+    Called after chart.json and chart.svg are written. The index is a cache, so
+    a failure only warns; the next sync_profile_index() repairs it.
+
+    Args:
+        profile_dir: Path — ~/.natal-charts/{slug}/
+        chart_dict: dict from build_chart_json() (read from disk if None)
+        files: Update the files-layout index even while the SQLite store is
+               active (--store-export writes the file layout)
+    """
+    import sqlite3
+
+    try:
+        if using_store() and not files:
+            # The store row is its own index; only the SVG flag can be stale
+            conn = open_store()
+            with conn:
+                conn.execute("UPDATE profiles SET has_svg = ? WHERE slug = ?",
+                             (int((profile_dir / "chart.svg").exists()), profile_dir.name))
+            return
+        conn = open_profile_index()
+        try:
+            with conn:
+                upsert_profile_row(conn, profile_index_row(profile_dir, chart_dict))
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: Could not update profile index: {e}", file=sys.stderr)
+
+
+def sync_profile_index(conn, full=False):
+    """
+    Bring the profile index up to date with the profile directories.
+
+    Every profile directory is stat()ed on each sync (chart.json and chart.svg
+    can change inside a directory without touching CHARTS_DIR itself); only
+    chart.json files whose (mtime, size) changed are read again, and rows for
+    removed directories are deleted.
+
+    Args:
+        conn: Connection from open_profile_index()
+        full: Re-read every chart.json regardless of recorded stamps (--reindex)
+    """
+    known = {
+        row['slug']: (row['chart_mtime_ns'], row['chart_size'], row['has_svg'])
+        for row in conn.execute("SELECT slug, chart_mtime_ns, chart_size, has_svg FROM profiles")
+    }
+    present = set()
+    with conn:
+        for profile_dir in CHARTS_DIR.iterdir():
+            if not profile_dir.is_dir() or profile_dir.name.startswith('.'):
+                continue
+            present.add(profile_dir.name)
+            try:
+                stat = (profile_dir / "chart.json").stat()
+                chart_stamp = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                chart_stamp = (None, None)
+            stamp = chart_stamp + (int((profile_dir / "chart.svg").exists()),)
+            if full or known.get(profile_dir.name) != stamp:
+                upsert_profile_row(conn, profile_index_row(profile_dir))
+        conn.executemany("DELETE FROM profiles WHERE slug = ?",
+                         [(slug,) for slug in known.keys() - present])
+
+
+def query_profile_index(conn, filters=None, limit=None, offset=0):
+    """
+    Select profiles from the index, ordered by slug.
+
+    Args:
+        conn: Connection from open_profile_index() (synced by the caller)
+        filters: Optional dict with any of name_prefix (case-insensitive),
+                 born_from / born_to (YYYY-MM-DD, inclusive), location
+                 (case-insensitive substring of city or nation), sun / moon / asc
+                 (3-letter sign)
+        limit: Maximum rows to return (None for all)
+        offset: Rows to skip (pagination)
+
+    Returns:
+        tuple: (total matching count, List[sqlite3.Row] for the requested page)
+    """
+    filters = filters or {}
+    clauses, params = [], []
+    if filters.get('name_prefix'):
+        # Range scan on the name_key index (a LIKE prefix would not use it)
+        prefix = filters['name_prefix'].casefold()
+        clauses.append("name_key >= ? AND name_key < ?")
+        params += [prefix, prefix + '\U0010ffff']
+    if filters.get('born_from'):
+        clauses.append("birth_date >= ?")
+        params.append(filters['born_from'])
+    if filters.get('born_to'):
+        clauses.append("birth_date <= ?")
+        params.append(filters['born_to'])
+    if filters.get('location'):
+        clauses.append("(instr(lower(city), ?) > 0 OR instr(lower(nation), ?) > 0)")
+        params += [filters['location'].lower()] * 2
+    for key, column in (('sun', 'sun_sign'), ('moon', 'moon_sign'), ('asc', 'asc_sign')):
+        if filters.get(key):
+            clauses.append(f"{column} = ?")
+            params.append(filters[key])
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    total = conn.execute(f"SELECT count(*) FROM profiles{where}", params).fetchone()[0]
+    rows = conn.execute(
+        f"SELECT * FROM profiles{where} ORDER BY slug LIMIT ? OFFSET ?",
+        params + [-1 if limit is None else limit, offset],
+    ).fetchall()
+    return total, rows
+
+
+def set_store_backend(backend):
+    """
+    Select the profile/snapshot storage backend for this process.
+
+    Also exported as NATAL_CHARTS_STORE so worker processes (--batch) use it too.
+
+    Args:
+        backend: 'files' or 'sqlite'
+    """
+    _STORE_STATE['backend'] = backend
+    os.environ['NATAL_CHARTS_STORE'] = backend
+
+
+def using_store():
+    """
+    Return True when profiles and snapshots live in the SQLite store.
+
+    Returns:
+        bool: True for the 'sqlite' backend, False for 'files'
+    """
+    return _STORE_STATE['backend'] == 'sqlite'
+
+
+def open_store():
+    """
+    Open the SQLite profile/snapshot store (once per process).
+
+    The store runs in WAL mode, so readers never block the single writer and
+    concurrent writers (--batch workers, parallel --save runs) queue on the
+    busy timeout instead of interleaving. A connection is never shared across
+    a fork: a worker process opens its own.
+
+    Returns:
+        sqlite3.Connection with sqlite3.Row rows
+    """
+    import sqlite3
+
+    conn = _STORE_STATE['connections'].get(os.getpid())
+    if conn is not None:
+        return conn
+
+    STORE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(STORE_PATH, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version == 0:
+        # Profile columns match the profile index, so query_profile_index() reads
+        # the store directly; chart_mtime_ns/chart_size stamp each write. IF NOT
+        # EXISTS: parallel workers may create a new store at the same time
+        columns = ', '.join(
+            f"{column} TEXT PRIMARY KEY" if column == 'slug' else column
+            for column in PROFILE_INDEX_COLUMNS
+        )
+        with conn:
+            conn.executescript(f"""
+                CREATE TABLE IF NOT EXISTS profiles ({columns}, chart TEXT NOT NULL, natal_model TEXT);
+                CREATE INDEX IF NOT EXISTS profiles_name_key ON profiles (name_key);
+                CREATE INDEX IF NOT EXISTS profiles_birth_date ON profiles (birth_date);
+                CREATE INDEX IF NOT EXISTS profiles_signs ON profiles (sun_sign, moon_sign, asc_sign);
+                {STORE_SNAPSHOT_SCHEMA}
+                PRAGMA user_version = {STORE_VERSION};
+            """)
+    elif version == 1:
+        # Version 1 kept one uncompressed snapshot per slug, mode and date
+        with conn:
+            conn.executescript(STORE_SNAPSHOT_SCHEMA)
+            for row in conn.execute("SELECT slug, mode, date, data, saved_at FROM snapshots").fetchall():
+                digest, blob, calculated_at, size = pack_snapshot(json.loads(row['data']))
+                store_write_snapshot(row['slug'], {
+                    'saved_at': row['saved_at'], 'mode': row['mode'], 'date': row['date'],
+                    'hash': digest, 'calculated_at': calculated_at, 'size': size,
+                }, blob, conn=conn)
+            conn.execute("DROP TABLE snapshots")
+            conn.execute(f"PRAGMA user_version = {STORE_VERSION}")
+    elif version != STORE_VERSION:
+        conn.close()
+        raise ValueError(f"Unsupported store version {version} in {STORE_PATH} (expected {STORE_VERSION})")
+
+    _STORE_STATE['connections'][os.getpid()] = conn
+    return conn
+
+
+def store_write_profile(slug, chart_dict, natal_model=None, has_svg=False, conn=None):
+    """
+    Insert or replace one profile in the store.
+
+    Args:
+        slug: Profile slug
+        chart_dict: chart.json dict
+        natal_model: Natal model dict (None leaves the profile without one)
+        has_svg: Whether CHARTS_DIR/{slug}/chart.svg exists
+        conn: Store connection with a transaction already open (None writes in
+              a transaction of its own)
+    """
+    if conn is None:
+        conn = open_store()
+        with conn:
+            return store_write_profile(slug, chart_dict, natal_model, has_svg, conn)
+
+    chart_text = json.dumps(chart_dict, ensure_ascii=False)
+    row = profile_summary(chart_dict)
+    row.update(slug=slug, has_chart=1, has_svg=int(has_svg),
+               chart_mtime_ns=time.time_ns(), chart_size=len(chart_text))
+    columns = PROFILE_INDEX_COLUMNS + ('chart', 'natal_model')
+    values = [row.get(column) for column in PROFILE_INDEX_COLUMNS] + [
+        chart_text, None if natal_model is None else json.dumps(natal_model, ensure_ascii=False)]
+    conn.execute(
+        f"INSERT OR REPLACE INTO profiles ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' * len(columns))})",
+        values,
+    )
+
+
+def store_write_snapshot(slug, run, blob, conn=None):
+    """
+    Add one snapshot run and its payload to the store.
+
+    Args:
+        slug: Profile slug
+        run: Run dict from archive_snapshot() (saved_at, mode, date, hash,
+             calculated_at, size)
+        blob: gzip payload bytes from pack_snapshot() (stored once per hash)
+        conn: Store connection with a transaction already open (None writes in
+              a transaction of its own)
+    """
+    if conn is None:
+        conn = open_store()
+        with conn:
+            return store_write_snapshot(slug, run, blob, conn)
+
+    conn.execute("INSERT OR IGNORE INTO snapshot_blobs (hash, data) VALUES (?, ?)", (run['hash'], blob))
+    conn.execute(
+        "INSERT OR REPLACE INTO snapshot_runs (slug, saved_at, mode, date, hash, calculated_at, size) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (slug, run['saved_at'], run['mode'], run['date'], run['hash'], run['calculated_at'], run['size']),
+    )
+
+
+def query_snapshots(slug=None, mode=None, date_from=None, date_to=None):
+    """
+    Select stored snapshot runs by the indexed slug, mode and date columns.
+
+    Args:
+        slug: Only this profile (None for all)
+        mode: Only this snapshot mode (None for all)
+        date_from: Earliest YYYY-MM-DD date, inclusive (None for no bound)
+        date_to: Latest YYYY-MM-DD date, inclusive (None for no bound)
+
+    Returns:
+        List[sqlite3.Row]: slug, saved_at, mode, date, hash, calculated_at, size
+                           and data (gzip payload; see unpack_snapshot()), ordered
+                           by slug, mode, date and saved_at
+    """
+    clauses, params = [], []
+    for column, op, value in (('slug', '=', slug), ('mode', '=', mode),
+                              ('date', '>=', date_from), ('date', '<=', date_to)):
+        if value is not None:
+            clauses.append(f"r.{column} {op} ?")
+            params.append(value)
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return open_store().execute(
+        "SELECT r.slug, r.saved_at, r.mode, r.date, r.hash, r.calculated_at, r.size, b.data "
+        f"FROM snapshot_runs r JOIN snapshot_blobs b ON b.hash = r.hash{where} "
+        "ORDER BY r.slug, r.mode, r.date, r.saved_at",
+        params,
+    ).fetchall()
+
+
+def import_files_to_store():
+    """
+    Copy every CHARTS_DIR profile (chart.json, natal_model.json, snapshots) into the store.
+
+    Runs in one transaction, so an interrupted import leaves the store as it
+    was; existing profiles and runs with the same timestamp are replaced.
+    Archived runs keep their timestamps; legacy {mode}-{date}.json files are
+    imported as runs saved at their mtime. chart.svg files stay where they are.
+
+    Returns:
+        tuple: (profiles imported, snapshot runs imported)
+    """
+    conn = open_store()
+    profiles = snapshots = 0
+    with conn:
+        for slug in profile_dir_slugs():
+            profile_dir = CHARTS_DIR / slug
+            try:
+                with open(profile_dir / "chart.json", 'r', encoding='utf-8') as f:
+                    chart_dict = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Warning: Skipping profile '{slug}': {e}", file=sys.stderr)
+                continue
+            try:
+                with open(profile_dir / NATAL_MODEL_FILENAME, 'r', encoding='utf-8') as f:
+                    natal_model = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                natal_model = None
+            store_write_profile(slug, chart_dict, natal_model,
+                                has_svg=(profile_dir / "chart.svg").exists(), conn=conn)
+            profiles += 1
+
+            objects = snapshot_archive_dir(slug) / "objects"
+            for run in read_archive_runs(slug):
+                try:
+                    blob = (objects / f"{run['hash']}.json.gz").read_bytes()
+                except OSError as e:
+                    print(f"Warning: Skipping snapshot run {slug} @ {run['saved_at']}: {e}", file=sys.stderr)
+                    continue
+                store_write_snapshot(slug, run, blob, conn=conn)
+                snapshots += 1
+
+            for path, mode, date_str in legacy_snapshot_files(slug):
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    saved_at = datetime.fromtimestamp(path.stat().st_mtime, timezone.utc).isoformat()
+                except (OSError, json.JSONDecodeError) as e:
+                    print(f"Warning: Skipping snapshot {path}: {e}", file=sys.stderr)
+                    continue
+                digest, blob, calculated_at, size = pack_snapshot(data)
+                store_write_snapshot(slug, {
+                    'saved_at': saved_at, 'mode': mode, 'date': date_str,
+                    'hash': digest, 'calculated_at': calculated_at, 'size': size,
+                }, blob, conn=conn)
+                snapshots += 1
+    return profiles, snapshots
+
+
+def export_store_to_files():
+    """
+    Write every stored profile and snapshot back out in the CHARTS_DIR file layout.
+
+    Files are written atomically in the same format the files backend uses, so
+    the result can be read with --store files (or re-imported). Snapshot runs
+    are added to each profile's archive unless a run with the same timestamp
+    and mode is already there. Each exported profile is re-indexed and its
+    snapshot cache cleared, as after any other chart.json rewrite.
+
+    Returns:
+        tuple: (profiles exported, snapshot runs exported)
+    """
+    conn = open_store()
+    profiles = 0
+    for row in conn.execute("SELECT slug, chart, natal_model FROM profiles ORDER BY slug"):
+        profile_dir = CHARTS_DIR / row['slug']
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        chart_dict = json.loads(row['chart'])
+        write_json_atomic(profile_dir / "chart.json", chart_dict, indent=2)
+        if row['natal_model'] is not None:
+            write_json_atomic(profile_dir / NATAL_MODEL_FILENAME, json.loads(row['natal_model']))
+        clear_profile_cache(row['slug'])
+        index_profile(profile_dir, chart_dict, files=True)
+        profiles += 1
+
+    snapshots = 0
+    by_slug = {}
+    for row in query_snapshots():
+        by_slug.setdefault(row['slug'], []).append(row)
+    for slug, rows in by_slug.items():
+        existing = {(run['saved_at'], run['mode']) for run in read_archive_runs(slug)}
+        entries = [
+            ({key: row[key] for key in ('saved_at', 'mode', 'date', 'hash', 'calculated_at', 'size')},
+             row['data'])
+            for row in rows if (row['saved_at'], row['mode']) not in existing
+        ]
+        if entries:
+            write_archive_runs(slug, entries)
+        snapshots += len(entries)
+    return profiles, snapshots
+
+
+def legacy_snapshot_files(slug):
+    """
+    Return a profile's snapshot files from before the archive ({mode}-{date}.json).
+
+    Args:
+        slug: Profile slug
+
+    Returns:
+        List[tuple]: (Path, mode, date) in file name order
+    """
+    files = []
+    for path in sorted((CHARTS_DIR / slug).glob("*.json")):
+        match = SNAPSHOT_FILENAME_RE.match(path.name)
+        if match:
+            files.append((path, match.group(1), match.group(2)))
+    return files
+
+
+def snapshot_disk_usage(slug):
+    """
+    Return the bytes a profile's snapshots occupy in CHARTS_DIR.
+
+    Args:
+        slug: Profile slug
+
+    Returns:
+        int: Legacy snapshot files plus the archive directory, in bytes
+    """
+    size = sum(path.stat().st_size for path, _mode, _date in legacy_snapshot_files(slug))
+    archive_dir = snapshot_archive_dir(slug)
+    if archive_dir.exists():
+        size += sum(path.stat().st_size for path in archive_dir.rglob("*") if path.is_file())
+    return size
+
+
+def describe_retention(policy):
+    """
+    Describe a retention policy in one line.
+
+    Args:
+        policy: dict from retention_policy()
+
+    Returns:
+        str: Human-readable policy
+    """
+    limit = f"at most {policy['keep_runs']} run(s)" if policy['keep_runs'] else "no run limit"
+    return (f"keep every run from the last {policy['keep_days']} day(s); older runs: newest "
+            f"{policy['keep_per_date']} per mode and date; {limit}")
+
+
+def compact_snapshots(slugs=None):
+    """
+    Enforce the retention policy on snapshot archives and fold legacy files in.
+
+    Each legacy {mode}-{date}.json file is archived as a run saved at its mtime
+    and then deleted. Runs the policy no longer keeps are dropped, along with
+    payloads no remaining run references. With the SQLite store, the store file
+    is vacuumed afterwards.
+
+    Args:
+        slugs: Profile slugs to compact (None or empty for every profile)
+
+    Returns:
+        0 on success, 1 on error
+    """
+    try:
+        policy = retention_policy()
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    slugs = slugs or profile_slugs()
+    missing = [slug for slug in slugs if profile_stamp(slug) is None]
+    if missing:
+        print(f"Error: Profile '{missing[0]}' not found. Run --list to see available profiles.",
+              file=sys.stderr)
+        return 1
+
+    migrated = dropped = deleted = before = after = 0
+    for slug in slugs:
+        before += snapshot_disk_usage(slug)
+        for path, mode, date_str in legacy_snapshot_files(slug):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                saved_at = datetime.fromtimestamp(path.stat().st_mtime, timezone.utc).isoformat()
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Warning: Skipping snapshot {path}: {e}", file=sys.stderr)
+                continue
+            archive_snapshot(slug, mode, date_str, data, saved_at=saved_at)
+            path.unlink()
+            migrated += 1
+        runs_dropped, payloads_deleted = apply_retention(slug, policy, sweep=True)
+        dropped += runs_dropped
+        deleted += payloads_deleted
+        after += snapshot_disk_usage(slug)
+
+    print("=== SNAPSHOT COMPACTION ===")
+    print(f"Profiles:  {len(slugs)}")
+    print(f"Migrated:  {migrated} legacy file(s)")
+    print(f"Dropped:   {dropped} run(s), {deleted} payload(s)")
+    if using_store():
+        open_store().execute("VACUUM")
+        print(f"Files:     {before / 1024:.1f} KB -> {after / 1024:.1f} KB "
+              f"(store: {STORE_PATH.stat().st_size / 1024:.1f} KB)")
+    else:
+        print(f"Disk:      {before / 1024:.1f} KB -> {after / 1024:.1f} KB")
+    print(f"Policy:    {describe_retention(policy)}")
+    return 0
+
+
+def list_snapshots(slug):
+    """
+    Print every archived run of a profile with its timestamp and payload hash.
+
+    Args:
+        slug: Profile slug
+
+    Returns:
+        0 on success, 1 if the profile does not exist
+    """
+    if profile_stamp(slug) is None:
+        print(f"Error: Profile '{slug}' not found. Run --list to see available profiles.", file=sys.stderr)
+        return 1
+
+    runs = snapshot_runs(slug)
+    hashes = sorted({run['hash'] for run in runs})
+    if using_store():
+        stored = sum(len(row['data']) for row in open_store().execute(
+            f"SELECT data FROM snapshot_blobs WHERE hash IN ({', '.join('?' * len(hashes))})", hashes))
+    else:
+        objects = snapshot_archive_dir(slug) / "objects"
+        stored = sum((objects / f"{digest}.json.gz").stat().st_size for digest in hashes
+                     if (objects / f"{digest}.json.gz").exists())
+    raw = sum(run['size'] for run in runs)
+
+    print(f"Snapshots for {slug}: {len(runs)} run(s), {len(hashes)} unique payload(s), "
+          f"{stored / 1024:.1f} KB stored ({raw / 1024:.1f} KB uncompressed)")
+    for run in runs:
+        print(f"  {run['saved_at']:<34}{run['mode']:<20}{run['date']:<12}{run['hash'][:12]}")
+    legacy = legacy_snapshot_files(slug)
+    if legacy:
+        print(f"  ({len(legacy)} legacy snapshot file(s) not archived yet; run --compact-snapshots)")
+    return 0
+
+
+def show_snapshot(slug, when):
+    """
+    Print the snapshot an archived run saved, addressed by its timestamp.
+
+    Args:
+        slug: Profile slug
+        when: The run's saved_at timestamp, or any prefix matching exactly one run
+
+    Returns:
+        0 on success, 1 if no single run matches
+    """
+    if profile_stamp(slug) is None:
+        print(f"Error: Profile '{slug}' not found. Run --list to see available profiles.", file=sys.stderr)
+        return 1
+
+    matches = [run for run in snapshot_runs(slug) if run['saved_at'].startswith(when)]
+    exact = [run for run in matches if run['saved_at'] == when]
+    matches = exact or matches
+    if len(matches) != 1:
+        problem = "no" if not matches else f"{len(matches)}"
+        print(f"Error: {problem} snapshot runs of '{slug}' match '{when}' "
+              f"(see --snapshots {slug})", file=sys.stderr)
+        return 1
+    try:
+        data = read_snapshot(slug, matches[0])
+    except (OSError, ValueError) as e:
+        print(f"Error: Could not read snapshot: {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(data, indent=2))
+    return 0
+
+
+def profile_filters(args):
+    """
+    Collect the --list filter options that were given.
+
+    Args:
+        args: Parsed argparse Namespace
+
+    Returns:
+        dict: Filters for query_profile_index() (empty when none were given)
+    """
+    filters = {
+        'name_prefix': args.name_prefix,
+        'born_from': args.born_from.strftime("%Y-%m-%d") if args.born_from else None,
+        'born_to': args.born_to.strftime("%Y-%m-%d") if args.born_to else None,
+        'location': args.location,
+        'sun': args.sun,
+        'moon': args.moon,
+        'asc': args.asc,
+    }
+    return {key: value for key, value in filters.items() if value}
+
+
+def list_profiles(filters=None, limit=None, offset=0, reindex=False):
+    """
+    List chart profiles with person names and birth details, from the profile index
+    (or the SQLite store, which needs no sync).
+
+    Args:
+        filters: Optional dict for query_profile_index() (None lists every profile)
+        limit: Maximum profiles to print (None for all)
+        offset: Matching profiles to skip (pagination)
+        reindex: Re-read every chart.json into the index first
+
+    Returns:
+        0 on success, 1 if the profile index cannot be read
+    """
+    import sqlite3
+
+    if not CHARTS_DIR.exists():
+        print("No chart profiles found")
+        print(f"(Directory {CHARTS_DIR} does not exist)")
+        return 0
+
+    try:
+        if using_store():
+            total, rows = query_profile_index(open_store(), filters, limit, offset)
+        else:
+            conn = open_profile_index()
+            try:
+                sync_profile_index(conn, full=reindex)
+                total, rows = query_profile_index(conn, filters, limit, offset)
+            finally:
+                conn.close()
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Error: Could not read profile index: {e}", file=sys.stderr)
+        return 1
+
+    if not total:
+        print("No chart profiles found matching the filters" if filters else "No chart profiles found")
+        return 0
+
+    if limit is None and not offset:
+        print(f"Found {total} chart profile(s):\n")
+    elif rows:
+        print(f"Found {total} chart profile(s), showing {offset + 1}-{offset + len(rows)}:\n")
+    else:
+        print(f"Found {total} chart profile(s), none after offset {offset}")
+
+    for row in rows:
+        # Display profile slug as header
+        print(f"  {row['slug']}/")
+
+        if row['has_chart']:
+            if row['name'] is None:
+                print("    (invalid chart data)")
+            else:
+                print(f"    Name:     {row['name']}")
+                print(f"    Born:     {row['birth_date'] or '?'} at {row['birth_time'] or '?'}")
+                if row['city'] and row['nation']:
+                    print(f"    Location: {row['city']}, {row['nation']}")
+                else:
+                    lat = '?' if row['latitude'] is None else row['latitude']
+                    lng = '?' if row['longitude'] is None else row['longitude']
+                    print(f"    Location: {lat}, {lng} ({row['timezone'] or '?'})")
+
+        # Show file status
+        files = []
+        if row['has_chart']: files.append("chart.json")
+        if row['has_svg']: files.append("chart.svg")
+        print(f"    Files:    {', '.join(files) if files else 'none'}")
+        print()
+
+    return 0
+
+
+def api_date(value, name):
+    """
+    Convert a library API date argument to the naive datetime the CLI parser produces.
+
+    Args:
+        value: datetime.date, datetime.datetime or 'YYYY-MM-DD' string (or None)
+        name: Parameter name for error messages
+
+    Returns:
+        datetime or None: Midnight of the date, as from valid_query_date()
+
+    Raises:
+        ValueError: If the value is not a date or lies outside 1900-2100
+    """
+    if value is None:
+        return None
+    if hasattr(value, 'strftime'):
+        value = value.strftime("%Y-%m-%d")
+    try:
+        return valid_query_date(str(value))
+    except argparse.ArgumentTypeError as e:
+        raise ValueError(f"{name}: {e}")
+
+
+def api_choice(value, name, choices):
+    """
+    Check a library API argument against the choices of its CLI flag.
+
+    Args:
+        value: Argument value (None keeps the CLI default)
+        name: Parameter name for error messages
+        choices: Allowed values
+
+    Returns:
+        The value
+
+    Raises:
+        ValueError: If the value is not one of the choices
+    """
+    if value is not None and value not in choices:
+        raise ValueError(f"{name} must be one of {', '.join(choices)}, got {value!r}")
+    return value
+
+
+def query_namespace(**params):
+    """
+    Build the query Namespace the CLI parser would produce for a library API call.
+
+    Starts from the parser's defaults (so results and snapshot cache keys match
+    the equivalent command line) and sets every param that is not None.
+
+    Args:
+        **params: Namespace attributes, already converted to their CLI types
+
+    Returns:
+        argparse.Namespace
+    """
+    args = shared_parser().parse_args([])
+    for name, value in params.items():
+        if value is not None:
+            setattr(args, name, value)
+    return args
+
+
+def run_query(mode, slug, compute, args, cache):
+    """
+    Run a library API query, through the snapshot cache when asked to.
+
+    Args:
+        mode: SERVE_MODES key
+        slug: Profile slug
+        compute: The mode's compute function (compute_transits() etc.)
+        args: Namespace from query_namespace()
+        cache: Read and write the snapshot cache (as the CLI does) if True
+
+    Returns:
+        dict: The mode's result JSON dict
+    """
+    if not cache:
+        return compute(args)
+    result, _hit = cached_compute(mode, slug, compute, args)
+    return result
+
+
+def natal(name, date, time, lat=None, lng=None, tz=None, city=None, nation=None, stars='major',
+          geocode='auto'):
+    """
+    Compute a natal chart without creating a profile.
+
+    Takes the same birth data as profile creation: name, date and time plus
+    either coordinates (lat, lng, tz; offline) or city and nation (GeoNames).
+
+    Args:
+        name: Person's name
+        date: Birth date (datetime.date or 'YYYY-MM-DD')
+        time: Birth time (datetime.time or 'HH:MM')
+        lat: Birth latitude
+        lng: Birth longitude
+        tz: IANA timezone name
+        city: Birth city (with nation)
+        nation: Two-letter country code (with city)
+        stars: 'major' or 'all' fixed stars checked for conjunctions
+        geocode: City resolution as --geocode: 'auto' (local, then GeoNames),
+                 'offline' (local only) or 'online' (always GeoNames)
+
+    Returns:
+        dict: Chart JSON, as written to chart.json
+
+    Raises:
+        ValueError: If the birth data is incomplete or invalid
+        KerykeionException: If the GeoNames lookup fails, or the city is unknown
+                            locally with geocode='offline'
+    """
+    record = {'name': name, 'date': date, 'time': time, 'lat': lat, 'lng': lng,
+              'tz': tz, 'city': city, 'nation': nation}
+    if hasattr(date, 'strftime'):
+        record['date'] = date.strftime("%Y-%m-%d")
+    if hasattr(time, 'strftime'):
+        record['time'] = time.strftime("%H:%M")
+    args = batch_record_to_args(record, geocode)
+    args.stars = api_choice(stars, 'stars', ('major', 'all'))
+    return build_chart_json(create_natal_subject(args), args)
+
+
+def transits(slug, when=None, cache=False):
+    """
+    Compute a transit snapshot for a saved profile.
+
+    Args:
+        slug: Profile slug
+        when: None for the current moment, a date (or 'YYYY-MM-DD') for UTC noon
+              of that day as with --query-date, or a datetime for that exact
+              moment (naive datetimes are taken as UTC)
+        cache: Use the snapshot cache (dates only)
+
+    Returns:
+        dict: Transit snapshot from build_transit_json()
+
+    Raises:
+        FileNotFoundError: If the profile does not exist
+        ValueError: If the profile cannot be read or the date is invalid
+    """
+    if isinstance(when, datetime):
+        # An exact moment: not a --query-date query, so never cached
+        query_dt = when.astimezone(timezone.utc) if when.tzinfo else when
+        api_date(query_dt, 'when')
+        return profile_transits(slug, query_dt, query_dt.strftime("%Y-%m-%d"))
+    args = query_namespace(transits=[slug], query_date=api_date(when, 'when'))
+    return run_query('transits', slug, compute_transits, args, cache)
+
+
+def timeline(slug, start=None, end=None, preset='30d', houses=False, cache=False):
+    """
+    Compute a transit timeline (exact transit-to-natal aspect hits) for a saved profile.
+
+    Args:
+        slug: Profile slug
+        start: First day (date or 'YYYY-MM-DD'; with end)
+        end: Last day (date or 'YYYY-MM-DD'; with start)
+        preset: 'week', '30d', '3m' or 'year' from today, when start/end are not given
+        houses: Add natal house placements and house ingresses (as --houses)
+        cache: Use the snapshot cache
+
+    Returns:
+        dict: Timeline JSON from build_timeline_json()
+
+    Raises:
+        FileNotFoundError: If the profile does not exist
+        ValueError: If the profile cannot be read or the range is invalid
+    """
+    args = query_namespace(
+        timeline=[slug], start=api_date(start, 'start'), end=api_date(end, 'end'),
+        range=api_choice(preset, 'preset', ('week', '30d', '3m', 'year')), houses=bool(houses),
+    )
+    return run_query('timeline', slug, compute_timeline, args, cache)
+
+
+def progressions(slug, target_date=None, age=None, prog_year=None, moon_years=None,
+                 prog_range=None, step=None, cache=False):
+    """
+    Compute secondary progressions for a saved profile.
+
+    Args:
+        slug: Profile slug
+        target_date: Date to progress to (date or 'YYYY-MM-DD'; default: today)
+        age: Age in years to progress to (instead of target_date)
+        prog_year: Year of the monthly progressed Moon report
+        moon_years: Years covered by the Moon report (default: 1)
+        prog_range: (start, end) pair of ages (int) or dates for a time series,
+                    as --prog-range
+        step: 'year' or 'month' series step (default: year)
+        cache: Use the snapshot cache
+
+    Returns:
+        dict: Progressions JSON from build_progressed_json() or build_progression_series()
+
+    Raises:
+        FileNotFoundError: If the profile does not exist
+        ValueError: If the profile cannot be read or the options conflict
+    """
+    if prog_range is not None:
+        if len(prog_range) != 2:
+            raise ValueError("prog_range must be a (start, end) pair")
+        if any(isinstance(bound, int) and bound < 0 for bound in prog_range):
+            raise ValueError("prog_range ages must not be negative")
+        prog_range = [('age', bound) if isinstance(bound, int) else ('date', api_date(bound, 'prog_range'))
+                      for bound in prog_range]
+    args = query_namespace(
+        progressions=slug, target_date=api_date(target_date, 'target_date'), age=age,
+        prog_year=prog_year, moon_years=moon_years, prog_range=prog_range,
+        step=api_choice(step, 'step', ('year', 'month')),
+    )
+    return run_query('progressions', slug, compute_progressions, args, cache)
+
+
+def solar_arcs(slug, target_date=None, age=None, method=None, calendar=False, max_age=None, cache=False):
+    """
+    Compute solar arc directions for a saved profile.
+
+    Args:
+        slug: Profile slug
+        target_date: Date to direct to (date or 'YYYY-MM-DD'; default: today)
+        age: Age in years to direct to (instead of target_date)
+        method: 'true' (default) or 'mean' arc
+        calendar: Return every perfection date up to max_age instead (as --arc-calendar)
+        max_age: Last age of the calendar (default: 100)
+        cache: Use the snapshot cache
+
+    Returns:
+        dict: Solar arc JSON from build_solar_arc_json() or build_solar_arc_calendar()
+
+    Raises:
+        FileNotFoundError: If the profile does not exist
+        ValueError: If the profile cannot be read or the options conflict
+    """
+    args = query_namespace(
+        solar_arcs=slug, target_date=api_date(target_date, 'target_date'), age=age,
+        arc_method=api_choice(method, 'method', ('true', 'mean')), arc_calendar=bool(calendar),
+        max_age=max_age,
+    )
+    return run_query('solar_arcs', slug, compute_solar_arcs, args, cache)
+
+
+# --serve request modes: mode -> (compute function, CLI flag, snapshot mode, meta date key)
+SERVE_MODES = {
+    'transits': (compute_transits, '--transits', 'transit', 'query_date'),
+    'timeline': (compute_timeline, '--timeline', 'timeline', 'start_date'),
+    'progressions': (compute_progressions, '--progressions', 'progressions', 'target_date'),
+    'solar_arcs': (compute_solar_arcs, '--solar-arcs', 'solar-arc', 'target_date'),
+}
+
+# --serve request keys passed through to the CLI parser (key -> flag)
+SERVE_OPTIONS = {
+    'query_date': '--query-date',
+    'range': '--range',
+    'start': '--start',
+    'end': '--end',
+    'target_date': '--target-date',
+    'age': '--age',
+    'prog_year': '--prog-year',
+    'moon_years': '--moon-years',
+    'prog_range': '--prog-range',
+    'step': '--step',
+    'arc_method': '--arc-method',
+    'max_age': '--max-age',
+}
+
+# SERVE_OPTIONS keys that take several values (given as a JSON list)
+SERVE_LIST_OPTIONS = ('prog_range',)
+
+# --serve boolean request keys (key -> flag, passed when true)
+SERVE_FLAGS = {
+    'arc_calendar': '--arc-calendar',
+    'no_cache': '--no-cache',
+    'houses': '--houses',
+}
+
+
+def parse_request_argv(parser, argv):
+    """
+    Parse a request's option list without argparse printing usage or exiting.
+
+    Args:
+        parser: argparse.ArgumentParser from build_parser()
+        argv: List of command-line style arguments built from the request
+
+    Returns:
+        argparse.Namespace
+
+    Raises:
+        ValueError: With argparse's message if the options are invalid
+    """
+    def fail(message):
+        raise ValueError(message)
+
+    parser.error = fail
+    try:
+        return parser.parse_args(argv)
+    finally:
+        del parser.error
+
+
+def handle_serve_request(parser, request):
+    """
+    Answer one --serve request.
+
+    Request keys: mode (transits, timeline, progressions, solar_arcs), slug, optional
+    id (echoed back), optional save (bool), any SERVE_FLAGS key (bool), and any
+    SERVE_OPTIONS key with the same value format as the matching CLI flag (e.g.
+    {"query_date": "2024-01-01"}); a list supplies a SERVE_LIST_OPTIONS flag (e.g.
+    {"prog_range": [0, 100]}). Values are bound to their own flag, so a request
+    can never add flags of its own or compute a profile other than its slug.
+
+    Args:
+        parser: argparse.ArgumentParser from build_parser()
+        request: Decoded JSON request (dict)
+
+    Returns:
+        dict: {'id', 'ok', 'result' | 'error', 'cached', 'elapsed_ms'} response
+              ('cached' is true when the result came from the snapshot cache)
+    """
+    started = time.perf_counter()
+    req_id = request.get('id') if isinstance(request, dict) else None
+
+    def respond(**fields):
+        fields['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 2)
+        return {'id': req_id, **fields}
+
+    if not isinstance(request, dict):
+        return respond(ok=False, error="Request must be a JSON object")
+
+    mode = str(request.get('mode', '')).replace('-', '_')
+    if mode not in SERVE_MODES:
+        return respond(ok=False, error=f"Unknown mode '{request.get('mode')}'. Use: {', '.join(SERVE_MODES)}")
+    slug = request.get('slug')
+    if not slug:
+        return respond(ok=False, error="Missing 'slug'")
+    try:
+        slug = check_profile_slug(slug)
+    except ValueError as e:
+        return respond(ok=False, error=str(e))
+
+    unknown = set(request) - set(SERVE_OPTIONS) - set(SERVE_FLAGS) - {'id', 'mode', 'slug', 'save'}
+    if unknown:
+        return respond(ok=False, error=f"Unknown request keys: {', '.join(sorted(unknown))}")
+
+    compute, mode_flag, snapshot_mode, date_key = SERVE_MODES[mode]
+    argv = [mode_flag, slug]
+    for key, flag in SERVE_OPTIONS.items():
+        value = request.get(key)
+        if value is None:
+            continue
+        if not isinstance(value, list):
+            argv.append(f"{flag}={value}")
+        elif key not in SERVE_LIST_OPTIONS:
+            return respond(ok=False, error=f"'{key}' takes a single value, not a list")
+        elif any(str(v).startswith('-') for v in value):
+            return respond(ok=False, error=f"Invalid '{key}' value: {value}")
+        else:
+            argv += [flag] + [str(v) for v in value]
+    for key, flag in SERVE_FLAGS.items():
+        if request.get(key):
+            argv.append(flag)
+
+    try:
+        args = parse_request_argv(parser, argv)
+    except ValueError as e:
+        return respond(ok=False, error=f"Invalid options for mode '{mode}': {e}")
+    # Every SERVE_MODES key is also the dest of its flag
+    if (getattr(args, mode) not in (slug, [slug])
+            or any(getattr(args, other) is not None for other in SERVE_MODES if other != mode)):
+        return respond(ok=False, error=f"Request options must not select a profile other than '{slug}'")
+
+    try:
+        result, cached = cached_compute(mode, slug, compute, args)
+    except (FileNotFoundError, ValueError) as e:
+        return respond(ok=False, error=str(e))
+    except Exception as e:
+        return respond(ok=False, error=f"Error calculating {mode}: {e}")
+
+    response = {'ok': True, 'result': result, 'cached': cached}
+    if result['meta'].get('chart_type') == 'secondary_progressions_series':
+        snapshot_mode, date_key = 'progressions-series', 'start_date'
+    elif result['meta'].get('chart_type') == 'solar_arc_calendar':
+        snapshot_mode, date_key = 'solar-arc-calendar', 'start_date'
+    if request.get('save'):
+        date_str = result['meta'].get(date_key, 'unknown')
+        try:
+            response['snapshot'] = str(save_snapshot(CHARTS_DIR / slug, snapshot_mode, date_str, result))
+        except Exception as e:
+            response['snapshot_error'] = str(e)
+    return respond(**response)
+
+
+def serve(parser, instream=None, outstream=None):
+    """
+    Run the warm worker loop over JSON lines.
+
+    Reads one JSON request per line from stdin and writes one JSON response per
+    line to stdout (flushed per response) until EOF. Imports, Swiss Ephemeris
+    state, loaded profiles and transit subjects stay warm across requests, so a
+    session of many queries pays interpreter and library startup once.
+
+    Args:
+        parser: argparse.ArgumentParser from build_parser()
+        instream: Text stream to read requests from (default: sys.stdin)
+        outstream: Text stream to write responses to (default: sys.stdout)
+
+    Returns:
+        0 when the input stream is exhausted
+    """
+    instream = instream if instream is not None else sys.stdin
+    outstream = outstream if outstream is not None else sys.stdout
+
+    for line in instream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            response = {'id': None, 'ok': False, 'error': f"Invalid JSON: {e}"}
+        else:
+            response = handle_serve_request(parser, request)
+        outstream.write(json.dumps(response, ensure_ascii=False) + "\n")
+        outstream.flush()
+
+    return 0
+
+
+# --http service: URL path segment -> request mode ('natal' plus the SERVE_MODES)
+HTTP_MODES = {
+    'natal': 'natal',
+    'transits': 'transits',
+    'timeline': 'timeline',
+    'progressions': 'progressions',
+    'solar-arcs': 'solar_arcs',
+}
+HTTP_DEFAULT_HOST = '127.0.0.1'
+HTTP_MAX_BODY = 64 * 1024
+HTTP_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+@lru_cache(maxsize=None)
+def shared_parser():
+    """
+    Return this process's argument parser, built once (--http workers and the
+    library API).
+
+    Returns:
+        argparse.ArgumentParser from build_parser()
+    """
+    return build_parser()
+
+
+def warm_http_worker():
+    """
+    Initialise an --http worker process: build the parser and import Kerykeion
+    before the first request arrives instead of during it.
+
+    Workers ignore SIGINT; Ctrl-C stops the service from the parent, which then
+    shuts the pool down.
+    """
+    import signal
+    import kerykeion  # noqa: F401
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    shared_parser()
+
+
+def handle_natal_request(request):
+    """
+    Answer one natal request: a saved profile's chart.json, or a chart computed
+    from birth data without saving a profile.
+
+    Request keys: slug, or the BATCH_FIELDS of a birth record (name, date, time,
+    and city/nation or lat/lng/tz) with an optional geocode (as --geocode).
+
+    Args:
+        request: Decoded request (dict)
+
+    Returns:
+        dict: {'ok', 'result' | 'error', 'cached', 'elapsed_ms'} response, as from
+              handle_serve_request()
+    """
+    started = time.perf_counter()
+
+    def respond(**fields):
+        fields['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 2)
+        return fields
+
+    unknown = set(request) - set(BATCH_FIELDS) - {'mode', 'slug', 'geocode'}
+    if unknown:
+        return respond(ok=False, error=f"Unknown request keys: {', '.join(sorted(unknown))}")
+    try:
+        if request.get('slug'):
+            return respond(ok=True, result=read_profile_chart(check_profile_slug(request['slug'])),
+                           cached=True)
+        args = batch_record_to_args(request, request.get('geocode') or 'auto')
+        chart_dict = build_chart_json(create_natal_subject(args), args)
+    except (OSError, ValueError) as e:
+        return respond(ok=False, error=str(e))
+    except Exception as e:
+        return respond(ok=False, error=f"Error calculating natal chart: {e}")
+    return respond(ok=True, result=chart_dict, cached=False)
+
+
+def http_worker_request(request):
+    """
+    Answer one --http request inside a worker process.
+
+    Args:
+        request: Request dict in --serve format ('mode' selects the calculation)
+
+    Returns:
+        dict: Response from handle_natal_request() or handle_serve_request()
+    """
+    if request['mode'] == 'natal':
+        return handle_natal_request(request)
+    return handle_serve_request(shared_parser(), request)
+
+
+def http_request_params(mode, slug, query, body):
+    """
+    Convert an --http URL query string and JSON body into a --serve style request.
+
+    Query values become strings; only a SERVE_LIST_OPTIONS key may repeat, and
+    becomes a list (e.g. prog_range=0&prog_range=100). SERVE_FLAGS keys are true
+    unless given as 0/false/no. Body keys override query keys.
+
+    Args:
+        mode: Request mode (a HTTP_MODES value)
+        slug: Profile slug from the URL path, or None
+        query: Raw query string
+        body: Decoded JSON body (dict), or None
+
+    Returns:
+        dict: Request for http_worker_request()
+
+    Raises:
+        ValueError: If a single-value key is repeated, or given a list in the body
+    """
+    from urllib.parse import parse_qs
+
+    request = {'mode': mode}
+    for key, values in parse_qs(query, keep_blank_values=True).items():
+        if len(values) > 1 and key not in SERVE_LIST_OPTIONS:
+            raise ValueError(f"Query parameter '{key}' may only be given once")
+        if key in SERVE_FLAGS:
+            request[key] = values[0].lower() not in ('0', 'false', 'no')
+        else:
+            request[key] = values[0] if len(values) == 1 else values
+    for key, value in (body or {}).items():
+        if isinstance(value, list) and key not in SERVE_LIST_OPTIONS:
+            raise ValueError(f"'{key}' takes a single value, not a list")
+    request.update(body or {})
+    if slug:
+        request['slug'] = slug
+    return request
+
+
+class HttpError(Exception):
+    """A malformed or oversized --http request, answered with status and message."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+async def read_http_request(reader):
     """
-    List all existing chart profiles with person names and birth details.
+    Read one HTTP/1.1 request from a stream.
+
+    Args:
+        reader: asyncio.StreamReader of the connection
 
     Returns:
-        0 on success
+        tuple or None: (method, target, headers, body bytes), or None at end of stream
+
+    Raises:
+        HttpError: On a malformed, truncated or oversized request
     """
-    if not CHARTS_DIR.exists():
-        print("No chart profiles found")
-        print(f"(Directory {CHARTS_DIR} does not exist)")
-        return 0
+    import asyncio
 
-    # Get all profile directories, skip hidden files
-    profiles = [
-        d for d in CHARTS_DIR.iterdir()
-        if d.is_dir() and not d.name.startswith('.')
-    ]
+    async def read_line():
+        try:
+            return await reader.readline()
+        except (asyncio.LimitOverrunError, ValueError):
+            # readline() reports a line over the stream limit as ValueError
+            raise HttpError(400, "Request line or header too long")
+
+    request_line = await read_line()
+    if not request_line.strip():
+        return None
+    try:
+        method, target, _version = request_line.decode('latin-1').split()
+    except ValueError:
+        raise HttpError(400, "Malformed request line")
+
+    headers = {}
+    while True:
+        line = await read_line()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _sep, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise HttpError(400, "Invalid Content-Length")
+    if length < 0:
+        raise HttpError(400, "Invalid Content-Length")
+    if length > HTTP_MAX_BODY:
+        raise HttpError(413, f"Request body exceeds {HTTP_MAX_BODY} bytes")
+    try:
+        body = await reader.readexactly(length) if length else b''
+    except asyncio.IncompleteReadError:
+        raise HttpError(400, "Request body is shorter than its Content-Length")
+    return method.upper(), target, headers, body
 
-    if not profiles:
-        print("No chart profiles found")
-        return 0
 
-    print(f"Found {len(profiles)} chart profile(s):\n")
+def http_response_bytes(status, payload, headers=None, keep_alive=True):
+    """
+    Encode a JSON HTTP/1.1 response.
 
-    for profile_dir in sorted(profiles):
-        chart_json = profile_dir / "chart.json"
-        chart_svg = profile_dir / "chart.svg"
+    Args:
+        status: HTTP status code
+        payload: JSON-serialisable response body
+        headers: Optional dict of extra response headers
+        keep_alive: Whether the connection stays open for another request
 
-        # Display profile slug as header
-        print(f"  {profile_dir.name}/")
+    Returns:
+        bytes: Status line, headers and body
+    """
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    lines = [
+        f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}",
+        "Content-Type: application/json; charset=utf-8",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + body
+
+
+def serve_http(host, port, workers=None):
+    """
+    Run the local HTTP service until interrupted.
+
+    Endpoints (JSON responses):
+        GET  /natal/{slug}          saved natal chart
+        POST /natal                 natal chart computed from a JSON birth record
+        GET  /transits/{slug}       transit snapshot (?query_date=...)
+        GET  /timeline/{slug}       transit timeline (?start=...&end=..., ?range=...)
+        GET  /progressions/{slug}   secondary progressions (?target_date=...)
+        GET  /solar-arcs/{slug}     solar arc directions (?target_date=...)
+        GET  /health                worker count, in-flight and coalesced request counts
+
+    Query parameters are the --serve request keys. Calculations run in a pool
+    of warm worker processes, so the event loop only parses and routes. Identical
+    requests that arrive while one is being computed share that single
+    computation (single-flight). Responses carry X-Cache (HIT when served from the
+    snapshot cache), X-Coalesced, and Server-Timing (compute and total ms).
+
+    Args:
+        host: Interface to bind (use 127.0.0.1 for local-only access)
+        port: TCP port (0 picks a free port)
+        workers: Worker process count (default: os.cpu_count())
 
-        # Read chart.json for person details
-        if chart_json.exists():
+    Returns:
+        0 on shutdown
+    """
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor
+    from urllib.parse import urlsplit, unquote
+
+    workers = workers or os.cpu_count() or 1
+    inflight = {}
+    stats = {'requests': 0, 'computed': 0, 'coalesced': 0}
+
+    async def single_flight(request):
+        # Requests are equal when their canonical JSON is; followers await the leader's future
+        key = json.dumps(request, sort_keys=True)
+        future = inflight.get(key)
+        coalesced = future is not None
+        if coalesced:
+            stats['coalesced'] += 1
+        else:
+            stats['computed'] += 1
+            future = asyncio.get_running_loop().run_in_executor(executor, http_worker_request, request)
+            inflight[key] = future
+            future.add_done_callback(lambda _f: inflight.pop(key, None))
+        # shield: a client hanging up must not cancel a computation others are waiting on
+        return await asyncio.shield(future), coalesced
+
+    async def route(method, target, body):
+        url = urlsplit(target)
+        parts = [unquote(p) for p in url.path.split('/') if p]
+        if parts == ['health']:
+            return 200, {'ok': True, 'workers': workers, 'in_flight': len(inflight), **stats}, {}
+        if not parts or parts[0] not in HTTP_MODES or len(parts) > 2:
+            return 404, {'ok': False, 'error': f"Unknown endpoint '{url.path}'"}, {}
+        mode, slug = HTTP_MODES[parts[0]], (parts[1] if len(parts) == 2 else None)
+        if method not in ('GET', 'POST'):
+            return 405, {'ok': False, 'error': f"Method {method} not allowed"}, {}
+
+        payload = None
+        if body:
             try:
-                with open(chart_json, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                meta = data.get('meta', {})
-                loc = meta.get('location', {})
-                print(f"    Name:     {meta.get('name', 'Unknown')}")
-                print(f"    Born:     {meta.get('birth_date', '?')} at {meta.get('birth_time', '?')}")
-                city = loc.get('city')
-                nation = loc.get('nation')
-                if city and nation:
-                    print(f"    Location: {city}, {nation}")
-                else:
-                    print(f"    Location: {loc.get('latitude', '?')}, {loc.get('longitude', '?')} ({loc.get('timezone', '?')})")
-            except (json.JSONDecodeError, KeyError):
-                print("    (invalid chart data)")
+                payload = json.loads(body)
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                return 400, {'ok': False, 'error': f"Invalid JSON body: {e}"}, {}
+            if not isinstance(payload, dict):
+                return 400, {'ok': False, 'error': "Request body must be a JSON object"}, {}
+        if slug is None and mode != 'natal':
+            return 404, {'ok': False, 'error': f"Missing profile slug: /{parts[0]}/{{slug}}"}, {}
+        if slug is not None:
+            try:
+                check_profile_slug(slug)
+            except ValueError as e:
+                return 400, {'ok': False, 'error': str(e)}, {}
+        if slug is not None and profile_stamp(slug) is None:
+            return 404, {'ok': False, 'error': f"Profile '{slug}' not found"}, {}
 
-        # Show file status
-        files = []
-        if chart_json.exists(): files.append("chart.json")
-        if chart_svg.exists(): files.append("chart.svg")
-        print(f"    Files:    {', '.join(files) if files else 'none'}")
-        print()
+        try:
+            request = http_request_params(mode, slug, url.query, payload)
+        except ValueError as e:
+            return 400, {'ok': False, 'error': str(e)}, {}
+        response, coalesced = await single_flight(request)
+        headers = {
+            'X-Cache': 'HIT' if response.get('cached') else 'MISS',
+            'X-Coalesced': '1' if coalesced else '0',
+            'X-Compute-Ms': response['elapsed_ms'],
+        }
+        if not response['ok']:
+            return 400, {'ok': False, 'error': response['error']}, headers
+        if response.get('snapshot_error'):
+            headers['X-Snapshot-Error'] = response['snapshot_error'].replace('\n', ' ')
+        return 200, response['result'], headers
 
+    async def handle_connection(reader, writer):
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    parsed = await read_http_request(reader)
+                except HttpError as e:
+                    writer.write(http_response_bytes(e.status, {'ok': False, 'error': e.message},
+                                                     keep_alive=False))
+                    await writer.drain()
+                    break
+                if parsed is None:
+                    break
+                method, target, headers, body = parsed
+                stats['requests'] += 1
+                try:
+                    status, payload, extra = await route(method, target, body)
+                except Exception as e:
+                    status, payload, extra = 500, {'ok': False, 'error': f"Internal error: {e}"}, {}
+                total_ms = round((time.perf_counter() - started) * 1000, 2)
+                extra['Server-Timing'] = (f"compute;dur={extra['X-Compute-Ms']}, total;dur={total_ms}"
+                                          if 'X-Compute-Ms' in extra else f"total;dur={total_ms}")
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                writer.write(http_response_bytes(status, payload, extra, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def run():
+        server = await asyncio.start_server(handle_connection, host, port)
+        bound = server.sockets[0].getsockname()[:2]
+        print(f"Serving on http://{bound[0]}:{bound[1]} ({workers} worker{'s' if workers != 1 else ''})",
+              file=sys.stderr, flush=True)
+        async with server:
+            await server.serve_forever()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm_http_worker) as executor:
+        try:
+            asyncio.run(run())
+        except KeyboardInterrupt:
+            pass
     return 0
 
 
-def main():
+def build_parser():
     """
-    Main entry point for the astrology calculation CLI.
+    Build the command-line argument parser.
+
+    Shared by main() and the --serve worker, which parses each JSON request
+    through the same parser so options validate exactly as on the command line.
 
     Returns:
-        0 on success, 1 on error
+        argparse.ArgumentParser
     """
     parser = argparse.ArgumentParser(
         description="Generate astrological birth chart data",
@@ -1836,7 +7508,32 @@ Examples:
     parser.add_argument(
         "--nation",
         type=str,
-        help="Nation code for GeoNames online lookup (e.g., 'US', 'GB', 'FR')"
+        help="Nation code for GeoNames online lookup (e.g., 'US', 'GB', 'FR'); also filters --find-place"
+    )
+
+    parser.add_argument(
+        "--geocode",
+        choices=GEOCODE_MODES,
+        default="auto",
+        help="--city/--nation resolution: local geocoding database first, GeoNames for unknown "
+             "places (auto, default), local only (offline) or always GeoNames (online)"
+    )
+
+    parser.add_argument(
+        "--load-gazetteer",
+        dest="load_gazetteer",
+        metavar="FILE",
+        type=Path,
+        help="Load a GeoNames dump (e.g. cities15000.txt or .zip) or a name,nation,lat,lng,tz CSV "
+             "into the local geocoding database, replacing the previous gazetteer"
+    )
+
+    parser.add_argument(
+        "--find-place",
+        dest="find_place",
+        metavar="QUERY",
+        help="Search the local geocoding database by name prefix, with fuzzy matching for typos "
+             "(filter with --nation, cap with --limit)"
     )
 
     parser.add_argument(
@@ -1863,22 +7560,128 @@ Examples:
         help="List all existing chart profiles"
     )
 
+    parser.add_argument(
+        "--name-prefix",
+        dest="name_prefix",
+        metavar="PREFIX",
+        help="With --list, only profiles whose name starts with PREFIX (case-insensitive)"
+    )
+
+    parser.add_argument(
+        "--born-from",
+        type=valid_date,
+        dest="born_from",
+        metavar="YYYY-MM-DD",
+        help="With --list, only profiles born on or after this date"
+    )
+
+    parser.add_argument(
+        "--born-to",
+        type=valid_date,
+        dest="born_to",
+        metavar="YYYY-MM-DD",
+        help="With --list, only profiles born on or before this date"
+    )
+
+    parser.add_argument(
+        "--location",
+        help="With --list, only profiles whose city or nation contains this text (case-insensitive)"
+    )
+
+    parser.add_argument(
+        "--sun",
+        type=valid_sign,
+        help="With --list, only profiles with the Sun in this sign (e.g. Leo)"
+    )
+
+    parser.add_argument(
+        "--moon",
+        type=valid_sign,
+        help="With --list, only profiles with the Moon in this sign"
+    )
+
+    parser.add_argument(
+        "--asc",
+        type=valid_sign,
+        help="With --list, only profiles with the Ascendant in this sign"
+    )
+
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="With --list, print at most this many profiles (pagination); with --find-place, "
+             "at most this many places (default: 10)"
+    )
+
+    parser.add_argument(
+        "--offset",
+        type=int,
+        default=0,
+        help="With --list, skip this many matching profiles (pagination)"
+    )
+
+    parser.add_argument(
+        "--reindex",
+        action="store_true",
+        help="With --list, rebuild the profile index from every chart.json first"
+    )
+
+    parser.add_argument(
+        "--store",
+        choices=STORE_BACKENDS,
+        default=_STORE_STATE['backend'] if _STORE_STATE['backend'] in STORE_BACKENDS else 'files',
+        help="Where profiles and snapshots are kept: 'files' (CHARTS_DIR/{slug}/*.json, default) "
+             f"or 'sqlite' ({STORE_PATH}); default from NATAL_CHARTS_STORE"
+    )
+
+    parser.add_argument(
+        "--store-import",
+        action="store_true",
+        dest="store_import",
+        help="Copy every CHARTS_DIR profile and snapshot into the SQLite store"
+    )
+
+    parser.add_argument(
+        "--store-export",
+        action="store_true",
+        dest="store_export",
+        help="Write every profile and snapshot in the SQLite store back to CHARTS_DIR files"
+    )
+
     parser.add_argument(
         "--force",
         action="store_true",
         help="Overwrite existing profile without confirmation"
     )
 
+    parser.add_argument(
+        "--stars",
+        choices=["major", "all"],
+        default="major",
+        help="Fixed stars checked for conjunctions: the 13 major stars (default) "
+             "or the full Swiss Ephemeris catalog"
+    )
+
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print a per-section timing breakdown to stderr"
+    )
+
     parser.add_argument(
         '--save',
         action='store_true',
-        help='Save snapshot to profile directory with date-based filename'
+        help="Archive the snapshot in the profile's compressed snapshot archive (see --snapshots)"
     )
 
     parser.add_argument(
         '--transits',
+        nargs='*',
         metavar='SLUG',
-        help='Calculate transits for an existing chart profile (e.g., albert-einstein)'
+        help='Calculate transits for one or more existing chart profiles (e.g., albert-einstein); '
+             'several profiles share one transit sky, run on --workers processes and print one '
+             'JSON line each'
     )
 
     parser.add_argument(
@@ -1890,8 +7693,26 @@ Examples:
 
     parser.add_argument(
         '--timeline',
+        nargs='*',
         metavar='SLUG',
-        help='Generate transit timeline for an existing chart profile (e.g., albert-einstein)'
+        help='Generate transit timeline for one or more existing chart profiles (e.g., albert-einstein); '
+             'several profiles share one ephemeris pass and print one JSON line each'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='With --timeline, write events as NDJSON while they are found (any range length, flat memory)'
+    )
+    parser.add_argument(
+        '--houses',
+        action='store_true',
+        help='With --timeline, add the natal house of the transit planet to each aspect event '
+             'and report exact transit house ingresses'
+    )
+    parser.add_argument(
+        '--all',
+        action='store_true',
+        help='With --timeline or --transits, include every saved profile'
     )
     parser.add_argument(
         '--range',
@@ -1937,6 +7758,29 @@ Examples:
         dest='prog_year',
         help='Year for monthly progressed Moon report (default: year of target date)'
     )
+    parser.add_argument(
+        '--moon-years',
+        type=int,
+        default=1,
+        dest='moon_years',
+        help='Number of years in the monthly progressed Moon report, starting at --prog-year '
+             '(default: 1; 27 covers a full progressed lunar cycle)'
+    )
+    parser.add_argument(
+        '--prog-range',
+        nargs=2,
+        type=valid_prog_bound,
+        metavar=('START', 'END'),
+        dest='prog_range',
+        help='With --progressions, emit a progression time series from START to END '
+             '(each a whole age in years or a YYYY-MM-DD date)'
+    )
+    parser.add_argument(
+        '--step',
+        choices=list(PROG_SERIES_STEP_DAYS),
+        default='year',
+        help='Step between --prog-range entries (default: year)'
+    )
     parser.add_argument(
         '--solar-arcs',
         metavar='SLUG',
@@ -1950,13 +7794,221 @@ Examples:
         dest='arc_method',
         help='Solar arc calculation method: true (default, actual progressed Sun) or mean (Naibod constant)'
     )
+    parser.add_argument(
+        '--arc-calendar',
+        action='store_true',
+        dest='arc_calendar',
+        help='With --solar-arcs, list every directed-to-natal aspect perfection date up to --max-age'
+    )
+    parser.add_argument(
+        '--max-age',
+        type=int,
+        default=100,
+        dest='max_age',
+        help='Last year of life covered by --arc-calendar (default: 100)'
+    )
+    parser.add_argument(
+        '--batch',
+        metavar='FILE',
+        type=Path,
+        help='Create profiles for every birth record in a CSV or JSONL file '
+             '(fields: name, date, time, and city/nation or lat/lng/tz)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=valid_worker_count,
+        default=None,
+        help='Worker processes for --batch, --render-pending, --build-ephemeris-cache, --http '
+             'and multi-profile --transits (default: CPU count)'
+    )
+    parser.add_argument(
+        '--svg',
+        choices=SVG_MODES,
+        default='sync',
+        help='chart.svg when creating profiles: render now (sync, default), queue for '
+             '--render-pending (defer) or skip (off); an unchanged chart keeps its current chart.svg'
+    )
+    parser.add_argument(
+        '--render-pending',
+        action='store_true',
+        dest='render_pending',
+        help='Render every chart.svg queued by --svg=defer (uses --workers)'
+    )
+    parser.add_argument(
+        '--build-ephemeris-cache',
+        action='store_true',
+        dest='build_ephemeris_cache',
+        help='Precompute the shared 1900-2100 daily ephemeris cache used by timelines (uses --workers)'
+    )
+    parser.add_argument(
+        '--startup-benchmark',
+        nargs='?',
+        const='',
+        metavar='SLUG',
+        dest='startup_benchmark',
+        help='Measure cold-start wall time and -X importtime breakdown for each CLI mode '
+             '(per-profile modes use SLUG, default: first saved profile)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        dest='no_cache',
+        help='Recompute a predictive query instead of reading or writing the snapshot cache'
+    )
+    parser.add_argument(
+        '--cache-stats',
+        action='store_true',
+        dest='cache_stats',
+        help='Show snapshot cache hit rates per mode and its size on disk'
+    )
+    parser.add_argument(
+        '--snapshots',
+        metavar='SLUG',
+        help='List the archived --save runs of a profile with their timestamps'
+    )
+    parser.add_argument(
+        '--snapshot',
+        nargs=2,
+        metavar=('SLUG', 'TIMESTAMP'),
+        help='Print the snapshot an archived run saved (TIMESTAMP: its saved_at, or a unique prefix)'
+    )
+    parser.add_argument(
+        '--compact-snapshots',
+        nargs='*',
+        metavar='SLUG',
+        dest='compact_snapshots',
+        help='Apply the retention policy to the snapshot archives of the given profiles '
+             '(default: all) and fold legacy {mode}-{date}.json files in'
+    )
+    parser.add_argument(
+        '--keep-days',
+        type=valid_retention_count,
+        dest='keep_days',
+        help=f"Snapshot retention: keep every run from this many days "
+             f"(default: {SNAPSHOT_RETENTION_DEFAULTS['keep_days']}, or $NATAL_CHARTS_KEEP_DAYS)"
+    )
+    parser.add_argument(
+        '--keep-per-date',
+        type=valid_retention_count,
+        dest='keep_per_date',
+        help=f"Snapshot retention: older runs kept per mode and date "
+             f"(default: {SNAPSHOT_RETENTION_DEFAULTS['keep_per_date']}, or $NATAL_CHARTS_KEEP_PER_DATE)"
+    )
+    parser.add_argument(
+        '--keep-runs',
+        type=valid_retention_count,
+        dest='keep_runs',
+        help="Snapshot retention: most runs kept per profile (default: 0 = no limit, "
+             "or $NATAL_CHARTS_KEEP_RUNS)"
+    )
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Run as a warm worker: read JSON-lines requests on stdin, write JSON-lines responses to stdout'
+    )
+    parser.add_argument(
+        '--http',
+        type=valid_http_address,
+        metavar='[HOST:]PORT',
+        help=f'Run the local HTTP service (natal, transits, timeline, progressions and solar-arcs '
+             f'endpoints) on a pool of --workers processes (default host: {HTTP_DEFAULT_HOST})'
+    )
+
+    return parser
+
+
+def main():
+    """
+    Main entry point for the astrology calculation CLI.
+
+    Returns:
+        0 on success, 1 on error
+    """
+    parser = build_parser()
 
     try:
         args = parser.parse_args()
+        set_store_backend(args.store)
+
+        # Handle --store-import / --store-export flags
+        if args.store_import or args.store_export:
+            import sqlite3
+            try:
+                if args.store_import:
+                    profiles, snapshots = import_files_to_store()
+                    print(f"Imported {profiles} profile(s) and {snapshots} snapshot(s) into {STORE_PATH}")
+                else:
+                    profiles, snapshots = export_store_to_files()
+                    print(f"Exported {profiles} profile(s) and {snapshots} snapshot(s) to {CHARTS_DIR}")
+            except (OSError, ValueError, sqlite3.Error) as e:
+                print(f"Error: Store {'import' if args.store_import else 'export'} failed: {e}", file=sys.stderr)
+                return 1
+            return 0
+
+        # Snapshot retention options apply to every --save (and --serve workers)
+        for name, env in SNAPSHOT_RETENTION_ENV.items():
+            if getattr(args, name) is not None:
+                os.environ[env] = str(getattr(args, name))
+
+        # Handle --cache-stats flag
+        if args.cache_stats:
+            return cache_stats()
+
+        # Handle snapshot archive flags
+        if args.snapshots:
+            return list_snapshots(args.snapshots)
+        if args.snapshot:
+            return show_snapshot(*args.snapshot)
+        if args.compact_snapshots is not None:
+            return compact_snapshots(args.compact_snapshots)
+
+        # Handle --load-gazetteer / --find-place flags (local geocoding database)
+        if args.load_gazetteer:
+            import sqlite3
+            started = time.perf_counter()
+            try:
+                count = load_gazetteer(args.load_gazetteer)
+            except (OSError, ValueError, sqlite3.Error) as e:
+                print(f"Error: Could not load gazetteer: {e}", file=sys.stderr)
+                return 1
+            print(f"Loaded {count} places into {GEOCODE_DB_PATH} ({time.perf_counter() - started:.1f}s)")
+            return 0
+        if args.find_place:
+            return find_place(args.find_place, args.nation, args.limit)
 
         # Handle --list flag
         if args.list:
-            return list_profiles()
+            return list_profiles(profile_filters(args), limit=args.limit,
+                                 offset=args.offset, reindex=args.reindex)
+
+        # Handle --build-ephemeris-cache flag
+        if args.build_ephemeris_cache:
+            started = time.perf_counter()
+            out_path = build_ephemeris_cache(workers=args.workers)
+            print(f"Ephemeris cache written: {out_path} "
+                  f"({out_path.stat().st_size / 1e6:.1f} MB in {time.perf_counter() - started:.1f}s)")
+            return 0
+
+        # Handle --startup-benchmark flag
+        if args.startup_benchmark is not None:
+            return run_startup_benchmark(args.startup_benchmark or None)
+
+        # Handle --batch flag (many profiles per invocation)
+        if args.batch:
+            return run_batch(args.batch, workers=args.workers, force=args.force, svg=args.svg,
+                             geocode=args.geocode)
+
+        # Handle --render-pending flag (drain the deferred chart.svg queue)
+        if args.render_pending:
+            return render_pending(workers=args.workers)
+
+        # Handle --serve flag (long-lived worker; all other modes are per-request)
+        if args.serve:
+            return serve(parser)
+
+        # Handle --http flag (local HTTP service over a worker pool)
+        if args.http:
+            return serve_http(*args.http, workers=args.workers)
 
         # Handle --solar-arcs flag (MUST come before --progressions, --timeline, --transits)
         if args.solar_arcs:
@@ -1967,11 +8019,11 @@ Examples:
             return calculate_progressions(args)
 
         # Handle --timeline flag (MUST come before --transits and natal validation)
-        if args.timeline:
+        if args.timeline is not None:
             return calculate_timeline(args)
 
         # Handle --transits flag (MUST come before natal validation)
-        if args.transits:
+        if args.transits is not None:
             return calculate_transits(args)
 
         # Validate name is provided for chart generation
@@ -1993,308 +8045,41 @@ Examples:
         if has_geonames and has_coords:
             parser.error("Cannot mix location modes: use either (--city/--nation) or (--lat/--lng/--tz)")
 
+        # Per-section timing breakdown (printed to stderr with --timings)
+        timings = {}
+        t0 = time.perf_counter()
+
+        from kerykeion import KerykeionException
+        from slugify import slugify
+
         # Create AstrologicalSubject based on location mode
+        try:
+            subject = create_natal_subject(args)
+        except KerykeionException as e:
+            if not has_geonames:
+                raise
+            print(f"Error: Unable to resolve location '{args.city}, {args.nation}'", file=sys.stderr)
+            print(f"Details: {e}", file=sys.stderr)
+            print("Tip: Check city spelling and nation code (e.g., 'US', 'GB', 'FR')", file=sys.stderr)
+            return 1
+
         if has_geonames:
-            # GeoNames online mode
-            try:
-                geonames_username = os.getenv('KERYKEION_GEONAMES_USERNAME')
-                kwargs = {
-                    'name': args.name,
-                    'year': args.date.year,
-                    'month': args.date.month,
-                    'day': args.date.day,
-                    'hour': args.time.hour,
-                    'minute': args.time.minute,
-                    'city': args.city,
-                    'nation': args.nation,
-                    'online': True,
-                    'houses_system_identifier': 'P',
-                    'active_points': ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn',
-                                     'Uranus', 'Neptune', 'Pluto', 'Chiron', 'Mean_Lilith', 'True_Lilith',
-                                     'Ceres', 'Pallas', 'Juno', 'Vesta', 'Mean_North_Lunar_Node',
-                                     'Ascendant', 'Medium_Coeli', 'Descendant', 'Imum_Coeli']
-                }
-                if geonames_username:
-                    kwargs['geonames_username'] = geonames_username
-
-                subject = AstrologicalSubjectFactory.from_birth_data(**kwargs)
-
-                # Display resolved location for user verification
-                print(f"Location resolved: {subject.city}, {subject.nation}")
-                print(f"Coordinates: {subject.lat:.4f}, {subject.lng:.4f}")
-                print(f"Timezone: {subject.tz_str}")
-
-            except KerykeionException as e:
-                print(f"Error: Unable to resolve location '{args.city}, {args.nation}'", file=sys.stderr)
-                print(f"Details: {e}", file=sys.stderr)
-                print("Tip: Check city spelling and nation code (e.g., 'US', 'GB', 'FR')", file=sys.stderr)
-                return 1
-        else:
-            # Offline coordinate mode
-            subject = AstrologicalSubjectFactory.from_birth_data(
-                name=args.name,
-                year=args.date.year,
-                month=args.date.month,
-                day=args.date.day,
-                hour=args.time.hour,
-                minute=args.time.minute,
-                lng=args.lng,
-                lat=args.lat,
-                tz_str=args.tz,
-                online=False,
-                houses_system_identifier='P',
-                active_points=['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn',
-                              'Uranus', 'Neptune', 'Pluto', 'Chiron', 'Mean_Lilith', 'True_Lilith',
-                              'Ceres', 'Pallas', 'Juno', 'Vesta', 'Mean_North_Lunar_Node',
-                              'Ascendant', 'Medium_Coeli', 'Descendant', 'Imum_Coeli']
-            )
+            # Display resolved location for user verification
+            print(f"Location resolved: {subject.city}, {subject.nation}")
+            print(f"Coordinates: {subject.lat:.4f}, {subject.lng:.4f}")
+            print(f"Timezone: {subject.tz_str}")
 
         # Verify Placidus house system
         if subject.houses_system_identifier != "P":
             print(f"Warning: Expected Placidus (P), got {subject.houses_system_identifier}", file=sys.stderr)
 
-        # Extract and display all planetary positions
-        print("\n=== PLANETARY POSITIONS ===")
-        planets = [
-            ('Sun', subject.sun), ('Moon', subject.moon),
-            ('Mercury', subject.mercury), ('Venus', subject.venus),
-            ('Mars', subject.mars), ('Jupiter', subject.jupiter),
-            ('Saturn', subject.saturn), ('Uranus', subject.uranus),
-            ('Neptune', subject.neptune), ('Pluto', subject.pluto),
-        ]
-        for name, planet in planets:
-            retrograde = " (R)" if getattr(planet, 'retrograde', False) else ""
-            # Calculate position within sign (0-30 degrees)
-            position_in_sign = planet.position % 30
-            print(f"{name:10} {planet.sign:3} {position_in_sign:6.2f}° House {planet.house}{retrograde}")
-
-        # Extract and display all house cusps
-        print("\n=== HOUSE CUSPS (Placidus) ===")
-        houses = [
-            subject.first_house, subject.second_house, subject.third_house,
-            subject.fourth_house, subject.fifth_house, subject.sixth_house,
-            subject.seventh_house, subject.eighth_house, subject.ninth_house,
-            subject.tenth_house, subject.eleventh_house, subject.twelfth_house,
-        ]
-        for i, house in enumerate(houses, 1):
-            position_in_sign = house.position % 30
-            print(f"House {i:2}   {house.sign:3} {position_in_sign:6.2f}°")
-
-        # Extract and display all angles
-        print("\n=== ANGLES ===")
-        angles = [
-            ('ASC', subject.ascendant),
-            ('MC', subject.medium_coeli),
-            ('DSC', subject.descendant),
-            ('IC', subject.imum_coeli),
-        ]
-        for name, angle in angles:
-            position_in_sign = angle.position % 30
-            print(f"{name:3}        {angle.sign:3} {position_in_sign:6.2f}°")
-
-        # Calculate and display major aspects
-        print("\n=== MAJOR ASPECTS ===")
-        natal_aspects = NatalAspects(subject)
-        major_types = ['conjunction', 'opposition', 'trine', 'square', 'sextile']
-        # Filter for major aspects between the 10 main planets only
-        planet_names = ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto']
-        filtered = [
-            asp for asp in natal_aspects.all_aspects
-            if asp.aspect in major_types
-            and asp.p1_name in planet_names
-            and asp.p2_name in planet_names
-        ]
-        print(f"Found {len(filtered)} major aspects:")
-        for asp in filtered:
-            # Format aspect movement status
-            movement = asp.aspect_movement if hasattr(asp, 'aspect_movement') else ''
-            print(f"{asp.p1_name:10} {asp.aspect:12} {asp.p2_name:10} (orb: {asp.orbit:.2f}°, {movement})")
-
-        # Extract and display asteroid positions
-        print("\n=== ASTEROIDS ===")
-        asteroid_attrs = [
-            ('Chiron', 'chiron'),
-            ('Mean Lilith', 'mean_lilith'),
-            ('True Lilith', 'true_lilith'),
-            ('Ceres', 'ceres'),
-            ('Pallas', 'pallas'),
-            ('Juno', 'juno'),
-            ('Vesta', 'vesta'),
-        ]
-        for name, attr in asteroid_attrs:
-            body = getattr(subject, attr, None)
-            if body is not None:
-                retrograde = " (R)" if getattr(body, 'retrograde', False) else ""
-                # Calculate position within sign (0-30 degrees)
-                position_in_sign = body.position % 30
-                print(f"{name:12} {body.sign:3} {position_in_sign:6.2f}° House {body.house}{retrograde}")
-            else:
-                print(f"{name:12} Not available")
-
-        # Calculate and display Arabic Parts
-        print("\n=== ARABIC PARTS ===")
-
-        # Determine day/night chart based on Sun's house position
-        # Day chart: Sun in houses 7-12 (above horizon)
-        # Night chart: Sun in houses 1-6 (below horizon)
-        sun_house_str = str(subject.sun.house)
-        # Extract house number from string like "Ninth_House" or just "9"
-        house_names = {
-            'First_House': 1, 'Second_House': 2, 'Third_House': 3, 'Fourth_House': 4,
-            'Fifth_House': 5, 'Sixth_House': 6, 'Seventh_House': 7, 'Eighth_House': 8,
-            'Ninth_House': 9, 'Tenth_House': 10, 'Eleventh_House': 11, 'Twelfth_House': 12
-        }
-        sun_house = house_names.get(sun_house_str, int(sun_house_str) if sun_house_str.isdigit() else 1)
-        is_day_chart = 7 <= sun_house <= 12
-
-        # Get absolute positions
-        asc_pos = subject.ascendant.position
-        sun_pos = subject.sun.position
-        moon_pos = subject.moon.position
-
-        # Calculate Part of Fortune
-        if is_day_chart:
-            # Day formula: ASC + Moon - Sun
-            fortune_pos = (asc_pos + moon_pos - sun_pos) % 360
-        else:
-            # Night formula: ASC + Sun - Moon
-            fortune_pos = (asc_pos + sun_pos - moon_pos) % 360
-
-        # Calculate Part of Spirit (reverse of Fortune)
-        if is_day_chart:
-            # Day formula: ASC + Sun - Moon
-            spirit_pos = (asc_pos + sun_pos - moon_pos) % 360
-        else:
-            # Night formula: ASC + Moon - Sun
-            spirit_pos = (asc_pos + moon_pos - sun_pos) % 360
-
-        # Convert to sign and degree
-        fortune_sign, fortune_degree = position_to_sign_degree(fortune_pos)
-        spirit_sign, spirit_degree = position_to_sign_degree(spirit_pos)
-
-        # Display results
-        chart_type = "Day" if is_day_chart else "Night"
-        print(f"Chart Type: {chart_type}")
-        print(f"Part of Fortune:  {fortune_sign} {fortune_degree:6.2f}°")
-        print(f"Part of Spirit:   {spirit_sign} {spirit_degree:6.2f}°")
-
-        # Display essential dignities for traditional planets
-        print("\n=== ESSENTIAL DIGNITIES ===")
-        traditional_planets = [
-            ('Sun', subject.sun),
-            ('Moon', subject.moon),
-            ('Mercury', subject.mercury),
-            ('Venus', subject.venus),
-            ('Mars', subject.mars),
-            ('Jupiter', subject.jupiter),
-            ('Saturn', subject.saturn),
-        ]
-        for name, planet in traditional_planets:
-            dignities = get_planet_dignities(name, planet.sign)
-            dignity_str = ', '.join(dignities) if dignities else 'None'
-            print(f"{name:10} in {planet.sign:3}  {dignity_str}")
-
-        print("\nNote: Traditional planets only (Sun-Saturn). Modern planet dignities (Uranus, Neptune, Pluto) are disputed and excluded.")
+        t0 = _record_timing(timings, 'subject', t0)
 
-        # Calculate and display fixed star conjunctions
-        print("\n=== FIXED STAR CONJUNCTIONS (orb <= 1.0 deg) ===")
-
-        # Set Swiss Ephemeris path to Kerykeion's sweph directory (contains sefstars.txt)
-        kerykeion_path = Path(kerykeion.__file__).parent
-        sweph_path = kerykeion_path / 'sweph'
-        swe.set_ephe_path(str(sweph_path))
-
-        # Calculate Julian day for the birth data
-        jd = swe.julday(args.date.year, args.date.month, args.date.day,
-                        args.time.hour + args.time.minute / 60.0)
-
-        # Build points to check: all 10 planets + 4 angles (use abs_pos for absolute longitude)
-        points_to_check = [(name, p.abs_pos) for name, p in planets] + \
-                          [(name, a.abs_pos) for name, a in angles]
-
-        conjunctions = []
-        for star_lookup, star_display in MAJOR_STARS:
-            try:
-                # Get star position using fixstar2_ut (needs lowercase name)
-                # Returns: (tuple_of_6_floats, star_name, retflags)
-                star_data, returned_name, ret_flag = swe.fixstar2_ut(star_lookup, jd, 0)
-                star_long = star_data[0]  # First element is longitude
-
-                # Check conjunction to each planet and angle
-                for point_name, point_long in points_to_check:
-                    # Calculate absolute difference with zodiac wrap-around handling
-                    diff = abs(point_long - star_long)
-                    if diff > 180:
-                        diff = 360 - diff
-
-                    # Conjunction if within 1 degree orb
-                    if diff <= 1.0:
-                        conjunctions.append((star_display, point_name, diff))
-
-            except Exception as e:
-                # Handle missing stars gracefully (print warning, continue)
-                print(f"Warning: Could not calculate {star_display}: {e}", file=sys.stderr)
-
-        # Display results
-        if conjunctions:
-            for star_name, point_name, orb in conjunctions:
-                print(f"{star_name} conjunct {point_name} (orb: {orb:.2f} deg)")
-        else:
-            print("No major fixed star conjunctions detected")
-
-        # Calculate and display element distribution
-        print("\n=== ELEMENT DISTRIBUTION ===")
-
-        # Collect placements: 10 planets + ASC (11 total)
-        placements = [(name, p) for name, p in planets] + [('ASC', subject.ascendant)]
-
-        # Count elements and track which planets are in each
-        element_count = {'Fire': 0, 'Earth': 0, 'Air': 0, 'Water': 0}
-        element_planets = {'Fire': [], 'Earth': [], 'Air': [], 'Water': []}
-
-        for name, body in placements:
-            element = ELEMENT_MAP.get(body.sign)
-            if element:
-                element_count[element] += 1
-                element_planets[element].append(name)
-
-        # Display total
-        total_placements = sum(element_count.values())
-        print(f"Total placements: {total_placements}")
-
-        # Display each element with count, percentage, and planet names
-        for element in ['Fire', 'Earth', 'Air', 'Water']:
-            count = element_count[element]
-            percentage = (count / total_placements * 100) if total_placements > 0 else 0
-            planets_str = ', '.join(element_planets[element]) if element_planets[element] else 'None'
-            print(f"{element:5} ({count}): {percentage:5.1f}% - {planets_str}")
-
-        # Calculate and display modality distribution
-        print("\n=== MODALITY DISTRIBUTION ===")
-
-        # Count modalities and track which planets are in each
-        modality_count = {'Cardinal': 0, 'Fixed': 0, 'Mutable': 0}
-        modality_planets = {'Cardinal': [], 'Fixed': [], 'Mutable': []}
-
-        for name, body in placements:
-            modality = MODALITY_MAP.get(body.sign)
-            if modality:
-                modality_count[modality] += 1
-                modality_planets[modality].append(name)
-
-        # Display total
-        total_placements = sum(modality_count.values())
-        print(f"Total placements: {total_placements}")
-
-        # Display each modality with count, percentage, and planet names
-        for modality in ['Cardinal', 'Fixed', 'Mutable']:
-            count = modality_count[modality]
-            percentage = (count / total_placements * 100) if total_placements > 0 else 0
-            planets_str = ', '.join(modality_planets[modality]) if modality_planets[modality] else 'None'
-            print(f"{modality:8} ({count}): {percentage:5.1f}% - {planets_str}")
-
-        # Build comprehensive JSON structure
-        chart_dict = build_chart_json(subject, args)
+        # Build the chart model once; console report and chart.json both read from it
+        chart_dict = build_chart_json(subject, args, timings=timings)
+        t0 = time.perf_counter()
+        print_chart_report(chart_dict)
+        t0 = _record_timing(timings, 'report', t0)
 
         # Save to profile directory
         profile_slug = slugify(args.name)
@@ -2305,49 +8090,38 @@ Examples:
             print("Use --force to overwrite existing profile")
             return 1
 
-        # Create directory and save files
-        profile_dir.mkdir(parents=True, exist_ok=True)
-
-        # Write chart.json
-        json_file = profile_dir / "chart.json"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(chart_dict, f, indent=2, ensure_ascii=False)
+        # Create directory and save chart.json + natal model
+        json_file = write_chart_files(profile_dir, subject, chart_dict)
+        t0 = _record_timing(timings, 'json_write', t0)
 
-        # Generate SVG using ChartDrawer
+        # Generate SVG using ChartDrawer (skipped when chart.svg is already current)
+        svg_status = None
         try:
-            # Try ChartDataFactory approach first (5.7.2 API)
-            try:
-                from kerykeion.chart_data_factory import ChartDataFactory
-                chart_data = ChartDataFactory.create_natal_chart_data(subject)
-                drawer = ChartDrawer(chart_data=chart_data)
-                drawer.save_svg(output_path=str(profile_dir), filename="chart", remove_css_variables=True)
-            except (ImportError, AttributeError):
-                # Fall back to direct subject approach
-                drawer = ChartDrawer(subject)
-                drawer.save_svg(output_path=str(profile_dir), filename="chart")
-
-            # Kerykeion may create files with different names - find and rename if needed
-            svg_files = list(profile_dir.glob("chart*.svg"))
-            if svg_files:
-                # If the file isn't exactly "chart.svg", rename it
-                if svg_files[0].name != "chart.svg":
-                    svg_files[0].rename(profile_dir / "chart.svg")
-
-            svg_file = profile_dir / "chart.svg"
-            if not svg_file.exists():
+            svg_status = update_chart_svg(subject, profile_dir, chart_dict, args.svg)
+            if svg_status == 'missing':
                 print(f"Warning: SVG generation may have failed - chart.svg not found", file=sys.stderr)
-
         except Exception as e:
             print(f"Warning: SVG generation failed: {e}", file=sys.stderr)
+        t0 = _record_timing(timings, 'svg', t0)
+
+        index_profile(profile_dir, chart_dict)
+        _record_timing(timings, 'index', t0)
 
         # Print confirmation
         print(f"\n=== CHART SAVED ===")
         print(f"Profile: {args.name}")
         print(f"Location: {profile_dir.absolute()}")
-        if json_file.exists():
+        if json_file is None:
+            print(f"  - chart.json (in {STORE_PATH})")
+        elif json_file.exists():
             print(f"  - chart.json ({json_file.stat().st_size} bytes)")
         if (profile_dir / "chart.svg").exists():
             print(f"  - chart.svg ({(profile_dir / 'chart.svg').stat().st_size} bytes)")
+        elif svg_status == 'queued':
+            print("  - chart.svg (queued, run --render-pending)")
+
+        if args.timings:
+            print_timings(timings)
 
         return 0
 